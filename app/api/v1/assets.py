@@ -8,9 +8,9 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.dependencies import get_current_active_user, get_db
+from app.dependencies import get_current_active_user, get_db, get_market_data_service
+from app.services.market_data_service import MarketDataService
 from infrastructure.database.repositories.asset_repository import AssetRepository
-from infrastructure.external.data_providers.yahoo_finance import YahooFinanceProvider
 
 router = APIRouter()
 
@@ -101,6 +101,7 @@ async def get_asset(
 async def get_asset_price(
     asset_id: UUID,
     db: AsyncSession = Depends(get_db),
+    market_data: MarketDataService = Depends(get_market_data_service),
 ) -> Any:
     """Get current asset price"""
     asset_repo = AssetRepository(db)
@@ -112,9 +113,8 @@ async def get_asset_price(
             detail="Asset not found",
         )
     
-    # Fetch real-time price
-    yahoo = YahooFinanceProvider()
-    price_data = await yahoo.get_current_price(asset.symbol)
+    # Fetch real-time price (uncached) from the shared provider
+    price_data = await market_data.yahoo.get_current_price(asset.symbol)
     
     return {
         "asset_id": asset.id,
@@ -133,6 +133,7 @@ async def get_asset_history(
     period: str = "1y",
     interval: str = "1d",
     db: AsyncSession = Depends(get_db),
+    market_data: MarketDataService = Depends(get_market_data_service),
 ) -> Any:
     """Get asset price history"""
     asset_repo = AssetRepository(db)
@@ -144,8 +145,7 @@ async def get_asset_history(
             detail="Asset not found",
         )
     
-    yahoo = YahooFinanceProvider()
-    history = await yahoo.get_history(
+    history = await market_data.yahoo.get_history(
         symbol=asset.symbol,
         period=period,
         interval=interval,
@@ -61,7 +61,7 @@ async def login(
     user_repo = UserRepository(db)
     user = await user_repo.get_by_email(form_data.username)
     
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
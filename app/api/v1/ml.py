@@ -2,25 +2,44 @@
 Machine Learning endpoints
 """
 
+from functools import lru_cache
 from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import Settings, get_settings
-from app.dependencies import get_current_active_user, get_db
+from app.config import get_settings
+from app.dependencies import get_current_active_user, get_db, get_market_data_service
+from app.schemas.ml import PredictionOut
+from app.services.market_data_service import MarketDataService
+from infrastructure.database.repositories.asset_repository import AssetRepository
+from infrastructure.message_queue.celery_tasks import train_model_task
+from ml.features.feature_engineering import FeatureEngineer
 from ml.inference.predictor import MLPredictor
 
 router = APIRouter()
 
+_ML_ENABLED = get_settings().ENABLE_ML_PREDICTIONS
+
+
+def reload_flags() -> None:
+    """Re-read feature flags from the environment (e.g. on SIGHUP)"""
+    global _ML_ENABLED
+    get_settings.cache_clear()
+    _ML_ENABLED = get_settings().ENABLE_ML_PREDICTIONS
+
+
+@lru_cache(maxsize=8)
+def _predictor(model_id: str) -> MLPredictor:
+    """Shared predictor per model, so weights are loaded once per process"""
+    return MLPredictor(model_id=model_id)
+
 
 @router.get("/models", response_model=List[dict])
-async def list_models(
-    settings: Settings = Depends(get_settings),
-) -> Any:
+async def list_models() -> Any:
     """List available ML models"""
-    if not settings.ENABLE_ML_PREDICTIONS:
+    if not _ML_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ML predictions are disabled",
@@ -51,24 +70,22 @@ async def list_models(
     ]
 
 
-@router.post("/predict", response_model=dict)
+@router.post("/predict", response_model=PredictionOut)
 async def predict(
     asset_id: UUID,
     model_id: str = "lstm-v1",
     horizon_days: int = 5,
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
+    market_data: MarketDataService = Depends(get_market_data_service),
 ) -> Any:
     """Get ML prediction for asset"""
-    if not settings.ENABLE_ML_PREDICTIONS:
+    if not _ML_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ML predictions are disabled",
         )
     
-    from infrastructure.database.repositories.asset_repository import AssetRepository
-    
     asset_repo = AssetRepository(db)
     asset = await asset_repo.get_by_id(asset_id)
     
@@ -78,10 +95,11 @@ async def predict(
             detail="Asset not found",
         )
     
-    predictor = MLPredictor(model_id=model_id)
+    predictor = _predictor(model_id)
     prediction = await predictor.predict(
         symbol=asset.symbol,
         horizon_days=horizon_days,
+        market_data=market_data,
     )
     
     return {
@@ -105,23 +123,20 @@ async def train_model(
     start_date: str,
     end_date: str,
     current_user: dict = Depends(get_current_active_user),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Trigger model training (async)"""
-    if not settings.ENABLE_ML_PREDICTIONS:
+    if not _ML_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ML predictions are disabled",
         )
     
-    from infrastructure.message_queue.celery_tasks import train_model_task
-    
     task = train_model_task.delay(
         model_id=model_id,
         asset_ids=[str(aid) for aid in asset_ids],
         start_date=start_date,
         end_date=end_date,
-        user_id=current_user["id"],
+        user_id=str(current_user["id"]),
     )
     
     return {
@@ -136,17 +151,14 @@ async def get_ml_sentiment(
     asset_id: UUID,
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Get ML-based sentiment analysis combining price and news"""
-    if not settings.ENABLE_ML_PREDICTIONS:
+    if not _ML_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="ML predictions are disabled",
         )
     
-    from ml.features.feature_engineering import FeatureEngineer
-    
     engineer = FeatureEngineer()
     sentiment = await engineer.get_combined_sentiment(asset_id)
     
@@ -2,39 +2,78 @@
 NLP and sentiment analysis endpoints
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import Settings, get_settings
+from app.config import get_settings
 from app.dependencies import get_current_active_user, get_db
+from app.schemas.nlp import AssetSentimentOut, SentimentOut
+from infrastructure.database.repositories.asset_repository import AssetRepository
+from nlp.aggregation import aggregate_sentiment
+from nlp.entity_extractor import EntityExtractor
+from nlp.scrapers.news_scraper import NewsScraper
 from nlp.sentiment_analyzer import SentimentAnalyzer
+from nlp.summarizer import TextSummarizer
 
 router = APIRouter()
 
+_NLP_ENABLED = get_settings().ENABLE_NLP_SENTIMENT
 
-@router.post("/analyze", response_model=dict)
+
+def reload_flags() -> None:
+    """Re-read feature flags from the environment (e.g. on SIGHUP)"""
+    global _NLP_ENABLED
+    get_settings.cache_clear()
+    _NLP_ENABLED = get_settings().ENABLE_NLP_SENTIMENT
+
+
+def _truncate(text: str, limit: int = 200) -> str:
+    """Truncate text for echoing back in responses"""
+    return text if len(text) <= limit else f"{text[:limit]}…"
+
+
+@lru_cache(maxsize=None)
+def _summarizer() -> TextSummarizer:
+    """Shared summarizer, so the model is loaded once per process"""
+    return TextSummarizer()
+
+
+@lru_cache(maxsize=None)
+def _entity_extractor() -> EntityExtractor:
+    """Shared entity extractor, so the spaCy pipeline is loaded once per process"""
+    return EntityExtractor()
+
+
+@router.post("/analyze", response_model=SentimentOut)
 async def analyze_text(
     text: str,
     language: str = "auto",  # auto, pt, en
     model: str = "finbert",  # finbert, bertimbau
     current_user: dict = Depends(get_current_active_user),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Analyze sentiment of text"""
-    if not settings.ENABLE_NLP_SENTIMENT:
+    if not _NLP_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="NLP sentiment analysis is disabled",
         )
     
-    analyzer = SentimentAnalyzer(model_name=model)
+    if model not in SentimentAnalyzer.SUPPORTED_MODELS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unsupported model: {model}",
+        )
+    
+    analyzer = await SentimentAnalyzer.get_warm(model)
     result = await analyzer.analyze(text, language=language)
     
     return {
-        "text": text[:200] + "..." if len(text) > 200 else text,
+        "text": _truncate(text),
         "language": result["language"],
         "model": model,
         "sentiment": result["sentiment"],  # positive, negative, neutral
@@ -44,23 +83,20 @@ async def analyze_text(
     }
 
 
-@router.get("/asset-sentiment/{asset_id}", response_model=dict)
+@router.get("/asset-sentiment/{asset_id}", response_model=AssetSentimentOut)
 async def get_asset_sentiment(
     asset_id: UUID,
     days: int = 7,
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Get aggregated sentiment for asset from news"""
-    if not settings.ENABLE_NLP_SENTIMENT:
+    if not _NLP_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="NLP sentiment analysis is disabled",
         )
     
-    from infrastructure.database.repositories.asset_repository import AssetRepository
-    
     asset_repo = AssetRepository(db)
     asset = await asset_repo.get_by_id(asset_id)
     
@@ -70,12 +106,13 @@ async def get_asset_sentiment(
             detail="Asset not found",
         )
     
-    from nlp.scrapers.news_scraper import NewsScraper
-    
+    # Overlap the news scrape with the (possibly cold) model load
     scraper = NewsScraper()
-    articles = await scraper.get_news_for_asset(asset.symbol, days=days)
+    articles, analyzer = await asyncio.gather(
+        scraper.get_news_for_asset(asset.symbol, days=days),
+        SentimentAnalyzer.get_warm(),
+    )
     
-    analyzer = SentimentAnalyzer()
     sentiments = []
     
     for article in articles:
@@ -89,23 +126,11 @@ async def get_asset_sentiment(
         })
     
     # Aggregate
-    positive = sum(1 for s in sentiments if s["sentiment"] == "positive")
-    negative = sum(1 for s in sentiments if s["sentiment"] == "negative")
-    neutral = sum(1 for s in sentiments if s["sentiment"] == "neutral")
+    positive, neutral, negative, score, overall = aggregate_sentiment(
+        [s["sentiment"] for s in sentiments]
+    )
     total = len(sentiments)
     
-    if total == 0:
-        overall = "neutral"
-        score = 0.5
-    else:
-        score = (positive * 1 + neutral * 0.5) / total
-        if score > 0.6:
-            overall = "positive"
-        elif score < 0.4:
-            overall = "negative"
-        else:
-            overall = "neutral"
-    
     return {
         "asset_id": asset_id,
         "asset_symbol": asset.symbol,
@@ -128,25 +153,24 @@ async def summarize_text(
     text: str,
     max_length: int = 150,
     current_user: dict = Depends(get_current_active_user),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Summarize financial text"""
-    if not settings.ENABLE_NLP_SENTIMENT:
+    if not _NLP_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="NLP is disabled",
         )
     
-    from nlp.summarizer import TextSummarizer
-    
-    summarizer = TextSummarizer()
+    summarizer = _summarizer()
     summary = await summarizer.summarize(text, max_length=max_length)
+    text_length = len(text)
+    summary_length = len(summary)
     
     return {
-        "original_length": len(text),
-        "summary_length": len(summary),
+        "original_length": text_length,
+        "summary_length": summary_length,
         "summary": summary,
-        "compression_ratio": round(len(summary) / len(text) * 100, 1),
+        "compression_ratio": round(summary_length / text_length * 100, 1),
     }
 
 
@@ -154,22 +178,19 @@ async def summarize_text(
 async def extract_entities(
     text: str,
     current_user: dict = Depends(get_current_active_user),
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Extract financial entities from text"""
-    if not settings.ENABLE_NLP_SENTIMENT:
+    if not _NLP_ENABLED:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="NLP is disabled",
         )
     
-    from nlp.entity_extractor import EntityExtractor
-    
-    extractor = EntityExtractor()
+    extractor = _entity_extractor()
     entities = await extractor.extract(text)
     
     return {
-        "text": text[:200] + "..." if len(text) > 200 else text,
+        "text": _truncate(text),
         "entities": entities,
         "categories": list(set(e["type"] for e in entities)),
     }
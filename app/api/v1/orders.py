@@ -9,13 +9,14 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_current_active_user, get_db
+from app.schemas.order import OrderOut, OrderSummary
 from infrastructure.database.repositories.portfolio_repository import PortfolioRepository
 from infrastructure.message_queue.celery_tasks import execute_order_task
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[dict])
+@router.get("/", response_model=List[OrderSummary])
 async def list_orders(
     portfolio_id: UUID = None,
     status: str = None,
@@ -31,29 +32,16 @@ async def list_orders(
         # Verify portfolio belongs to user
         portfolio_repo = PortfolioRepository(db)
         portfolio = await portfolio_repo.get_by_id(portfolio_id)
-        if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+        if not portfolio or portfolio.user_id != current_user["id"]:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Portfolio not found",
             )
         orders = await order_repo.get_by_portfolio(portfolio_id, status=status)
     else:
-        orders = await order_repo.get_by_user(UUID(current_user["id"]), status=status)
-    
-    return [
-        {
-            "id": order.id,
-            "portfolio_id": order.portfolio_id,
-            "asset_id": order.asset_id,
-            "order_type": order.order_type,
-            "side": order.side,
-            "quantity": order.quantity,
-            "price": order.price,
-            "status": order.status,
-            "created_at": order.created_at,
-        }
-        for order in orders
-    ]
+        orders = await order_repo.get_by_user(current_user["id"], status=status)
+    
+    return orders
 
 
 @router.post("/", response_model=dict)
@@ -72,7 +60,7 @@ async def create_order(
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
@@ -102,7 +90,7 @@ async def create_order(
     }
 
 
-@router.get("/{order_id}", response_model=dict)
+@router.get("/{order_id}", response_model=OrderOut)
 async def get_order(
     order_id: UUID,
     current_user: dict = Depends(get_current_active_user),
@@ -123,26 +111,13 @@ async def get_order(
     # Verify ownership
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(order.portfolio_id)
-    if portfolio.user_id != UUID(current_user["id"]):
+    if portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to view this order",
         )
     
-    return {
-        "id": order.id,
-        "portfolio_id": order.portfolio_id,
-        "asset_id": order.asset_id,
-        "order_type": order.order_type,
-        "side": order.side,
-        "quantity": order.quantity,
-        "price": order.price,
-        "filled_quantity": order.filled_quantity,
-        "avg_fill_price": order.avg_fill_price,
-        "status": order.status,
-        "created_at": order.created_at,
-        "updated_at": order.updated_at,
-    }
+    return order
 
 
 @router.delete("/{order_id}", response_model=dict)
@@ -172,7 +147,7 @@ async def cancel_order(
     # Verify ownership
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(order.portfolio_id)
-    if portfolio.user_id != UUID(current_user["id"]):
+    if portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not authorized to cancel this order",
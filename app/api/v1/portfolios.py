@@ -6,35 +6,45 @@ from typing import Any, List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_current_active_user, get_db
+from app.schemas.portfolio import PortfolioDetail, PortfolioSummary
+from infrastructure.cache.cache_decorator import cached
+from infrastructure.cache.redis_client import RedisCache
 from infrastructure.database.repositories.portfolio_repository import PortfolioRepository
 
 router = APIRouter()
 
+_portfolio_list = TypeAdapter(List[PortfolioSummary])
 
-@router.get("/", response_model=List[dict])
+
+def _portfolios_cache_key(user_id: Any) -> str:
+    """Cache key for a user's portfolio list"""
+    return f"portfolios:{user_id}"
+
+
+async def _invalidate_portfolios(user_id: Any) -> None:
+    """Drop the cached portfolio list after a write"""
+    await RedisCache().delete(_portfolios_cache_key(user_id))
+
+
+@router.get("/", response_model=List[PortfolioSummary])
+@cached(ttl=30, key_builder=lambda **kwargs: _portfolios_cache_key(kwargs["current_user"]["id"]))
 async def list_portfolios(
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """List all portfolios for current user"""
     portfolio_repo = PortfolioRepository(db)
-    portfolios = await portfolio_repo.get_by_user_id(UUID(current_user["id"]))
+    portfolios = await portfolio_repo.get_by_user_id(current_user["id"])
     
-    return [
-        {
-            "id": portfolio.id,
-            "name": portfolio.name,
-            "description": portfolio.description,
-            "total_value": portfolio.total_value,
-            "total_return": portfolio.total_return,
-            "total_return_percent": portfolio.total_return_percent,
-            "created_at": portfolio.created_at,
-        }
-        for portfolio in portfolios
-    ]
+    # Dumped to JSON-native types so the result can be cached in Redis
+    return _portfolio_list.dump_python(
+        _portfolio_list.validate_python(portfolios, from_attributes=True),
+        mode="json",
+    )
 
 
 @router.post("/", response_model=dict)
@@ -49,11 +59,12 @@ async def create_portfolio(
     portfolio_repo = PortfolioRepository(db)
     
     portfolio = await portfolio_repo.create(
-        user_id=UUID(current_user["id"]),
+        user_id=current_user["id"],
         name=name,
         description=description,
         initial_balance=initial_balance,
     )
+    await _invalidate_portfolios(current_user["id"])
     
     return {
         "id": portfolio.id,
@@ -64,7 +75,7 @@ async def create_portfolio(
     }
 
 
-@router.get("/{portfolio_id}", response_model=dict)
+@router.get("/{portfolio_id}", response_model=PortfolioDetail)
 async def get_portfolio(
     portfolio_id: UUID,
     current_user: dict = Depends(get_current_active_user),
@@ -72,36 +83,15 @@ async def get_portfolio(
 ) -> Any:
     """Get portfolio by ID"""
     portfolio_repo = PortfolioRepository(db)
-    portfolio = await portfolio_repo.get_by_id(portfolio_id)
+    portfolio = await portfolio_repo.get_by_id_with_positions(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
         )
     
-    return {
-        "id": portfolio.id,
-        "name": portfolio.name,
-        "description": portfolio.description,
-        "initial_balance": portfolio.initial_balance,
-        "total_value": portfolio.total_value,
-        "total_return": portfolio.total_return,
-        "total_return_percent": portfolio.total_return_percent,
-        "positions": [
-            {
-                "asset_id": pos.asset_id,
-                "asset_symbol": pos.asset_symbol,
-                "quantity": pos.quantity,
-                "avg_price": pos.avg_price,
-                "current_price": pos.current_price,
-                "market_value": pos.market_value,
-                "unrealized_pnl": pos.unrealized_pnl,
-            }
-            for pos in portfolio.positions
-        ],
-        "created_at": portfolio.created_at,
-    }
+    return portfolio
 
 
 @router.put("/{portfolio_id}", response_model=dict)
@@ -116,7 +106,7 @@ async def update_portfolio(
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
@@ -127,6 +117,7 @@ async def update_portfolio(
         name=name,
         description=description,
     )
+    await _invalidate_portfolios(current_user["id"])
     
     return {
         "id": updated.id,
@@ -145,13 +136,14 @@ async def delete_portfolio(
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
         )
     
     await portfolio_repo.delete(portfolio_id)
+    await _invalidate_portfolios(current_user["id"])
     return {"message": "Portfolio deleted successfully"}
 
 
@@ -168,7 +160,7 @@ async def add_position(
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
@@ -180,6 +172,7 @@ async def add_position(
         quantity=quantity,
         price=price,
     )
+    await _invalidate_portfolios(current_user["id"])
     
     return {
         "id": position.id,
@@ -2,20 +2,40 @@
 Quantitative finance endpoints
 """
 
+import asyncio
 from typing import Any, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_current_active_user, get_db
+from infrastructure.cache.redis_client import RedisCache
+from infrastructure.database.repositories.asset_repository import AssetRepository
 from quant.portfolio.markowitz import MarkowitzOptimizer
 from quant.portfolio.black_litterman import BlackLittermanOptimizer
+from quant.portfolio.snowball_simulation import cached_simulation
 from quant.risk.var import VaRCalculator
 
 router = APIRouter()
 
 
+async def _get_symbols_in_order(db: AsyncSession, asset_ids: List[UUID]) -> List[str]:
+    """Resolve asset symbols, preserving request order for weight alignment"""
+    asset_repo = AssetRepository(db)
+    by_id = await asset_repo.get_symbols_by_ids(asset_ids)
+    
+    for asset_id in asset_ids:
+        if asset_id not in by_id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Asset {asset_id} not found",
+            )
+    
+    return [by_id[asset_id] for asset_id in asset_ids]
+
+
 @router.post("/optimize/markowitz", response_model=dict)
 async def optimize_markowitz(
     asset_ids: List[UUID],
@@ -25,23 +45,13 @@ async def optimize_markowitz(
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """Optimize portfolio using Markowitz mean-variance optimization"""
-    from infrastructure.database.repositories.asset_repository import AssetRepository
-    
-    asset_repo = AssetRepository(db)
-    assets = []
-    
-    for asset_id in asset_ids:
-        asset = await asset_repo.get_by_id(asset_id)
-        if not asset:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Asset {asset_id} not found",
-            )
-        assets.append(asset)
+    symbols = await _get_symbols_in_order(db, asset_ids)
     
+    # SciPy solve runs off the event loop
     optimizer = MarkowitzOptimizer()
-    result = optimizer.optimize(
-        symbols=[a.symbol for a in assets],
+    result = await asyncio.to_thread(
+        optimizer.optimize,
+        symbols=symbols,
         target_return=target_return,
         target_risk=target_risk,
     )
@@ -53,7 +63,10 @@ async def optimize_markowitz(
         "expected_risk": result["expected_risk"],
         "sharpe_ratio": result["sharpe_ratio"],
         "frontier": result["efficient_frontier"],
-        "assets": [{"id": a.id, "symbol": a.symbol, "weight": w} for a, w in zip(assets, result["weights"])],
+        "assets": [
+            {"id": asset_id, "symbol": symbol, "weight": w}
+            for asset_id, symbol, w in zip(asset_ids, symbols, result["weights"])
+        ],
     }
 
 
@@ -65,23 +78,12 @@ async def optimize_black_litterman(
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """Optimize using Black-Litterman model with investor views"""
-    from infrastructure.database.repositories.asset_repository import AssetRepository
-    
-    asset_repo = AssetRepository(db)
-    assets = []
-    
-    for asset_id in asset_ids:
-        asset = await asset_repo.get_by_id(asset_id)
-        if not asset:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Asset {asset_id} not found",
-            )
-        assets.append(asset)
+    symbols = await _get_symbols_in_order(db, asset_ids)
     
     optimizer = BlackLittermanOptimizer()
-    result = optimizer.optimize(
-        symbols=[a.symbol for a in assets],
+    result = await asyncio.to_thread(
+        optimizer.optimize,
+        symbols=symbols,
         views=views,
     )
     
@@ -91,7 +93,10 @@ async def optimize_black_litterman(
         "expected_return": result["expected_return"],
         "expected_risk": result["expected_risk"],
         "posterior_returns": result["posterior_returns"],
-        "assets": [{"id": a.id, "symbol": a.symbol, "weight": w} for a, w in zip(assets, result["weights"])],
+        "assets": [
+            {"id": asset_id, "symbol": symbol, "weight": w}
+            for asset_id, symbol, w in zip(asset_ids, symbols, result["weights"])
+        ],
     }
 
 
@@ -108,16 +113,17 @@ async def calculate_var(
     from infrastructure.database.repositories.portfolio_repository import PortfolioRepository
     
     portfolio_repo = PortfolioRepository(db)
-    portfolio = await portfolio_repo.get_by_id(portfolio_id)
+    portfolio = await portfolio_repo.get_by_id_with_positions(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
         )
     
     calculator = VaRCalculator(method=method)
-    var_result = calculator.calculate(
+    var_result = await asyncio.to_thread(
+        calculator.calculate,
         portfolio=portfolio,
         confidence_level=confidence_level,
         time_horizon=time_horizon_days,
@@ -147,16 +153,17 @@ async def calculate_cvar(
     from infrastructure.database.repositories.portfolio_repository import PortfolioRepository
     
     portfolio_repo = PortfolioRepository(db)
-    portfolio = await portfolio_repo.get_by_id(portfolio_id)
+    portfolio = await portfolio_repo.get_by_id_with_positions(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
         )
     
     calculator = CVaRCalculator()
-    cvar_result = calculator.calculate(
+    cvar_result = await asyncio.to_thread(
+        calculator.calculate,
         portfolio=portfolio,
         confidence_level=confidence_level,
     )
@@ -178,30 +185,37 @@ async def snowball_simulation(
     years: int = 20,
     reinvest_dividends: bool = True,
     dividend_yield: float = 0.04,
+    include_monthly: bool = False,
     current_user: dict = Depends(get_current_active_user),
 ) -> Any:
     """Calculate snowball effect (compound growth with contributions)"""
-    from quant.portfolio.snowball_simulation import SnowballSimulator
-    
-    simulator = SnowballSimulator()
-    result = simulator.calculate(
-        initial_investment=initial_investment,
-        monthly_contribution=monthly_contribution,
-        annual_return_rate=annual_return_rate,
-        years=years,
-        reinvest_dividends=reinvest_dividends,
-        dividend_yield=dividend_yield,
+    # Deterministic in its inputs: quantize so equivalent requests share a result
+    params = (
+        round(initial_investment, 6),
+        round(monthly_contribution, 6),
+        round(annual_return_rate, 6),
+        years,
+        reinvest_dividends,
+        round(dividend_yield, 6),
+        include_monthly,
     )
-    
-    return {
-        "initial_investment": initial_investment,
-        "total_contributions": result["total_contributions"],
-        "total_dividends": result["total_dividends"],
-        "final_value": result["final_value"],
-        "total_return": result["total_return"],
-        "total_return_percent": result["total_return_percent"],
-        "years": years,
-        "monthly_breakdown": result["monthly_data"],
-        "milestones": result["milestones"],  # When reached 100k, 500k, 1M, etc.
-  }
-  
+    cache_key = "snowball:" + ":".join(map(str, params))
+    
+    cache = RedisCache()
+    payload = await cache.get_raw(cache_key)
+    if payload is None:
+        result = cached_simulation(*params)
+        payload = orjson.dumps({
+            "initial_investment": params[0],
+            "total_contributions": result.total_contributions,
+            "total_dividends": result.total_dividends,
+            "final_value": result.final_value,
+            "total_return": result.total_return,
+            "total_return_percent": result.total_return_percent,
+            "years": years,
+            "monthly_breakdown": result.monthly_data,
+            "milestones": result.milestones,  # When reached 100k, 500k, 1M, etc.
+        })
+        await cache.set_raw(cache_key, payload, ttl=86400)
+    
+    return Response(content=payload, media_type="application/json")
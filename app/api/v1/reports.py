@@ -2,18 +2,40 @@
 Reporting endpoints
 """
 
-from typing import Any
+import hashlib
+from typing import Any, Dict
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import StreamingResponse
+from cachetools import TTLCache
+from celery import states
+from celery.result import AsyncResult
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_current_active_user, get_db
-from infrastructure.message_queue.celery_tasks import generate_report_task
+from infrastructure.message_queue.celery_tasks import celery_app, generate_report_task
 
 router = APIRouter()
 
+# Task meta per task_id, briefly cached so frontend polling coalesces
+_meta_cache: TTLCache = TTLCache(maxsize=10_000, ttl=0.5)
+
+
+def _get_meta(task_id: str) -> Dict[str, Any]:
+    """Fetch task status/result from the result backend in one call"""
+    meta = _meta_cache.get(task_id)
+    if meta is None:
+        meta = AsyncResult(task_id, app=celery_app).backend.get_task_meta(task_id)
+        _meta_cache[task_id] = meta
+    return meta
+
+
+def _progress(meta: Dict[str, Any]) -> int:
+    """Progress reported by the task via update_state, if any"""
+    info = meta.get("result")
+    return info.get("progress", 0) if isinstance(info, dict) else 0
+
 
 @router.post("/portfolio/{portfolio_id}", response_model=dict)
 async def generate_portfolio_report(
@@ -31,7 +53,7 @@ async def generate_portfolio_report(
     portfolio_repo = PortfolioRepository(db)
     portfolio = await portfolio_repo.get_by_id(portfolio_id)
     
-    if not portfolio or portfolio.user_id != UUID(current_user["id"]):
+    if not portfolio or portfolio.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Portfolio not found",
@@ -40,7 +62,7 @@ async def generate_portfolio_report(
     task = generate_report_task.delay(
         report_type="portfolio",
         entity_id=str(portfolio_id),
-        user_id=current_user["id"],
+        user_id=str(current_user["id"]),
         start_date=start_date,
         end_date=end_date,
         format=format,
@@ -67,7 +89,7 @@ async def generate_backtest_report(
     backtest_repo = BacktestRepository(db)
     backtest = await backtest_repo.get_by_id(backtest_id)
     
-    if not backtest or backtest.user_id != UUID(current_user["id"]):
+    if not backtest or backtest.user_id != current_user["id"]:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Backtest not found",
@@ -76,7 +98,7 @@ async def generate_backtest_report(
     task = generate_report_task.delay(
         report_type="backtest",
         entity_id=str(backtest_id),
-        user_id=current_user["id"],
+        user_id=str(current_user["id"]),
         format=format,
     )
     
@@ -93,53 +115,57 @@ async def download_report(
     current_user: dict = Depends(get_current_active_user),
 ) -> Any:
     """Download generated report"""
-    from celery.result import AsyncResult
+    meta = _get_meta(task_id)
+    task_status = meta["status"]
     
-    task = AsyncResult(task_id)
-    
-    if not task.ready():
+    if task_status not in states.READY_STATES:
         return {
             "task_id": task_id,
-            "status": task.status,
-            "progress": task.info.get("progress", 0) if task.info else 0,
+            "status": task_status,
+            "progress": _progress(meta),
         }
     
-    if task.failed():
+    if task_status != states.SUCCESS:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Report generation failed",
         )
     
-    result = task.result
-    file_path = result.get("file_path")
-    
-    # Return file
-    def iterfile():
-        with open(file_path, "rb") as f:
-            yield from f
+    result = meta["result"]
     
-    return StreamingResponse(
-        iterfile(),
+    # Starlette streams the file off the event loop (sendfile where available)
+    return FileResponse(
+        result.get("file_path"),
         media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={result.get('filename', 'report.pdf')}"},
+        filename=result.get("filename", "report.pdf"),
     )
 
 
 @router.get("/status/{task_id}", response_model=dict)
 async def get_report_status(
     task_id: str,
+    request: Request,
+    response: Response,
     current_user: dict = Depends(get_current_active_user),
 ) -> Any:
     """Check report generation status"""
-    from celery.result import AsyncResult
-    
-    task = AsyncResult(task_id)
+    meta = _get_meta(task_id)
+    task_status = meta["status"]
+    progress = _progress(meta)
+    ready = task_status in states.READY_STATES
+    
+    # Pollers can send If-None-Match and get a bodiless 304 until it changes
+    etag = '"%s"' % hashlib.md5(f"{task_status}:{progress}".encode()).hexdigest()
+    headers = {"Cache-Control": "no-store", "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
     
     return {
         "task_id": task_id,
-        "status": task.status,
-        "progress": task.info.get("progress", 0) if task.info else 0,
-        "ready": task.ready(),
-        "successful": task.successful() if task.ready() else None,
-  }
+        "status": task_status,
+        "progress": progress,
+        "ready": ready,
+        "successful": task_status == states.SUCCESS if ready else None,
+    }
   
@@ -9,19 +9,28 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.dependencies import get_current_active_user, get_db, require_admin
+from app.schemas.user import UserOut, UserSummary
+from infrastructure.cache.cache_decorator import cached
+from infrastructure.cache.redis_client import RedisCache
 from infrastructure.database.repositories.user_repository import UserRepository
 
 router = APIRouter()
 
 
-@router.get("/me", response_model=dict)
+def _user_cache_key(user_id: Any) -> str:
+    """Cache key for a user's /me payload"""
+    return f"users:me:{user_id}"
+
+
+@router.get("/me", response_model=UserOut)
+@cached(ttl=30, key_builder=lambda **kwargs: _user_cache_key(kwargs["current_user"]["id"]))
 async def get_current_user_info(
     current_user: dict = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db),
 ) -> Any:
     """Get current user info"""
     user_repo = UserRepository(db)
-    user = await user_repo.get_by_id(UUID(current_user["id"]))
+    user = await user_repo.get_by_id(current_user["id"])
     
     if not user:
         raise HTTPException(
@@ -29,15 +38,8 @@ async def get_current_user_info(
             detail="User not found",
         )
     
-    return {
-        "id": user.id,
-        "email": user.email,
-        "full_name": user.full_name,
-        "role": user.role,
-        "is_active": user.is_active,
-        "created_at": user.created_at,
-        "updated_at": user.updated_at,
-    }
+    # Dumped to JSON-native types so the result can be cached in Redis
+    return UserOut.model_validate(user).model_dump(mode="json")
 
 
 @router.put("/me", response_model=dict)
@@ -50,10 +52,11 @@ async def update_current_user(
     """Update current user info"""
     user_repo = UserRepository(db)
     user = await user_repo.update(
-        user_id=UUID(current_user["id"]),
+        user_id=current_user["id"],
         full_name=full_name,
         email=email,
     )
+    await RedisCache().delete(_user_cache_key(current_user["id"]))
     
     return {
         "id": user.id,
@@ -63,7 +66,7 @@ async def update_current_user(
     }
 
 
-@router.get("/", response_model=List[dict])
+@router.get("/", response_model=List[UserSummary])
 async def list_users(
     skip: int = 0,
     limit: int = 100,
@@ -74,19 +77,10 @@ async def list_users(
     user_repo = UserRepository(db)
     users = await user_repo.get_all(skip=skip, limit=limit)
     
-    return [
-        {
-            "id": user.id,
-            "email": user.email,
-            "full_name": user.full_name,
-            "role": user.role,
-            "is_active": user.is_active,
-        }
-        for user in users
-    ]
-
-
-@router.get("/{user_id}", response_model=dict)
+    return users
+
+
+@router.get("/{user_id}", response_model=UserOut)
 async def get_user(
     user_id: UUID,
     current_user: dict = Depends(require_admin),
@@ -102,14 +96,7 @@ async def get_user(
             detail="User not found",
         )
     
-    return {
-        "id": user.id,
-        "email": user.email,
-        "full_name": user.full_name,
-        "role": user.role,
-        "is_active": user.is_active,
-        "created_at": user.created_at,
-    }
+    return user
 
 
 @router.delete("/{user_id}", response_model=dict)
@@ -121,5 +108,6 @@ async def delete_user(
     """Delete user (admin only)"""
     user_repo = UserRepository(db)
     await user_repo.delete(user_id)
+    await RedisCache().delete(_user_cache_key(user_id))
     
     return {"message": "User deleted successfully"}
@@ -4,31 +4,42 @@ WebSocket endpoints for real-time data
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect, status
+import msgspec
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, status
 
-from app.config import Settings, get_settings
+from app.config import settings
 from app.dependencies import get_current_user_ws
 from websocket.connection_manager import ConnectionManager
+from websocket.serializers import (
+    Ping,
+    Subscribe,
+    Unsubscribe,
+    client_message_decoder,
+    deserialize_message,
+    receive_raw,
+    send_message,
+)
 
 router = APIRouter()
 manager = ConnectionManager()
 
+ENABLE_REALTIME_WEBSOCKET = settings.ENABLE_REALTIME_WEBSOCKET
+
 
 @router.websocket("/market-data")
 async def market_data_websocket(
     websocket: WebSocket,
     token: str = None,
-    settings: Settings = Depends(get_settings),
 ):
     """WebSocket for real-time market data"""
-    if not settings.ENABLE_REALTIME_WEBSOCKET:
+    if not ENABLE_REALTIME_WEBSOCKET:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
     
     # Authenticate
     if token:
         try:
-            user = await get_current_user_ws(token, settings)
+            user = await get_current_user_ws(token)
             await manager.connect(websocket, user_id=user["id"])
         except Exception:
             await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
@@ -39,23 +50,23 @@ async def market_data_websocket(
     try:
         while True:
             # Receive subscription message
-            data = await websocket.receive_json()
-            action = data.get("action")
+            try:
+                msg = client_message_decoder.decode(await receive_raw(websocket))
+            except msgspec.DecodeError:
+                continue  # malformed or unknown action
             
-            if action == "subscribe":
-                symbols = data.get("symbols", [])
-                await manager.subscribe(websocket, symbols)
-                await websocket.send_json({
+            if type(msg) is Subscribe:
+                await manager.subscribe(websocket, msg.symbols)
+                await send_message(websocket, {
                     "type": "subscribed",
-                    "symbols": symbols,
+                    "symbols": msg.symbols,
                 })
             
-            elif action == "unsubscribe":
-                symbols = data.get("symbols", [])
-                await manager.unsubscribe(websocket, symbols)
+            elif type(msg) is Unsubscribe:
+                await manager.unsubscribe(websocket, msg.symbols)
             
-            elif action == "ping":
-                await websocket.send_json({"type": "pong", "timestamp": data.get("timestamp")})
+            elif type(msg) is Ping:
+                await send_message(websocket, {"type": "pong", "timestamp": msg.timestamp})
     
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
@@ -66,10 +77,9 @@ async def portfolio_websocket(
     websocket: WebSocket,
     portfolio_id: str,
     token: str = None,
-    settings: Settings = Depends(get_settings),
 ):
     """WebSocket for real-time portfolio updates"""
-    if not settings.ENABLE_REALTIME_WEBSOCKET:
+    if not ENABLE_REALTIME_WEBSOCKET:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
     
@@ -79,7 +89,7 @@ async def portfolio_websocket(
         return
     
     try:
-        user = await get_current_user_ws(token, settings)
+        user = await get_current_user_ws(token)
     except Exception:
         await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
         return
@@ -91,9 +101,9 @@ async def portfolio_websocket(
     
     try:
         while True:
-            data = await websocket.receive_json()
+            data = deserialize_message(await websocket.receive_text())
             # Handle portfolio-specific actions
-            await websocket.send_json({"type": "ack", "received": data})
+            await send_message(websocket, {"type": "ack", "received": data})
     
     except WebSocketDisconnect:
         await manager.disconnect(websocket)
@@ -103,7 +113,6 @@ async def portfolio_websocket(
 async def broadcast_message(
     message: dict,
     channel: str = "all",
-    settings: Settings = Depends(get_settings),
 ) -> Any:
     """Admin endpoint to broadcast message to all connected clients"""
     await manager.broadcast(message, channel=channel)
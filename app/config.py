@@ -2,10 +2,10 @@
 Application configuration using Pydantic Settings
 """
 
-from functools import lru_cache
+from functools import cache
 from typing import List, Optional
 
-from pydantic import Field, PostgresDsn, RedisDsn, validator
+from pydantic import Field, PostgresDsn, RedisDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -31,7 +31,8 @@ class Settings(BaseSettings):
     # CORS
     CORS_ORIGINS: List[str] = Field(default=["http://localhost:8501", "http://localhost:3000"])
     
-    @validator("CORS_ORIGINS", pre=True)
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
     def parse_cors_origins(cls, v):
         if isinstance(v, str):
             return [origin.strip() for origin in v.split(",")]
@@ -41,6 +42,7 @@ class Settings(BaseSettings):
     DATABASE_URL: PostgresDsn = Field(...)
     DATABASE_POOL_SIZE: int = Field(default=20)
     DATABASE_MAX_OVERFLOW: int = Field(default=30)
+    DATABASE_TARGET_CONNECTIONS: int = Field(default=40)  # across all API workers
     
     SQLITE_URL: Optional[str] = Field(default=None)
     SQLITE_WAL_MODE: bool = Field(default=True)
@@ -84,7 +86,7 @@ class Settings(BaseSettings):
         return self.ENVIRONMENT == "development"
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Cached settings instance"""
     return Settings()
@@ -2,10 +2,13 @@
 Application lifecycle events
 """
 
+import os
 from typing import Callable
 
+import anyio
 import structlog
 
+from app.config import settings
 from infrastructure.cache.redis_client import RedisCache
 from infrastructure.database.connection import AsyncDatabaseManager
 
@@ -20,6 +23,7 @@ def create_start_app_handler(app) -> Callable:
         # Initialize database
         db_manager = AsyncDatabaseManager()
         await db_manager.initialize()
+        app.state.db_manager = db_manager
         logger.info("Database initialized")
         
         # Initialize Redis
@@ -27,6 +31,36 @@ def create_start_app_handler(app) -> Callable:
         await cache.connect()
         logger.info("Cache connected")
         
+        # Process-wide clients shared by request-scoped services
+        from infrastructure.external.data_providers.yahoo_finance import YahooFinanceProvider
+        
+        app.state.redis = cache
+        app.state.yahoo = YahooFinanceProvider()
+        
+        # Relay WebSocket broadcasts published by any worker
+        if settings.ENABLE_REALTIME_WEBSOCKET:
+            from app.api.v1.websocket import manager
+            
+            manager.start_pubsub()
+            logger.info("WebSocket broadcast relay started")
+        
+        # Load the bcrypt backend and JWT signer now, not on the first login
+        from app.core.security import create_access_token, pwd_context
+        
+        await anyio.to_thread.run_sync(pwd_context.hash, "warmup")
+        create_access_token({"sub": "warmup"}, settings.JWT_SECRET_KEY)
+        
+        # Room for sync endpoints and file responses in AnyIO's worker threads
+        anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+        
+        # Leave cores for concurrent inference calls; those run on their own
+        # pool (nlp.executor), not the loop's default executor
+        if settings.ENABLE_NLP_SENTIMENT or settings.ENABLE_ML_PREDICTIONS:
+            import torch
+            
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+            logger.info("Torch intra-op threads configured", threads=torch.get_num_threads())
+        
         # Load ML models
         # from ml.inference.model_registry import ModelRegistry
         # registry = ModelRegistry()
@@ -43,9 +77,18 @@ def create_stop_app_handler(app) -> Callable:
     async def stop_app() -> None:
         logger.info("Shutting down application...")
         
+        if settings.ENABLE_REALTIME_WEBSOCKET:
+            from app.api.v1.websocket import manager
+            
+            await manager.stop_pubsub()
+        
+        # Stop the model inference pool (no-op if nothing used it)
+        from nlp.executor import shutdown_inference_executor
+        
+        shutdown_inference_executor()
+        
         # Close database connections
-        db_manager = AsyncDatabaseManager()
-        await db_manager.close()
+        await app.state.db_manager.close()
         logger.info("Database connections closed")
         
         # Close Redis
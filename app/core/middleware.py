@@ -1,78 +1,192 @@
 """
 FastAPI middleware components
+
+Both middlewares are plain ASGI callables: unlike BaseHTTPMiddleware they
+add no extra task or Request/Response objects per request.
 """
 
 import time
-from typing import Callable
+from uuid import uuid4
 
+import orjson
 import structlog
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from infrastructure.cache.redis_client import RedisCache
 
 logger = structlog.get_logger()
 
 
-class LoggingMiddleware(BaseHTTPMiddleware):
+class LoggingMiddleware:
     """Request/response logging middleware"""
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        # One line per request in production, like an access log
+        self.log_request_start = not settings.is_production
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        req_logger = logger.bind(method=scope["method"], path=scope["path"])
         
         # Log request
-        logger.info(
-            "Request started",
-            method=request.method,
-            path=request.url.path,
-            query=str(request.query_params),
-            client=request.client.host if request.client else None,
-        )
+        if self.log_request_start:
+            client = scope.get("client")
+            req_logger.info(
+                "Request started",
+                query=scope.get("query_string", b"").decode("latin-1"),
+                client=client[0] if client else None,
+            )
+        
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                duration_ms = (time.perf_counter() - start) * 1000
+                
+                # Log response
+                req_logger.info(
+                    "Request completed",
+                    status_code=message["status"],
+                    duration_ms=round(duration_ms, 2),
+                )
+                
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{duration_ms:.2f}".encode()))
+                message["headers"] = headers
+            await send(message)
         
         try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-            
-            # Log response
-            logger.info(
-                "Request completed",
-                method=request.method,
-                path=request.url.path,
-                status_code=response.status_code,
-                duration_ms=round(process_time * 1000, 2),
-            )
-            
-            response.headers["X-Process-Time"] = str(process_time)
-            return response
-            
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
-            logger.error(
+            # Exception is rendered by the processor chain, only if emitted
+            req_logger.error(
                 "Request failed",
-                method=request.method,
-                path=request.url.path,
-                error=str(e),
-                duration_ms=round(process_time * 1000, 2),
+                exc_info=e,
+                duration_ms=round((time.perf_counter() - start) * 1000, 2),
             )
             raise
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class HealthCheckMiddleware:
+    """Answer /health before any other middleware or routing runs"""
+    
+    path = "/health"
+    _headers = [(b"content-type", b"application/json")]
+    
+    def __init__(self, app: ASGIApp, version: str = "1.0.0"):
+        self.app = app
+        self.version = version
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path:
+            await self.app(scope, receive, send)
+            return
+        
+        body = orjson.dumps({
+            "status": "healthy",
+            "version": self.version,
+            "timestamp": time.time(),
+        })
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [*self._headers, (b"content-length", str(len(body)).encode())],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# Sliding-window limiter in one atomic round-trip:
+# KEYS[1]=bucket, ARGV = now_ms, window_ms, limit, member -> {allowed, remaining}
+RATE_LIMIT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now - window)
+local count = redis.call('ZCARD', KEYS[1])
+if count < limit then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+    return {1, limit - count - 1}
+end
+return {0, 0}
+"""
+
+
+class RateLimitMiddleware:
     """Rate limiting middleware using Redis"""
     
-    def __init__(self, app, requests_per_minute: int = 100):
-        super().__init__(app)
+    window_ms = 60_000
+    EXEMPT_PATHS = frozenset({"/health", "/api/docs", "/api/openapi.json"})
+    
+    def __init__(self, app: ASGIApp, requests_per_minute: int = 100):
+        self.app = app
         self.requests_per_minute = requests_per_minute
+        self._limit_header = (b"x-ratelimit-limit", str(requests_per_minute).encode())
+        self._script = None
+    
+    @staticmethod
+    def _client_id(scope: Scope) -> str:
+        """
+        Client address
+        
+        Not the x-api-key header: nothing validates it before this runs, so
+        a client could send a fresh key per request to get a fresh window.
+        """
+        client = scope.get("client")
+        return client[0] if client else "unknown"
+    
+    async def _check(self, client_id: str):
+        """Return (allowed, remaining) for this request"""
+        if self._script is None:
+            self._script = await RedisCache().register_script(RATE_LIMIT_SCRIPT)
+        
+        now_ms = int(time.time() * 1000)
+        allowed, remaining = await self._script(
+            keys=[f"ratelimit:{client_id}"],
+            args=[now_ms, self.window_ms, self.requests_per_minute, f"{now_ms}-{uuid4().hex}"],
+        )
+        return bool(allowed), int(remaining)
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        # Skip rate limiting for health checks
-        if request.url.path == "/health":
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip rate limiting for non-HTTP traffic, health checks and docs
+        if scope["type"] != "http" or scope["path"] in self.EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            allowed, remaining = await self._check(self._client_id(scope))
+        except Exception as e:
+            # Fail open: Redis trouble must not take the API down
+            logger.warning("Rate limit check failed", error=str(e))
+            allowed, remaining = True, self.requests_per_minute
+        
+        if not allowed:
+            response = JSONResponse(
+                {"detail": "Rate limit exceeded"},
+                status_code=429,
+                headers={
+                    "X-RateLimit-Limit": str(self.requests_per_minute),
+                    "X-RateLimit-Remaining": "0",
+                    "Retry-After": str(self.window_ms // 1000),
+                },
+            )
+            await response(scope, receive, send)
+            return
         
-        # Get client identifier
-        client_id = request.headers.get("X-API-Key") or request.client.host
+        remaining_header = (b"x-ratelimit-remaining", str(remaining).encode())
         
-        # Check rate limit (simplified - would use Redis in production)
-        # Implementation would check Redis for request count
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    self._limit_header,
+                    remaining_header,
+                ]
+            await send(message)
         
-        response = await call_next(request)
-        response.headers["X-RateLimit-Limit"] = str(self.requests_per_minute)
-        return response
+        await self.app(scope, receive, send_wrapper)
@@ -2,19 +2,48 @@
 Security utilities - JWT, password hashing, encryption
 """
 
-from datetime import datetime, timedelta
+import hashlib
+import threading
+import time
+from datetime import timedelta
 from typing import Any, Optional
 
-from jose import JWTError, jwt
+import anyio
+from cachetools import TTLCache
+import jwt
 from passlib.context import CryptContext
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+JWT_ALGORITHM = "HS256"
+_JWT_HEADERS = {"alg": JWT_ALGORITHM, "typ": "JWT"}
+_DECODE_OPTIONS = {"verify_aud": False}
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify password against hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+# Verified payloads keyed by (secret, token digest) -- never the raw token.
+# Expiry is re-checked on every hit, so the TTL only bounds staleness.
+_token_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+
+# Successful bcrypt checks keyed by sha256(plain, hash). Trade-off: for 60s a
+# repeat login with the same password skips bcrypt; a password change yields a
+# new hash and therefore a new key, so stale entries can never match it.
+_password_cache: TTLCache = TTLCache(maxsize=2048, ttl=60)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify password against hash (bcrypt runs in a worker thread)"""
+    cache_key = hashlib.sha256(
+        f"{plain_password}\0{hashed_password}".encode()
+    ).digest()
+    if cache_key in _password_cache:
+        return True
+    
+    valid = await anyio.to_thread.run_sync(pwd_context.verify, plain_password, hashed_password)
+    if valid:
+        _password_cache[cache_key] = True
+    return valid
 
 
 def get_password_hash(password: str) -> str:
@@ -26,13 +55,15 @@ def create_access_token(data: dict, secret_key: str, expires_delta: Optional[tim
     """Create JWT access token"""
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=15)
-    
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm="HS256")
+    # exp as epoch seconds: no datetime round-trip inside the encoder
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else 900  # 15 minutes
+    to_encode.update({"exp": int(time.time()) + lifetime, "type": "access"})
+    encoded_jwt = jwt.encode(
+        to_encode,
+        secret_key,
+        algorithm=JWT_ALGORITHM,
+        headers=_JWT_HEADERS,
+    )
     return encoded_jwt
 
 
@@ -40,23 +71,42 @@ def create_refresh_token(data: dict, secret_key: str, expires_delta: Optional[ti
     """Create JWT refresh token"""
     to_encode = data.copy()
     
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(days=7)
-    
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, secret_key, algorithm="HS256")
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else 604800  # 7 days
+    to_encode.update({"exp": int(time.time()) + lifetime, "type": "refresh"})
+    encoded_jwt = jwt.encode(
+        to_encode,
+        secret_key,
+        algorithm=JWT_ALGORITHM,
+        headers=_JWT_HEADERS,
+    )
     return encoded_jwt
 
 
 def verify_token(token: str, secret_key: str) -> dict:
     """Verify and decode JWT token"""
+    cache_key = (secret_key, hashlib.sha256(token.encode()).digest()[:16])
+    with _token_cache_lock:
+        payload = _token_cache.get(cache_key)
+    
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return dict(payload)
+        raise ValueError("Invalid token: Signature has expired.")
+    
     try:
-        payload = jwt.decode(token, secret_key, algorithms=["HS256"])
-        return payload
-    except JWTError as e:
+        payload = jwt.decode(
+            token,
+            secret_key,
+            algorithms=[JWT_ALGORITHM],
+            options=_DECODE_OPTIONS,
+        )
+    except jwt.InvalidTokenError as e:
         raise ValueError(f"Invalid token: {str(e)}")
+    
+    with _token_cache_lock:
+        _token_cache[cache_key] = payload
+    return dict(payload)
 
 
 def create_api_key() -> str:
@@ -2,44 +2,67 @@
 FastAPI dependencies for dependency injection
 """
 
+from functools import lru_cache
 from typing import AsyncGenerator, Optional
+from uuid import UUID
 
 import structlog
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import Settings, get_settings
+from app.config import settings
 from app.core.security import verify_token
+from app.services.market_data_service import MarketDataService
 from infrastructure.database.connection import AsyncDatabaseManager
 from infrastructure.cache.redis_client import RedisCache
 
 logger = structlog.get_logger()
 security = HTTPBearer(auto_error=False)
 
+JWT_SECRET_KEY = settings.JWT_SECRET_KEY
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Database session dependency"""
-    db_manager = AsyncDatabaseManager()
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Database session dependency (rollback and close handled by get_session)"""
+    db_manager: AsyncDatabaseManager = request.app.state.db_manager
     async with db_manager.get_session() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+        yield session
+        await session.commit()
+
+
+@lru_cache(maxsize=1)
+def _cache_singleton() -> RedisCache:
+    """Process-wide cache client"""
+    return RedisCache()
 
 
 async def get_cache() -> RedisCache:
     """Redis cache dependency"""
-    return RedisCache()
+    return _cache_singleton()
+
+
+def get_market_data_service(request: Request) -> MarketDataService:
+    """Market data service backed by the app-wide Redis and Yahoo clients"""
+    return MarketDataService(request.app.state.redis, request.app.state.yahoo)
+
+
+def _user_from_token(token: str) -> dict:
+    """Decode a JWT into the current-user dict (verification is cached)"""
+    payload = verify_token(token, JWT_SECRET_KEY)
+    user_id = payload.get("sub")
+    if not user_id:
+        raise ValueError("Token has no subject")
+    
+    return {
+        "id": UUID(user_id),
+        "email": payload.get("email"),
+        "role": payload.get("role", "user"),
+    }
 
 
 async def get_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    settings: Settings = Depends(get_settings),
 ) -> dict:
     """Get current authenticated user from JWT token"""
     if not credentials:
@@ -50,19 +73,7 @@ async def get_current_user(
         )
     
     try:
-        payload = verify_token(credentials.credentials, settings.JWT_SECRET_KEY)
-        user_id = payload.get("sub")
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-            )
-        
-        return {
-            "id": user_id,
-            "email": payload.get("email"),
-            "role": payload.get("role", "user"),
-        }
+        return _user_from_token(credentials.credentials)
     
     except Exception as e:
         logger.error("Token verification failed", error=str(e))
@@ -72,6 +83,11 @@ async def get_current_user(
         )
 
 
+async def get_current_user_ws(token: str) -> dict:
+    """Get current user for a WebSocket connection (token from query string)"""
+    return _user_from_token(token)
+
+
 async def get_current_active_user(
     current_user: dict = Depends(get_current_user),
 ) -> dict:
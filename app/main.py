@@ -3,14 +3,14 @@ WealthHive - Main Application Entry Point
 FastAPI application with comprehensive middleware and event handlers
 """
 
-import time
+import logging
 from contextlib import asynccontextmanager
 
 import structlog
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from app.api.v1 import (
     assets,
@@ -27,10 +27,54 @@ from app.api.v1 import (
 )
 from app.config import Settings, get_settings
 from app.core.events import create_start_app_handler, create_stop_app_handler
-from app.core.middleware import LoggingMiddleware, RateLimitMiddleware
+from app.core.middleware import (
+    HealthCheckMiddleware,
+    LoggingMiddleware,
+    RateLimitMiddleware,
+)
 
 logger = structlog.get_logger()
 
+API_V1_PREFIX = "/api/v1/"
+
+# (path segment, router, OpenAPI tag)
+_V1_ROUTES: tuple = (
+    ("auth", auth.router, "Authentication"),
+    ("users", users.router, "Users"),
+    ("assets", assets.router, "Assets"),
+    ("portfolios", portfolios.router, "Portfolios"),
+    ("orders", orders.router, "Orders"),
+    ("backtests", backtests.router, "Backtests"),
+    ("ml", ml.router, "Machine Learning"),
+    ("nlp", nlp.router, "NLP"),
+    ("quant", quant.router, "Quantitative"),
+    ("reports", reports.router, "Reports"),
+    ("ws", websocket.router, "WebSocket"),
+)
+
+
+def configure_logging(settings: Settings) -> None:
+    """Configure structlog once per process"""
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            # ConsoleRenderer formats exc_info itself; JSON needs it as a string
+            *(
+                [structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+                if settings.is_production
+                else [structlog.dev.ConsoleRenderer()]
+            ),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.DEBUG if settings.DEBUG else logging.INFO
+        ),
+        logger_factory=structlog.PrintLoggerFactory(),
+        # Loggers resolve their processor chain once, not on every call
+        cache_logger_on_first_use=True,
+    )
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -51,6 +95,7 @@ async def lifespan(app: FastAPI):
 def create_application() -> FastAPI:
     """Application factory pattern"""
     settings = get_settings()
+    configure_logging(settings)
     
     app = FastAPI(
         title="WealthHive API",
@@ -60,52 +105,37 @@ def create_application() -> FastAPI:
         redoc_url="/api/redoc" if settings.DEBUG else None,
         openapi_url="/api/openapi.json" if settings.DEBUG else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
-    # Middlewares
+    # Middlewares (last added runs first: rate limiting rejects before
+    # logging and compression do any work)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["authorization", "content-type", "x-api-key"],
     )
-    app.add_middleware(GZipMiddleware, minimum_size=1000)
+    # Bodies under one MTU cost more to compress than they save
+    app.add_middleware(GZipMiddleware, minimum_size=1500)
     app.add_middleware(LoggingMiddleware)
     app.add_middleware(RateLimitMiddleware, requests_per_minute=100)
+    # Outermost: probes skip rate limiting, logging and routing entirely
+    app.add_middleware(HealthCheckMiddleware, version=app.version)
     
     # Exception handlers
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
         logger.error("Unhandled exception", error=str(exc), path=request.url.path)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": "Internal server error"},
         )
     
-    # Health check
-    @app.get("/health", tags=["Health"])
-    async def health_check():
-        return {
-            "status": "healthy",
-            "version": "1.0.0",
-            "timestamp": time.time(),
-        }
-    
     # API Routes v1
-    api_v1_prefix = "/api/v1"
-    
-    app.include_router(auth.router, prefix=f"{api_v1_prefix}/auth", tags=["Authentication"])
-    app.include_router(users.router, prefix=f"{api_v1_prefix}/users", tags=["Users"])
-    app.include_router(assets.router, prefix=f"{api_v1_prefix}/assets", tags=["Assets"])
-    app.include_router(portfolios.router, prefix=f"{api_v1_prefix}/portfolios", tags=["Portfolios"])
-    app.include_router(orders.router, prefix=f"{api_v1_prefix}/orders", tags=["Orders"])
-    app.include_router(backtests.router, prefix=f"{api_v1_prefix}/backtests", tags=["Backtests"])
-    app.include_router(ml.router, prefix=f"{api_v1_prefix}/ml", tags=["Machine Learning"])
-    app.include_router(nlp.router, prefix=f"{api_v1_prefix}/nlp", tags=["NLP"])
-    app.include_router(quant.router, prefix=f"{api_v1_prefix}/quant", tags=["Quantitative"])
-    app.include_router(reports.router, prefix=f"{api_v1_prefix}/reports", tags=["Reports"])
-    app.include_router(websocket.router, prefix=f"{api_v1_prefix}/ws", tags=["WebSocket"])
+    for name, router, tag in _V1_ROUTES:
+        app.include_router(router, prefix=API_V1_PREFIX + name, tags=[tag])
     
     return app
 
@@ -0,0 +1,39 @@
+"""
+Backtest response schemas
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BacktestSummary(BaseModel):
+    """Backtest row as shown in listings"""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    strategy_name: str
+    start_date: str
+    end_date: str
+    initial_capital: float
+    final_capital: Optional[float] = None
+    total_return: Optional[float] = None
+    sharpe_ratio: Optional[float] = None
+    max_drawdown: Optional[float] = None
+    status: str
+    created_at: datetime
+
+
+class BacktestOut(BacktestSummary):
+    """Full backtest results"""
+    
+    total_return_percent: Optional[float] = None
+    sortino_ratio: Optional[float] = None
+    calmar_ratio: Optional[float] = None
+    win_rate: Optional[float] = None
+    profit_factor: Optional[float] = None
+    trades: Optional[List[Dict[str, Any]]] = None
+    equity_curve: Optional[List[float]] = None
@@ -0,0 +1,23 @@
+"""
+Machine learning response schemas
+"""
+
+from typing import Dict, List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class PredictionOut(BaseModel):
+    """Price prediction for an asset"""
+    
+    asset_id: UUID
+    asset_symbol: str
+    model_id: str
+    horizon_days: int
+    current_price: float
+    predicted_prices: List[float]
+    confidence_intervals: List[Dict[str, float]]
+    direction: str  # up, down, neutral
+    confidence: float
+    generated_at: str
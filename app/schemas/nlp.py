@@ -0,0 +1,52 @@
+"""
+NLP response schemas
+"""
+
+from typing import Any, Dict, List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SentimentOut(BaseModel):
+    """Sentiment of a single text"""
+    
+    text: str
+    language: str
+    model: str
+    sentiment: str  # positive, negative, neutral
+    confidence: float
+    scores: Dict[str, float]  # {positive: 0.8, negative: 0.1, neutral: 0.1}
+    entities: List[Dict[str, Any]] = []
+
+
+class ArticleSentiment(BaseModel):
+    """Sentiment of a news article"""
+    
+    title: str
+    source: str
+    published_at: Any
+    sentiment: str
+    confidence: float
+
+
+class SentimentBreakdown(BaseModel):
+    """Article count per sentiment label"""
+    
+    positive: int
+    neutral: int
+    negative: int
+
+
+class AssetSentimentOut(BaseModel):
+    """Aggregated news sentiment for an asset"""
+    
+    asset_id: UUID
+    asset_symbol: str
+    period_days: int
+    articles_analyzed: int
+    overall_sentiment: str
+    sentiment_score: float
+    breakdown: SentimentBreakdown
+    recent_articles: List[ArticleSentiment]
+    trend: str  # improving, declining, stable
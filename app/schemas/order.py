@@ -0,0 +1,35 @@
+"""
+Order response schemas
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+from core.entities.order import OrderSide, OrderStatus, OrderType
+
+
+class OrderSummary(BaseModel):
+    """Order row as shown in listings"""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    portfolio_id: UUID
+    asset_id: UUID
+    order_type: OrderType
+    side: OrderSide
+    quantity: float
+    price: Optional[float] = None
+    status: OrderStatus
+    created_at: datetime
+
+
+class OrderOut(OrderSummary):
+    """Full order details"""
+    
+    filled_quantity: float
+    avg_fill_price: Optional[float] = None
+    updated_at: datetime
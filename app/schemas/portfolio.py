@@ -0,0 +1,50 @@
+"""
+Portfolio response schemas
+"""
+
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID
+
+from pydantic import AliasPath, BaseModel, ConfigDict, Field, field_validator
+
+
+class PositionOut(BaseModel):
+    """Position within a portfolio"""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    asset_id: UUID = Field(validation_alias=AliasPath("asset", "id"))
+    asset_symbol: str = Field(validation_alias=AliasPath("asset", "symbol"))
+    quantity: float
+    avg_price: float
+    current_price: Optional[float] = None
+    market_value: Optional[float] = None
+    unrealized_pnl: Optional[float] = None
+
+
+class PortfolioSummary(BaseModel):
+    """Portfolio row as shown in listings (no positions)"""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    name: str
+    description: Optional[str] = None
+    total_value: Optional[float] = None
+    total_return: Optional[float] = None
+    total_return_percent: Optional[float] = None
+    created_at: datetime
+
+
+class PortfolioDetail(PortfolioSummary):
+    """Portfolio with its positions"""
+    
+    initial_balance: float
+    positions: List[PositionOut] = []
+    
+    @field_validator("positions", mode="before")
+    @classmethod
+    def _positions_values(cls, value: Any) -> Any:
+        """Portfolio entities key positions by asset id"""
+        return list(value.values()) if isinstance(value, dict) else value
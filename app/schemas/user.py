@@ -0,0 +1,27 @@
+"""
+User response schemas
+"""
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class UserSummary(BaseModel):
+    """User row as shown in listings"""
+    
+    model_config = ConfigDict(from_attributes=True)
+    
+    id: UUID
+    email: str
+    full_name: str
+    role: str
+    is_active: bool
+
+
+class UserOut(UserSummary):
+    """Full user details"""
+    
+    created_at: datetime
+    updated_at: datetime
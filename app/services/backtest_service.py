@@ -2,7 +2,10 @@
 Backtesting service
 """
 
-from typing import Any, Dict, List
+import os
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from uuid import UUID
 
 import structlog
@@ -18,15 +21,22 @@ logger = structlog.get_logger()
 class BacktestService:
     """Backtesting business logic"""
     
-    STRATEGIES = {
+    STRATEGIES: Mapping[str, type] = MappingProxyType({
         "moving_average": MovingAverageStrategy,
         "momentum": MomentumStrategy,
         "mean_reversion": MeanReversionStrategy,
-    }
+    })
     
     def __init__(self, db_session):
         self.db = db_session
     
+    def _strategy_class(self, strategy_name: str) -> type:
+        """Resolve a strategy name with a single lookup"""
+        strategy_class = self.STRATEGIES.get(strategy_name)
+        if strategy_class is None:
+            raise ValueError(f"Unknown strategy: {strategy_name}")
+        return strategy_class
+    
     async def run_backtest(
         self,
         strategy_name: str,
@@ -38,7 +48,10 @@ class BacktestService:
 Backtesting service
 """
 
-from typing import Any, Dict, List
+import os
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 from uuid import UUID
 
 import structlog
@@ -54,15 +67,22 @@ logger = structlog.get_logger()
 class BacktestService:
     """Backtesting business logic"""
     
-    STRATEGIES = {
+    STRATEGIES: Mapping[str, type] = MappingProxyType({
         "moving_average": MovingAverageStrategy,
         "momentum": MomentumStrategy,
         "mean_reversion": MeanReversionStrategy,
-    }
+    })
     
     def __init__(self, db_session):
         self.db = db_session
     
+    def _strategy_class(self, strategy_name: str) -> type:
+        """Resolve a strategy name with a single lookup"""
+        strategy_class = self.STRATEGIES.get(strategy_name)
+        if strategy_class is None:
+            raise ValueError(f"Unknown strategy: {strategy_name}")
+        return strategy_class
+    
     async def run_backtest(
         self,
         strategy_name: str,
@@ -73,10 +93,7 @@ class BacktestService:
         parameters: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Run backtest with specified strategy"""
-        if strategy_name not in self.STRATEGIES:
-            raise ValueError(f"Unknown strategy: {strategy_name}")
-        
-        strategy_class = self.STRATEGIES[strategy_name]
+        strategy_class = self._strategy_class(strategy_name)
         strategy = strategy_class(**parameters)
         
         engine = BacktestEngine(
@@ -111,13 +128,15 @@ class BacktestService:
         start_date: str,
         end_date: str,
         param_grid: Dict[str, List[Any]],
+        n_jobs: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Run grid search optimization"""
+        """Run grid search optimization (n_jobs worker processes, default all cores)"""
         from backtest.optimization.grid_search import GridSearchOptimizer
         
         optimizer = GridSearchOptimizer(
-            strategy_class=self.STRATEGIES[strategy_name],
+            strategy_class=self._strategy_class(strategy_name),
             param_grid=param_grid,
+            n_jobs=n_jobs or os.cpu_count(),
         )
         
         best_params, results = await optimizer.optimize(
@@ -126,9 +145,12 @@ class BacktestService:
             end_date=end_date,
         )
         
+        # Ranked once: the top entry is the best, the first ten the leaderboard
+        results.sort(key=itemgetter("sharpe_ratio"), reverse=True)
+        
         return {
             "best_parameters": best_params,
-            "best_sharpe": max(r["sharpe_ratio"] for r in results),
+            "best_sharpe": results[0]["sharpe_ratio"],
             "all_results": results[:10],  # Top 10
         }
     
@@ -146,9 +168,12 @@ class BacktestService:
             end_date=end_date,
         )
         
+        # Ranked once: the top entry is the best, the first ten the leaderboard
+        results.sort(key=itemgetter("sharpe_ratio"), reverse=True)
+        
         return {
             "best_parameters": best_params,
-            "best_sharpe": max(r["sharpe_ratio"] for r in results),
+            "best_sharpe": results[0]["sharpe_ratio"],
             "all_results": results[:10],  # Top 10
         }
     
@@ -165,7 +190,7 @@ class BacktestService:
         from backtest.optimization.walk_forward import WalkForwardOptimizer
         
         optimizer = WalkForwardOptimizer(
-            strategy_class=self.STRATEGIES[strategy_name],
+            strategy_class=self._strategy_class(strategy_name),
             train_size=train_size,
             test_size=test_size,
         )
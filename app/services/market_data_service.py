@@ -15,9 +15,14 @@ logger = structlog.get_logger()
 class MarketDataService:
     """Service for fetching and caching market data"""
     
-    def __init__(self):
-        self.cache = RedisCache()
-        self.yahoo = YahooFinanceProvider()
+    def __init__(
+        self,
+        cache: Optional[RedisCache] = None,
+        yahoo: Optional[YahooFinanceProvider] = None,
+    ):
+        # Requests pass the app-wide instances from app.state
+        self.cache = cache or RedisCache()
+        self.yahoo = yahoo or YahooFinanceProvider()
         self.cache_ttl = 300  # 5 minutes
     
     async def get_price(self, symbol: str) -> Dict[str, Any]:
@@ -43,10 +48,12 @@ class MarketDataService:
         results = {}
         missing = []
         
-        # Check cache for all symbols
-        for symbol in symbols:
-            cache_key = f"price:{symbol}"
-            cached = await self.cache.get(cache_key)
+        if not symbols:
+            return results
+        
+        # Check cache for all symbols in one round-trip
+        cached_values = await self.cache.mget([f"price:{symbol}" for symbol in symbols])
+        for symbol, cached in zip(symbols, cached_values):
             if cached:
                 results[symbol] = cached
             else:
@@ -56,9 +63,11 @@ class MarketDataService:
         if missing:
             try:
                 data = await self.yahoo.get_current_prices(missing)
-                for symbol, price_data in data.items():
-                    results[symbol] = price_data
-                    await self.cache.set(f"price:{symbol}", price_data, ttl=self.cache_ttl)
+                results.update(data)
+                await self.cache.set_many(
+                    {f"price:{symbol}": price_data for symbol, price_data in data.items()},
+                    ttl=self.cache_ttl,
+                )
             except Exception as e:
                 logger.error("Failed to fetch prices", symbols=missing, error=str(e))
         
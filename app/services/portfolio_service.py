@@ -2,11 +2,14 @@
 Portfolio business logic service
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import UUID
 
+import numpy as np
 import structlog
 
+from app.services.market_data_service import MarketDataService
+from core.entities.portfolio import Portfolio
 from infrastructure.cache.redis_client import RedisCache
 from infrastructure.database.repositories.portfolio_repository import PortfolioRepository
 
@@ -20,49 +23,72 @@ class PortfolioService:
   
     """Portfolio business logic"""
     
-    def __init__(self, db_session):
+    def __init__(self, db_session, market_data: Optional[MarketDataService] = None):
         self.db = db_session
         self.cache = RedisCache()
         self.repo = PortfolioRepository(db_session)
+        # Routes pass the app-wide service (get_market_data_service)
+        self.market_data = market_data or MarketDataService(self.cache)
     
-    async def calculate_portfolio_value(self, portfolio_id: UUID) -> Dict[str, Any]:
-        """Calculate current portfolio value and metrics"""
-        portfolio = await self.repo.get_by_id(portfolio_id)
+    async def calculate_portfolio_value(
+        self,
+        portfolio_id: UUID,
+        persist: bool = True,
+        portfolio: Optional[Portfolio] = None,
+    ) -> Dict[str, Any]:
+        """
+        Calculate current portfolio value and metrics
+        
+        Args:
+            portfolio_id: Portfolio to value
+            persist: Write the new value back to the portfolio row
+            portfolio: Portfolio already loaded with positions, to skip the fetch
+        """
+        if portfolio is None:
+            portfolio = await self.repo.get_by_id_with_positions(portfolio_id)
         if not portfolio:
             raise ValueError("Portfolio not found")
         
-        from app.services.market_data_service import MarketDataService
-        market_service = MarketDataService()
+        # All quotes in one cache MGET, with one batched fetch for the misses
+        prices = await self.market_data.get_prices(
+            list({position.asset.symbol for position in portfolio.positions.values()})
+        )
         
         total_value = 0.0
         total_cost = 0.0
         positions_data = []
         
-        for position in portfolio.positions:
+        # positions maps asset_id -> Position; quotes are floats, so the
+        # Decimal quantities are converted once per position
+        for asset_id, position in portfolio.positions.items():
+            quantity = float(position.quantity)
+            avg_price = float(position.avg_price)
+            
             # Get current price
-            price_data = await market_service.get_price(position.asset.symbol)
-            current_price = price_data.get("price", position.avg_price)
+            price_data = prices.get(position.asset.symbol, {})
+            current_price = price_data.get("price", avg_price)
             
-            market_value = position.quantity * current_price
-            cost_basis = position.quantity * position.avg_price
+            market_value = quantity * current_price
+            cost_basis = quantity * avg_price
             unrealized_pnl = market_value - cost_basis
             
             total_value += market_value
             total_cost += cost_basis
             
             positions_data.append({
-                "asset_id": position.asset_id,
+                "asset_id": asset_id,
                 "symbol": position.asset.symbol,
-                "quantity": position.quantity,
-                "avg_price": position.avg_price,
+                "quantity": quantity,
+                "avg_price": avg_price,
                 "current_price": current_price,
                 "market_value": market_value,
                 "unrealized_pnl": unrealized_pnl,
                 "return_percent": (unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0,
             })
         
-        total_return = total_value - portfolio.initial_balance
-        total_return_percent = (total_return / portfolio.initial_balance * 100) if portfolio.initial_balance > 0 else 0
+        initial_balance = float(portfolio.initial_balance)
+        total_return = total_value - initial_balance
+        total_return_percent = (total_return / initial_balance * 100) if initial_balance > 0 else 0
         
         result = {
             "portfolio_id": portfolio_id,
@@ -71,16 +97,17 @@ class PortfolioService:
             "total_return": total_return,
             "total_return_percent": total_return_percent,
             "positions": positions_data,
-            "cash": portfolio.initial_balance - total_cost + sum(p["unrealized_pnl"] for p in positions_data),
+            "cash": initial_balance - total_cost + sum(p["unrealized_pnl"] for p in positions_data),
         }
         
         # Update portfolio in database
-        await self.repo.update_value(
-            portfolio_id=portfolio_id,
-            total_value=total_value,
-            total_return=total_return,
-            total_return_percent=total_return_percent,
-        )
+        if persist:
+            await self.repo.update_value(
+                portfolio_id=portfolio_id,
+                total_value=total_value,
+                total_return=total_return,
+                total_return_percent=total_return_percent,
+            )
         
         return result
     
@@ -88,35 +115,69 @@ class PortfolioService:
         self,
         portfolio_id: UUID,
         target_weights: Dict[str, float],
+        buy_only_cash: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Generate rebalancing recommendations]:
-        """Generate rebalancing recommendations"""
-        portfolio = await self.repo.get_by_id(portfolio_id)
+        """
+        Generate rebalancing recommendations
+        
+        With buy_only_cash, nothing is sold: that much new cash is split
+        across the assets to get as close to the targets as possible.
+        """
+        portfolio = await self.repo.get_by_id_with_positions(portfolio_id)
         if not portfolio:
             raise ValueError("Portfolio not found")
         
-        current = await self.calculate_portfolio_value(portfolio_id)
+        current = await self.calculate_portfolio_value(
+            portfolio_id, persist=False, portfolio=portfolio
+        )
         total_value = current["total_value"]
         
-        recommendations = []
-        
+        held: Dict[str, float] = {}
+        prices: Dict[str, float] = {}
         for position in current["positions"]:
             symbol = position["symbol"]
-            current_weight = position["market_value"] / total_value if total_value > 0 else 0
-            target_weight = target_weights.get(symbol, 0)
-            
-            weight_diff = target_weight - current_weight
-            value_diff = weight_diff * total_value
-            
-            if abs(weight_diff) > 0.01:  # 1% threshold
-                recommendations.append({
-                    "symbol": symbol,
-                    "current_weight": round(current_weight * 100, 2),
-                    "target_weight": round(target_weight * 100, 2),
-                    "action": "buy" if weight_diff > 0 else "sell",
-                    "value": abs(value_diff),
-                    "shares": abs(value_diff / position["current_price"]) if position["current_price"] > 0 else 0,
-                })
+            held[symbol] = held.get(symbol, 0.0) + position["market_value"]
+            prices[symbol] = position["current_price"]
+        
+        # Target symbols not held yet still need a quote to size the buy
+        new_symbols = [s for s in target_weights if s not in held]
+        if new_symbols:
+            quotes = await self.market_data.get_prices(new_symbols)
+            for symbol in new_symbols:
+                prices[symbol] = quotes.get(symbol, {}).get("price", 0.0)
+        
+        # One vector per quantity over the union of held and target symbols
+        symbols = sorted(held.keys() | target_weights.keys())
+        n = len(symbols)
+        values = np.fromiter(
+            (held.get(s, 0.0) for s in symbols),
+            dtype=np.float64,
+            count=n,
+        )
+        tgt_w = np.fromiter((target_weights.get(s, 0) for s in symbols), dtype=np.float64, count=n)
+        px = np.fromiter((prices[s] for s in symbols), dtype=np.float64, count=n)
+        
+        cur_w = values / total_value if total_value > 0 else np.zeros(n)
+        if buy_only_cash is None:
+            weight_diffs = tgt_w - cur_w
+            value_diffs = np.abs(weight_diffs) * total_value
+        else:
+            value_diffs = self._buy_only_allocation(values, tgt_w, buy_only_cash)
+            weight_diffs = value_diffs / (total_value + buy_only_cash)
+        shares = np.divide(value_diffs, px, out=np.zeros(n), where=px > 0)
+        
+        recommendations = [
+            {
+                "symbol": symbols[i],
+                "current_weight": round(float(cur_w[i]) * 100, 2),
+                "target_weight": round(float(tgt_w[i]) * 100, 2),
+                "action": "buy" if weight_diffs[i] > 0 else "sell",
+                "value": float(value_diffs[i]),
+                "shares": float(shares[i]),
+            }
+            for i in np.flatnonzero(np.abs(weight_diffs) > 0.01)  # 1% threshold
+        ]
         
         return {
             "portfolio_id": portfolio_id,
@@ -125,17 +186,44 @@ class PortfolioService:
             "expected_turnover": sum(r["value"] for r in recommendations) / 2,
         }
     
+    @staticmethod
+    def _buy_only_allocation(
+        values: np.ndarray,
+        target_weights: np.ndarray,
+        cash: float,
+    ) -> np.ndarray:
+        """
+        Split new cash across assets without selling
+        
+        Returns the buys b >= 0 with sum(b) == cash that bring the new
+        weights closest (in the l2 sense) to the targets: the projection of
+        the value deficits onto the simplex, b = max(d - lam, 0).
+        """
+        if cash <= 0:
+            return np.zeros_like(values)
+        deficits = target_weights * (values.sum() + cash) - values
+        
+        # Water level lam from the sorted deficits (closed form, O(N log N))
+        d = np.sort(deficits)[::-1]
+        cumulative = np.cumsum(d) - cash
+        k = np.flatnonzero(d - cumulative / np.arange(1, d.size + 1) > 0)[-1]
+        lam = cumulative[k] / (k + 1)
+        
+        return np.maximum(deficits - lam, 0.0)
+    
     async def get_performance_metrics(self, portfolio_id: UUID) -> Dict[str, Any]:
         """Calculate portfolio performance metrics"""
         from quant.risk.var import VaRCalculator
         from quant.portfolio.markowitz import MarkowitzOptimizer
         
-        portfolio = await self.repo.get_by_id(portfolio_id)
+        portfolio = await self.repo.get_by_id_with_positions(portfolio_id)
         if not portfolio:
             raise ValueError("Portfolio not found")
         
         # Get historical data for calculations
-        current = await self.calculate_portfolio_value(portfolio_id)
+        current = await self.calculate_portfolio_value(
+            portfolio_id, persist=False, portfolio=portfolio
+        )
         
         # Calculate VaR
         var_calc = VaRCalculator()
@@ -157,15 +245,19 @@ class PortfolioService:
         if not positions:
             return {"hhi": 0, "top_5_percent": 0}
         
-        total_value = sum(p["market_value"] for p in positions)
-        weights = [p["market_value"] / total_value for p in positions]
+        values = np.fromiter(
+            (p["market_value"] for p in positions),
+            dtype=np.float64,
+            count=len(positions),
+        )
+        w = values / values.sum()
         
         # Herfindahl-Hirschman Index
-        hhi = sum(w ** 2 for w in weights)
+        hhi = float(w @ w)
         
-        # Top 5 concentration
-        sorted_weights = sorted(weights, reverse=True)
-        top_5_percent = sum(sorted_weights[:5]) * 100
+        # Top 5 concentration (partial sort: O(N) selection of the largest)
+        k = min(5, w.size)
+        top_5_percent = float(np.partition(w, -k)[-k:].sum()) * 100
         
         return {
             "hhi": round(hhi, 4),
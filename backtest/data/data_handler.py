@@ -2,17 +2,28 @@
 Data management for backtesting
 """
 
-from typing import Any, Dict, List
+from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+FIELDS = ["open", "high", "low", "close", "volume"]
+
 
 class DataHandler:
-    """Manage data for backtests"""
+    """
+    Manage data for backtests
+    
+    Bars are stacked into one [T, N_symbols, N_fields] float64 array so the
+    current bar for every symbol is a single zero-copy slice.
+    """
     
     def __init__(self):
         self.data: Dict[str, pd.DataFrame] = {}
         self.current_idx = 0
+        self.stack: Optional[np.ndarray] = None
+        self.symbol_idx: Dict[str, int] = {}
+        self.field_idx: Dict[str, int] = {field: k for k, field in enumerate(FIELDS)}
     
     def load_data(
         self,
@@ -20,28 +31,41 @@ class DataHandler:
         data: pd.DataFrame,
     ):
         """Load data for symbol"""
-        self.data[symbol] data.sort_index()
+        self.data[symbol] = data.sort_index()
+        self.stack = None  # Rebuilt on next access
+    
+    def _build_stack(self) -> np.ndarray:
+        """Stack all symbols by bar position; shorter histories are NaN-padded"""
+        T = max((len(df) for df in self.data.values()), default=0)
+        self.symbol_idx = {symbol: j for j, symbol in enumerate(self.data)}
+        self.stack = np.full((T, len(self.data), len(FIELDS)), np.nan)
+        for symbol, df in self.data.items():
+            self.stack[:len(df), self.symbol_idx[symbol], :] = df[FIELDS].to_numpy(dtype=np.float64)
+        return self.stack
     
     def get_latest_bars(
         self,
         symbol: str,
         n: int = 1,
-    ) -> pd.DataFrame:
-        """Get last n bars"""
+    ) -> np.ndarray:
+        """Get the last n bars up to the current one, shape [n, N_fields]"""
         if symbol not in self.data:
-            return pd.DataFrame()
+            return np.empty((0, len(FIELDS)))
         
-        return self.data[symbol].iloc[-n:]
+        stack = self.stack if self.stack is not None else self._build_stack()
+        start = max(0, self.current_idx - n + 1)
+        return stack[start:self.current_idx + 1, self.symbol_idx[symbol], :]
     
     def update_bars(self):
         """Move to next bar"""
         self.current_idx += 1
     
-    def get_current_data(self) -> Dict[str, pd.Series]:
-        """Get current bar for all symbols"""
-        current = {}
-        for symbol, df in self.data.items():
-            if self.current_idx < len(df):
-                current[symbol] = df.iloc[self.current_idx]
-        return current
-      
+    def get_current_data(self) -> np.ndarray:
+        """
+        Get current bar for all symbols, shape [N_symbols, N_fields]
+        
+        Index with self.symbol_idx / self.field_idx; symbols whose history
+        has ended read as NaN.
+        """
+        stack = self.stack if self.stack is not None else self._build_stack()
+        return stack[self.current_idx]
@@ -2,12 +2,31 @@
 Main backtesting engine
 """
 
-from typing import Any, Dict, List
+import asyncio
+from dataclasses import asdict
+from functools import reduce
+from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
+import structlog
 
 from backtest.engine.execution_handler import ExecutionHandler
-from backtest.engine.portfolio_handler import PortfolioHandler
+from backtest.engine.kernel import (
+    TRADE_BAR,
+    TRADE_ENTRY,
+    TRADE_EXIT,
+    TRADE_PNL,
+    TRADE_QTY,
+    TRADE_SYMBOL,
+    run_backtest_kernel,
+)
+from backtest.engine.portfolio_handler import PortfolioHandler, Trade
+
+FIELDS = ("open", "high", "low", "close", "volume")
+HISTORY_CACHE_TTL = 3600
+
+logger = structlog.get_logger()
 
 
 class BacktestEngine:
@@ -37,70 +56,162 @@ class BacktestEngine:
         self.events = []
         self.results = {}
     
-    async def run(self, symbols: List[str]) -> Dict[str, Any]:
-        """Run backtest"""
-        print(f"Starting backtest for {symbols}")
+    async def run(
+        self,
+        symbols: List[str],
+        prefetched_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run backtest (on prefetched columnar bars when given)"""
+        logger.debug("Starting backtest", symbols=symbols)
         
         # Load data
-        data = await self._load_data(symbols)
+        bars = prefetched_data if prefetched_data is not None else await self.load_data(symbols)
+        timestamps = bars["timestamps"]
+        close = bars["close"]
+        
+        # Initialize strategy (also maps each symbol to its column)
+        self.strategy.initialize(bars)
+        symbol_idx = self.strategy.symbol_idx
         
-        # Initialize strategy
-        self.strategy.initialize(data)
+        # Strategies with precomputed signals run entirely in compiled code
+        signals = self.strategy.generate_signals()
+        if signals is not None:
+            self._run_compiled(bars, signals)
+            self.results = self._calculate_metrics()
+            return self.results
         
-        # Event loop
-        for timestamp in data.index:
-            # Update market data
-            current_data = data.loc[timestamp]
+        # Event loop: integer bar index into [T, N] arrays, no pandas per bar
+        self.portfolio_handler.prepare(len(timestamps), symbol_idx)
+        for i in range(len(timestamps)):
+            timestamp = timestamps[i]
+            close_row = close[i]
             
             # Generate signals
-            signals = self.strategy.on_bar(timestamp, current_data)
+            signals = self.strategy.on_bar(i, timestamp, close_row)
             
-            # Execute signals
-            for signal in signals:
-                fill = self.execution_handler.execute(signal, current_data)
+            # Execute signals: order batches are priced in one vectorized step
+            if isinstance(signals, np.ndarray):
+                fills = self.execution_handler.execute_array(
+                    signals, close_row, self.strategy.symbols, timestamp
+                )
+            else:
+                fills = [
+                    self.execution_handler.execute(signal, close_row, symbol_idx, timestamp)
+                    for signal in signals
+                ]
+            for fill in fills:
                 if fill:
                     self.portfolio_handler.update(fill)
             
             # Update portfolio value
-            self.portfolio_handler.mark_to_market(timestamp, current_data)
+            self.portfolio_handler.mark_to_market(i, close_row)
         
         # Calculate results
         self.results = self._calculate_metrics()
         
         return self.results
     
-    async def _load_data(self, symbols: List[str]) -> pd.DataFrame:
-        """Load historical data"""
+    def _run_compiled(self, bars: Dict[str, Any], signals: np.ndarray) -> None:
+        """Run the whole bar loop in the numba kernel and record the outcome"""
+        equity_curve, trade_log = run_backtest_kernel(
+            bars["close"],
+            np.ascontiguousarray(signals, dtype=np.float64),
+            self.commission,
+            self.slippage,
+            self.initial_capital,
+        )
+        
+        symbols, timestamps = bars["symbols"], bars["timestamps"]
+        self.portfolio_handler.equity_curve = equity_curve
+        self.portfolio_handler.current_equity = float(equity_curve[-1])
+        self.portfolio_handler.trades = [
+            Trade(
+                symbol=symbols[int(row[TRADE_SYMBOL])],
+                entry_date=None,
+                exit_date=timestamps[int(row[TRADE_BAR])],
+                entry_price=float(row[TRADE_ENTRY]),
+                exit_price=float(row[TRADE_EXIT]),
+                quantity=float(row[TRADE_QTY]),
+                pnl=float(row[TRADE_PNL]),
+            )
+            for row in trade_log
+        ]
+    
+    async def load_data(self, symbols: List[str]) -> Dict[str, Any]:
+        """Load historical data as one [T, N] float64 array per field"""
+        from infrastructure.cache.redis_client import RedisCache
         from infrastructure.external.data_providers.yahoo_finance import YahooFinanceProvider
         
-        provider = YahooFinanceProvider()
+        period = "max" if self.start_date else "5y"
         
-        all_data = {}
-        for symbol in symbols:
-            hist = await provider.get_history(
-                symbol,
-                period="5y" if not self.start_date else None,
+        # Same keys as MarketDataService.get_historical, so both share entries
+        cache = RedisCache()
+        keys = {symbol: f"history:{symbol}:{period}:1d" for symbol in symbols}
+        cached = await cache.mget(list(keys.values()))
+        histories = {s: h for s, h in zip(keys, cached) if h is not None}
+        
+        missing = [symbol for symbol in keys if symbol not in histories]
+        if missing:
+            provider = YahooFinanceProvider()
+            
+            fetched = dict(zip(missing, await asyncio.gather(*(
+                provider.get_history(symbol, period=period) for symbol in missing
+            ))))
+            
+            await cache.set_many(
+                {keys[symbol]: hist for symbol, hist in fetched.items()},
+                ttl=HISTORY_CACHE_TTL,
             )
-            all_data[symbol] = hist
+            histories.update(fetched)
         
-        # Combine into DataFrame
-        df = pd.concat(all_data, axis=1)
-        return df
+        frames = [
+            pd.DataFrame.from_records(histories[symbol], index="date")
+            for symbol in symbols
+        ]
+        return self._to_columnar(frames, symbols)
+    
+    def _to_columnar(self, frames: List[pd.DataFrame], symbols: List[str]) -> Dict[str, Any]:
+        """
+        Align per-symbol frames on common dates and stack each field into a
+        contiguous [T, N] array (no MultiIndex frame in between)
+        """
+        # ISO date strings sort chronologically
+        index = reduce(pd.Index.union, (frame.index for frame in frames)).sort_values()
+        frames = [frame.reindex(index).ffill() for frame in frames]
+        
+        # Keep dates where every symbol has a price, within the requested window
+        keep = np.logical_and.reduce([frame.notna().all(axis=1).to_numpy() for frame in frames])
+        day = index.str[:10]
+        if self.start_date:
+            keep &= day >= self.start_date[:10]
+        if self.end_date:
+            keep &= day <= self.end_date[:10]
+        
+        bars = {
+            "timestamps": index.to_numpy()[keep],
+            "symbols": list(symbols),
+        }
+        for field in FIELDS:
+            bars[field] = np.column_stack(
+                [frame[field].to_numpy(dtype=np.float64) for frame in frames]
+            )[keep]
+        return bars
     
     def _calculate_metrics(self) -> Dict[str, Any]:
         """Calculate performance metrics"""
         from backtest.metrics.performance import PerformanceMetrics
         
         equity_curve = self.portfolio_handler.equity_curve
-        trades = self.portfolio_handler.trades
+        trades = [asdict(t) for t in self.portfolio_handler.trades]
         
         metrics = PerformanceMetrics.calculate_all(equity_curve, trades)
         
+        final_capital = float(equity_curve[-1])
         return {
             "initial_capital": self.initial_capital,
-            "final_capital": equity_curve[-1],
-            "total_return": (equity_curve[-1] - self.initial_capital) / self.initial_capital,
+            "final_capital": final_capital,
+            "total_return": (final_capital - self.initial_capital) / self.initial_capital,
             **metrics,
             "trades": trades,
-            "equity_curve": equity_curve,
+            "equity_curve": equity_curve.tolist(),
         }
@@ -3,10 +3,16 @@ Order execution simulation
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
+import numpy as np
 
-@dataclass
+# Compact batch of market orders: one record per order, signed quantity
+# (+buy, -sell) against a column of the engine's price arrays
+SIGNAL_DTYPE = np.dtype([("symbol_idx", np.int32), ("quantity", np.float64)])
+
+
+@dataclass(slots=True, frozen=True)
 class Signal:
     """Trading signal"""
     symbol: str
@@ -14,9 +20,10 @@ class Signal:
     quantity: float
     order_type: str = "market"  # market, limit
     limit_price: Optional[float] = None
+    symbol_idx: Optional[int] = None  # Column in the engine's price arrays
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Fill:
     """Order fill"""
     symbol: str
@@ -25,6 +32,7 @@ class Fill:
     price: float
     commission: float
     timestamp: Any
+    symbol_idx: int = -1
 
 
 class ExecutionHandler:
@@ -34,11 +42,50 @@ class ExecutionHandler:
         self.commission = commission
         self.slippage = slippage
     
-    def execute(self, signal: Signal, market_data: Dict) -> Optional[Fill]:
-        """Execute signal and return fill"""
+    def execute_array(
+        self,
+        signals: np.ndarray,
+        close_row: np.ndarray,
+        symbols: Sequence[str],
+        timestamp: Any = None,
+    ) -> List[Fill]:
+        """Fill a SIGNAL_DTYPE batch of market orders with vectorized pricing"""
+        idx = signals["symbol_idx"]
+        buy = signals["quantity"] > 0
+        quantity = np.abs(signals["quantity"])
+        
+        # Slippage: worse price for the buyer, and for the seller
+        fill_price = close_row[idx] * np.where(buy, 1 + self.slippage, 1 - self.slippage)
+        commission = fill_price * quantity * self.commission
+        
+        return [
+            Fill(
+                symbol=symbols[j],
+                direction="buy" if is_buy else "sell",
+                quantity=q,
+                price=price,
+                commission=fee,
+                timestamp=timestamp,
+                symbol_idx=j,
+            )
+            for j, is_buy, q, price, fee in zip(
+                idx.tolist(), buy.tolist(), quantity.tolist(),
+                fill_price.tolist(), commission.tolist(),
+            )
+        ]
+    
+    def execute(
+        self,
+        signal: Signal,
+        close_row: np.ndarray,
+        symbol_idx: Dict[str, int],
+        timestamp: Any = None,
+    ) -> Optional[Fill]:
+        """Execute signal against the current bar's closes and return fill"""
         # Get current price
         if signal.order_type == "market":
-            base_price = market_data.get("close", 0)
+            j = signal.symbol_idx if signal.symbol_idx is not None else symbol_idx[signal.symbol]
+            base_price = float(close_row[j])
             
             # Apply slippage (worse price for buyer)
             if signal.direction == "buy":
@@ -56,7 +103,8 @@ class ExecutionHandler:
                 quantity=signal.quantity,
                 price=fill_price,
                 commission=commission,
-                timestamp=market_data.get("timestamp"),
+                timestamp=timestamp,
+                symbol_idx=j,
             )
         
         elif signal.order_type == "limit":
@@ -0,0 +1,90 @@
+"""
+Compiled backtest kernel for strategies with precomputed signals
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+# Columns of the trade log returned by run_backtest_kernel
+TRADE_SYMBOL, TRADE_BAR, TRADE_ENTRY, TRADE_EXIT, TRADE_QTY, TRADE_PNL = range(6)
+
+
+@njit(cache=True, fastmath=True)
+def run_backtest_kernel(
+    close: np.ndarray,
+    signals: np.ndarray,
+    commission: float,
+    slippage: float,
+    initial_capital: float,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Execute, update and mark to market every bar in one compiled loop
+
+    Mirrors ExecutionHandler/PortfolioHandler for market orders.
+    ``signals[i, j]`` is a signed quantity (+buy, -sell) for symbol j at bar i.
+
+    Returns:
+        equity_curve of length T + 1 (initial capital first) and a trade log
+        with one row per completed exit (see TRADE_* columns)
+    """
+    T, N = close.shape
+    pos_qty = np.zeros(N)
+    pos_avg_px = np.zeros(N)
+    cash = initial_capital
+    
+    equity_curve = np.empty(T + 1)
+    equity_curve[0] = initial_capital
+    
+    # A trade closes on a sell, so sells bound the log size
+    max_trades = 0
+    for i in range(T):
+        for j in range(N):
+            if signals[i, j] < 0:
+                max_trades += 1
+    trades = np.empty((max_trades, 6))
+    n_trades = 0
+    
+    for i in range(T):
+        for j in range(N):
+            qty = signals[i, j]
+            if qty == 0:
+                continue
+            
+            if qty > 0:
+                price = close[i, j] * (1 + slippage)
+                fee = price * qty * commission
+                if pos_qty[j] != 0:
+                    total_qty = pos_qty[j] + qty
+                    pos_avg_px[j] = (pos_qty[j] * pos_avg_px[j] + qty * price) / total_qty
+                    pos_qty[j] = total_qty
+                else:
+                    pos_qty[j] = qty
+                    pos_avg_px[j] = price
+                cash -= price * qty + fee
+            
+            elif pos_qty[j] != 0:
+                qty = -qty
+                price = close[i, j] * (1 - slippage)
+                fee = price * qty * commission
+                if pos_qty[j] == qty:
+                    trades[n_trades, TRADE_SYMBOL] = j
+                    trades[n_trades, TRADE_BAR] = i
+                    trades[n_trades, TRADE_ENTRY] = pos_avg_px[j]
+                    trades[n_trades, TRADE_EXIT] = price
+                    trades[n_trades, TRADE_QTY] = qty
+                    trades[n_trades, TRADE_PNL] = (price - pos_avg_px[j]) * qty - fee
+                    n_trades += 1
+                    pos_qty[j] = 0.0
+                    pos_avg_px[j] = 0.0
+                else:
+                    pos_qty[j] -= qty
+                cash += price * qty - fee
+        
+        position_value = 0.0
+        for j in range(N):
+            position_value += pos_qty[j] * close[i, j]
+        equity_curve[i + 1] = cash + position_value
+    
+    return equity_curve, trades[:n_trades]
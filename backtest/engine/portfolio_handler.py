@@ -2,19 +2,22 @@
 Portfolio tracking during backtest
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Dict, List
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Position:
     """Backtest position"""
     symbol: str
     quantity: float
     avg_price: float
+    symbol_idx: int = -1
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Completed trade"""
     symbol: str
@@ -27,70 +30,89 @@ class Trade:
 
 
 class PortfolioHandler:
-    """Track portfolio during backtest"""
+    """
+    Track portfolio during backtest
+    
+    Positions are stored as arrays aligned with the engine's symbol columns
+    (structure of arrays), so marking to market is one dot product per bar.
+    """
     
     def __init__(self, initial_capital: float):
         self.initial_capital = initial_capital
         self.cash = initial_capital
-        self.positions: Dict[str, Position] = {}
+        self.symbol_idx: Dict[str, int] = {}
+        self.pos_qty = np.zeros(0)
+        self.pos_avg_px = np.zeros(0)
         self.trades: List[Trade] = []
-        self.equity_curve: List[float] = [initial_capital]
+        self.equity_curve = np.array([initial_capital], dtype=np.float64)
         self.current_equity = initial_capital
     
+    def prepare(self, n_bars: int, symbol_idx: Dict[str, int]):
+        """Size position buffers and the equity curve once the data is known"""
+        self.symbol_idx = symbol_idx
+        self.pos_qty = np.zeros(len(symbol_idx))
+        self.pos_avg_px = np.zeros(len(symbol_idx))
+        self.equity_curve = np.empty(n_bars + 1)
+        self.equity_curve[0] = self.initial_capital
+    
+    @property
+    def positions(self) -> Dict[str, Position]:
+        """Open positions by symbol"""
+        symbols = list(self.symbol_idx)
+        return {
+            symbols[j]: Position(
+                symbol=symbols[j],
+                quantity=float(self.pos_qty[j]),
+                avg_price=float(self.pos_avg_px[j]),
+                symbol_idx=int(j),
+            )
+            for j in np.flatnonzero(self.pos_qty)
+        }
+    
     def update(self, fill):
         """Update portfolio with fill"""
-        symbol = fill.symbol
+        j = fill.symbol_idx if fill.symbol_idx >= 0 else self.symbol_idx[fill.symbol]
+        qty = self.pos_qty[j]
         
         if fill.direction == "buy":
             # Update or create position
-            if symbol in self.positions:
-                pos = self.positions[symbol]
-                total_cost = pos.quantity * pos.avg_price + fill.quantity * fill.price
-                total_qty = pos.quantity + fill.quantity
-                pos.avg_price = total_cost / total_qty
-                pos.quantity = total_qty
+            if qty != 0:
+                total_qty = qty + fill.quantity
+                self.pos_avg_px[j] = (qty * self.pos_avg_px[j] + fill.quantity * fill.price) / total_qty
+                self.pos_qty[j] = total_qty
             else:
-                self.positions[symbol] = Position(
-                    symbol=symbol,
-                    quantity=fill.quantity,
-                    avg_price=fill.price,
-                )
+                self.pos_qty[j] = fill.quantity
+                self.pos_avg_px[j] = fill.price
             
             # Deduct cash
             self.cash -= (fill.price * fill.quantity + fill.commission)
         
         else:  # sell
-            if symbol in self.positions:
-                pos = self.positions[symbol]
-                
+            if qty != 0:
                 # Record trade
-                if pos.quantity == fill.quantity:
+                if qty == fill.quantity:
                     # Complete exit
-                    pnl = (fill.price - pos.avg_price) * fill.quantity - fill.commission
+                    avg_price = float(self.pos_avg_px[j])
+                    pnl = (fill.price - avg_price) * fill.quantity - fill.commission
                     self.trades.append(Trade(
-                        symbol=symbol,
+                        symbol=fill.symbol,
                         entry_date=None,  # Would track
                         exit_date=fill.timestamp,
-                        entry_price=pos.avg_price,
+                        entry_price=avg_price,
                         exit_price=fill.price,
                         quantity=fill.quantity,
                         pnl=pnl,
                     ))
-                    del self.positions[symbol]
+                    self.pos_qty[j] = 0.0
+                    self.pos_avg_px[j] = 0.0
                 else:
                     # Partial exit
-                    pos.quantity -= fill.quantity
+                    self.pos_qty[j] -= fill.quantity
                 
                 # Add cash
                 self.cash += (fill.price * fill.quantity - fill.commission)
     
-    def mark_to_market(self, timestamp, market_data):
-        """Update portfolio value with current prices"""
-        position_value = 0
-        
-        for symbol, position in self.positions.items():
-            current_price = market_data.get((symbol, "close"), position.avg_price)
-            position_value += position.quantity * current_price
-        
-        self.current_equity = self.cash + position_value
-        self.equity_curve.append(self.current_equity)
+    def mark_to_market(self, i: int, close_row: np.ndarray):
+        """Record equity after bar i from the bar's closes"""
+        self.current_equity = self.cash + float(self.pos_qty @ close_row)
+        self.equity_curve[i + 1] = self.current_equity
@@ -0,0 +1,176 @@
+"""
+Rolling indicators over [T, N] price arrays (one column per symbol)
+
+Each indicator is computed once for every bar and symbol, so strategies
+precompute in on_init instead of re-scanning history on each bar.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Tuple
+
+import numpy as np
+from numba import njit
+
+# Below this many cells one thread beats the cost of fanning out
+PARALLEL_MIN_CELLS = 1 << 20
+
+
+# Kernels release the GIL and work column by column, so column blocks can
+# run on plain threads (see _by_column_blocks). The wrappers pass
+# column-major arrays so each block is one contiguous slab.
+# No fastmath: rows before a full window are NaN by design
+@njit(cache=True, nogil=True)
+def _rolling_mean(values: np.ndarray, window: int, out: np.ndarray) -> None:
+    """Running-sum trailing mean of each column into out"""
+    T, N = values.shape
+    for j in range(N):
+        total = 0.0
+        for i in range(T):
+            total += values[i, j]
+            if i >= window:
+                total -= values[i - window, j]
+            out[i, j] = total / window if i >= window - 1 else np.nan
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_spread(
+    values: np.ndarray,
+    short_window: int,
+    long_window: int,
+    out: np.ndarray,
+) -> None:
+    """Short minus long trailing mean of each column, both sums in one pass"""
+    T, N = values.shape
+    warmup = max(short_window, long_window) - 1
+    for j in range(N):
+        short_total = 0.0
+        long_total = 0.0
+        for i in range(T):
+            x = values[i, j]
+            short_total += x
+            long_total += x
+            if i >= short_window:
+                short_total -= values[i - short_window, j]
+            if i >= long_window:
+                long_total -= values[i - long_window, j]
+            if i >= warmup:
+                out[i, j] = short_total / short_window - long_total / long_window
+            else:
+                out[i, j] = np.nan
+
+
+@njit(cache=True, nogil=True)
+def _rolling_mean_std(
+    values: np.ndarray,
+    window: int,
+    ddof: int,
+    mean: np.ndarray,
+    std: np.ndarray,
+) -> None:
+    """Welford trailing mean/std of each column, swapping one value per bar"""
+    T, N = values.shape
+    for j in range(N):
+        m = 0.0
+        m2 = 0.0
+        for i in range(T):
+            x = values[i, j]
+            if i < window:
+                # Filling the first window: plain Welford update
+                delta = x - m
+                m += delta / (i + 1)
+                m2 += delta * (x - m)
+            elif i % window == 0:
+                # Re-anchor once per window length (two-pass over the
+                # window) so rounding in the swaps can't accumulate
+                m = 0.0
+                for k in range(i - window + 1, i + 1):
+                    m += values[k, j]
+                m /= window
+                m2 = 0.0
+                for k in range(i - window + 1, i + 1):
+                    m2 += (values[k, j] - m) ** 2
+            else:
+                # Full window: replace the oldest value with x
+                old = values[i - window, j]
+                m_prev = m
+                m += (x - old) / window
+                m2 += (x - old) * (x - m + old - m_prev)
+            
+            if i >= window - 1:
+                mean[i, j] = m
+                std[i, j] = np.sqrt(max(m2, 0.0) / (window - ddof))
+            else:
+                mean[i, j] = np.nan
+                std[i, j] = np.nan
+
+
+def _by_column_blocks(kernel: Callable, values: np.ndarray, *args) -> None:
+    """
+    Run a column-wise kernel over [T, N] Fortran arrays, splitting the
+    columns across threads when the input is large
+    
+    args are scalars followed by the output arrays, which are sliced into
+    the same column blocks. Threads rather than numba's parallel layer:
+    this is called from asyncio worker threads and before forking grid
+    search workers, where the threading layers hang or abort.
+    """
+    n_blocks = min(os.cpu_count() or 1, values.shape[1])
+    if values.size < PARALLEL_MIN_CELLS or n_blocks <= 1:
+        kernel(values, *args)
+        return
+    
+    bounds = np.linspace(0, values.shape[1], n_blocks + 1).astype(np.int64)
+    
+    def run_block(b: int) -> None:
+        cols = slice(bounds[b], bounds[b + 1])
+        kernel(values[:, cols], *(a[:, cols] if isinstance(a, np.ndarray) else a for a in args))
+    
+    with ThreadPoolExecutor(max_workers=n_blocks) as pool:
+        list(pool.map(run_block, range(n_blocks)))
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing mean over axis 0 of a [T, N] array; rows before a full window are NaN"""
+    out = np.empty(values.shape, order="F")
+    _by_column_blocks(_rolling_mean, np.asfortranarray(values, dtype=np.float64), window, out)
+    return out
+
+
+def rolling_mean_spread(values: np.ndarray, short_window: int, long_window: int) -> np.ndarray:
+    """
+    rolling_mean(values, short_window) - rolling_mean(values, long_window)
+    in one pass, without materializing either average
+    """
+    out = np.empty(values.shape, order="F")
+    _by_column_blocks(
+        _rolling_mean_spread,
+        np.asfortranarray(values, dtype=np.float64),
+        short_window,
+        long_window,
+        out,
+    )
+    return out
+
+
+def rolling_mean_std(
+    values: np.ndarray,
+    window: int,
+    ddof: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Trailing mean and standard deviation over axis 0 of a [T, N] array
+    
+    One compiled pass per column, O(T * N) whatever the window; rows
+    before a full window (or windows no larger than ddof) are NaN.
+    """
+    mean = np.empty(values.shape, order="F")
+    std = np.empty(values.shape, order="F")
+    if window <= ddof:
+        mean.fill(np.nan)
+        std.fill(np.nan)
+        return mean, std
+    _by_column_blocks(
+        _rolling_mean_std, np.asfortranarray(values, dtype=np.float64), window, ddof, mean, std
+    )
+    return mean, std
@@ -5,7 +5,37 @@ Performance calculation metrics
 from typing import Any, Dict, List
 
 import numpy as np
-import pandas as pd
+from numba import njit
+
+
+@njit(cache=True)
+def _return_moments(returns: np.ndarray):
+    """
+    Welford pass over returns: count, mean and M2 of all returns plus count
+    and M2 of the negative ones, numerically stable on long curves
+    """
+    n = 0
+    mean = 0.0
+    m2 = 0.0
+    n_down = 0
+    down_mean = 0.0
+    down_m2 = 0.0
+    for r in returns:
+        n += 1
+        delta = r - mean
+        mean += delta / n
+        m2 += delta * (r - mean)
+        if r < 0:
+            n_down += 1
+            delta = r - down_mean
+            down_mean += delta / n_down
+            down_m2 += delta * (r - down_mean)
+    return n, mean, m2, n_down, down_m2
+
+
+def _std(m2: float, n: int) -> float:
+    """Sample standard deviation from Welford's M2 (ddof=1, like pandas)"""
+    return float(np.sqrt(m2 / (n - 1))) if n > 1 else 0.0
 
 
 class PerformanceMetrics:
@@ -16,26 +46,45 @@ class PerformanceMetrics:
         equity_curve: List[float],
         trades: List[Dict],
     ) -> Dict[str, Any]:
-        """Calculate all metrics"""
-        returns = pd.Series(equity_curve).pct_change().dropna()
+        """Calculate all metrics from one pass over the equity curve"""
+        eq = np.asarray(equity_curve, dtype=np.float64)
+        rets = np.diff(eq) / eq[:-1]
+        
+        n, mean, m2, n_down, down_m2 = _return_moments(rets)
+        std = _std(m2, n)
+        downside_std = _std(down_m2, n_down)
+        peak = np.maximum.accumulate(eq)
+        max_dd = PerformanceMetrics._max_dd(eq, peak)
         
         metrics = {
-            "sharpe_ratio": PerformanceMetrics.sharpe_ratio(returns),
-            "sortino_ratio": PerformanceMetrics.sortino_ratio(returns),
-            "max_drawdown": PerformanceMetrics.max_drawdown(equity_curve),
-            "calmar_ratio": PerformanceMetrics.calmar_ratio(returns, equity_curve),
-            "volatility": returns.std() * np.sqrt(252),
-            "total_trades": len(trades),
-            "winning_trades": len([t for t in trades if t.get("pnl", 0) > 0]),
-            "losing_trades": len([t for t in trades if t.get("pnl", 0) < 0]),
+            "sharpe_ratio": PerformanceMetrics._sharpe(mean, std),
+            "sortino_ratio": PerformanceMetrics._sortino(mean, downside_std),
+            "max_drawdown": max_dd,
+            "calmar_ratio": PerformanceMetrics._calmar(mean, max_dd),
+            "volatility": std * np.sqrt(252),
         }
         
+        # Trade statistics from one scan of the PnLs
+        pnls = np.fromiter(
+            (t.get("pnl", 0.0) for t in trades),
+            dtype=np.float64,
+            count=len(trades),
+        )
+        win_mask = pnls > 0
+        loss_mask = pnls < 0
+        wins = int(win_mask.sum())
+        losses = int(loss_mask.sum())
+        
+        metrics["total_trades"] = len(trades)
+        metrics["winning_trades"] = wins
+        metrics["losing_trades"] = losses
+        
         if metrics["total_trades"] > 0:
-            metrics["win_rate"] = metrics["winning_trades"] / metrics["total_trades"]
+            metrics["win_rate"] = wins / metrics["total_trades"]
             
-            avg_win = np.mean([t["pnl"] for t in trades if t.get("pnl", 0) > 0]) if metrics["winning_trades"] > 0 else 0
-            avg_loss = np.mean([t["pnl"] for t in trades if t.get("pnl", 0) < 0]) if metrics["losing_trades"] > 0 else 1
-            metrics["profit_factor"] = abs(avg_win / avg_loss) if avg_loss != 0 else 0
+            avg_win = float(pnls[win_mask].mean()) if wins else 0.0
+            avg_loss = float(pnls[loss_mask].mean()) if losses else 1.0
+            metrics["profit_factor"] = abs(avg_win / avg_loss)
         else:
             metrics["win_rate"] = 0
             metrics["profit_factor"] = 0
@@ -43,32 +92,51 @@ class PerformanceMetrics:
         return metrics
     
     @staticmethod
-    def sharpe_ratio(returns: pd.Series, risk_free: float = 0.04) -> float:
+    def _sharpe(mean: float, std: float, risk_free: float = 0.04) -> float:
+        """Annualized Sharpe ratio from precomputed return moments"""
+        if std == 0:
+            return 0.0
+        return float(np.sqrt(252) * (mean - risk_free / 252) / std)
+    
+    @staticmethod
+    def _sortino(mean: float, downside_std: float, risk_free: float = 0.04) -> float:
+        """Sortino ratio from precomputed return moments"""
+        if downside_std == 0:
+            return 0.0
+        return float(np.sqrt(252) * (mean - risk_free / 252) / downside_std)
+    
+    @staticmethod
+    def _max_dd(eq: np.ndarray, peak: np.ndarray) -> float:
+        """Maximum drawdown given the running peak"""
+        return float(np.min((eq - peak) / peak))
+    
+    @staticmethod
+    def _calmar(mean: float, max_dd: float) -> float:
+        """Calmar ratio from mean daily return and maximum drawdown"""
+        annual_return = mean * 252
+        max_dd = abs(max_dd)
+        return float(annual_return / max_dd) if max_dd > 0 else 0.0
+    
+    @staticmethod
+    def sharpe_ratio(returns: np.ndarray, risk_free: float = 0.04) -> float:
         """Annualized Sharpe ratio"""
-        excess = returns - risk_free / 252
-        if excess.std() == 0:
-            return 0
-        return np.sqrt(252) * excess.mean() / excess.std()
+        n, mean, m2, _, _ = _return_moments(np.asarray(returns, dtype=np.float64))
+        return PerformanceMetrics._sharpe(mean, _std(m2, n), risk_free)
     
     @staticmethod
-    def sortino_ratio(returns: pd.Series, risk_free: float = 0.04) -> float:
+    def sortino_ratio(returns: np.ndarray, risk_free: float = 0.04) -> float:
         """Sortino ratio"""
-        excess = returns - risk_free / 252
-        downside = returns[returns < 0]
-        if len(downside) == 0 or downside.std() == 0:
-            return 0
-        return np.sqrt(252) * excess.mean() / downside.std()
+        _, mean, _, n_down, down_m2 = _return_moments(np.asarray(returns, dtype=np.float64))
+        return PerformanceMetrics._sortino(mean, _std(down_m2, n_down), risk_free)
     
     @staticmethod
     def max_drawdown(equity_curve: List[float]) -> float:
         """Maximum drawdown"""
-        peak = np.maximum.accumulate(equity_curve)
-        drawdown = (np.array(equity_curve) - peak) / peak
-        return float(np.min(drawdown))
+        eq = np.asarray(equity_curve, dtype=np.float64)
+        return PerformanceMetrics._max_dd(eq, np.maximum.accumulate(eq))
     
     @staticmethod
-    def calmar_ratio(returns: pd.Series, equity_curve: List[float]) -> float:
+    def calmar_ratio(returns: np.ndarray, equity_curve: List[float]) -> float:
         """Calmar ratio"""
-        annual_return = returns.mean() * 252
-        max_dd = abs(PerformanceMetrics.max_drawdown(equity_curve))
-        return annual_return / max_dd if max_dd > 0 else 0
+        mean = float(np.mean(returns)) if len(returns) else 0.0
+        return PerformanceMetrics._calmar(mean, PerformanceMetrics.max_drawdown(equity_curve))
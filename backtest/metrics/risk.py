@@ -3,32 +3,86 @@ Risk metrics for backtests
 """
 
 import numpy as np
+from numba import njit
 from scipy import stats
 
+from quant.risk.tail import lower_quantile, tail_mean
+
+
+# nogil without parallel=True: numba's workqueue layer aborts when threads
+# (asyncio.to_thread, Celery) enter parallel regions concurrently
+@njit(cache=True, nogil=True, fastmath=True)
+def betas_vec(R: np.ndarray, m: np.ndarray) -> np.ndarray:
+    """
+    Beta of each column of R against m, one fused pass per column
+
+    Keeps the previous definition: sample covariance (ddof=1, as np.cov)
+    over population market variance (ddof=0, as np.var).
+    """
+    T, N = R.shape
+    mm = m.mean()
+    dm = m - mm
+    var_m = (dm * dm).mean()
+    out = np.empty(N)
+    for j in range(N):
+        col = R[:, j]
+        rm = col.mean()
+        cov = ((col - rm) * dm).sum() / (T - 1)
+        out[j] = cov / var_m if var_m > 0 else 0.0
+    return out
+
+
+# Lower-tail z-scores for the usual confidence levels (skips scipy per call)
+_Z_CACHE = {
+    0.95: -1.6448536269514722,
+    0.975: -1.959963984540054,
+    0.99: -2.3263478740408408,
+}
+
 
 class RiskMetrics:
     """Calculate risk metrics"""
     
     @staticmethod
-    def value_at_risk(returns: np.ndarray, confidence: float = 0.95) -> float:
-        """Parametric VaR"""
+    def value_at_risk(
+        returns: np.ndarray,
+        confidence: float = 0.95,
+        method: str = "parametric",
+    ) -> float:
+        """VaR as a return: parametric (normal) or historical (empirical quantile)"""
+        returns = np.asarray(returns, dtype=np.float64)
+        if method == "historical":
+            return lower_quantile(returns, 1 - confidence)
+        
         mean = np.mean(returns)
         std = np.std(returns)
-        z_score = stats.norm.ppf(1 - confidence)
+        z_score = _Z_CACHE.get(confidence)
+        if z_score is None:
+            z_score = stats.norm.ppf(1 - confidence)
         return mean + z_score * std
     
     @staticmethod
     def cvar(returns: np.ndarray, confidence: float = 0.95) -> float:
         """Conditional VaR (Expected Shortfall)"""
+        returns = np.asarray(returns, dtype=np.float64)
         var = RiskMetrics.value_at_risk(returns, confidence)
-        return np.mean(returns[returns <= var])
+        # One compiled pass instead of a boolean mask plus a copy
+        tail, _ = tail_mean(returns, var)
+        return tail
     
     @staticmethod
     def beta(returns: np.ndarray, market_returns: np.ndarray) -> float:
         """Calculate beta"""
-        covariance = np.cov(returns, market_returns)[0][1]
-        market_variance = np.var(market_returns)
-        return covariance / market_variance if market_variance > 0 else 0
+        returns = np.asarray(returns, dtype=np.float64)
+        return float(RiskMetrics.betas(returns[:, None], market_returns)[0])
+    
+    @staticmethod
+    def betas(returns: np.ndarray, market_returns: np.ndarray) -> np.ndarray:
+        """Beta of every column of a [T, N] returns matrix in one pass"""
+        return betas_vec(
+            np.ascontiguousarray(returns, dtype=np.float64),
+            np.ascontiguousarray(market_returns, dtype=np.float64),
+        )
     
     @staticmethod
     def alpha(
@@ -37,6 +91,19 @@ class RiskMetrics:
         risk_free: float = 0.04,
     ) -> float:
         """Calculate Jensen's alpha"""
-        beta = RiskMetrics.beta(returns, market_returns)
-        alpha = np.mean(returns) - (risk_free / 252 + beta * (np.mean(market_returns) - risk_free / 252))
-        return alpha * 252  # Annualize
+        returns = np.asarray(returns, dtype=np.float64)
+        return float(RiskMetrics.alphas(returns[:, None], market_returns, risk_free)[0])
+    
+    @staticmethod
+    def alphas(
+        returns: np.ndarray,
+        market_returns: np.ndarray,
+        risk_free: float = 0.04,
+    ) -> np.ndarray:
+        """Jensen's alpha of every column of a [T, N] returns matrix"""
+        returns = np.asarray(returns, dtype=np.float64)
+        market_returns = np.asarray(market_returns, dtype=np.float64)
+        betas = RiskMetrics.betas(returns, market_returns)
+        rf = risk_free / 252
+        alphas = returns.mean(axis=0) - (rf + betas * (market_returns.mean() - rf))
+        return alphas * 252  # Annualize
@@ -2,11 +2,89 @@
 Grid search optimization
 """
 
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from itertools import product
-from typing import Any, Dict, List
+from math import prod
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 
+# Price data for the current worker process, set once by _init_worker
+_worker_bars: Optional[Dict[str, Any]] = None
+# Keeps the worker's shared-memory mappings alive as long as the views
+_worker_shm: List[SharedMemory] = []
+
+# name, shape and dtype of one array placed in shared memory
+SharedArraySpec = Tuple[str, Tuple[int, ...], str]
+
+
+def _share_arrays(
+    bars: Dict[str, Any],
+) -> Tuple[Dict[str, Any], Dict[str, SharedArraySpec], List[SharedMemory]]:
+    """Move the numeric [T, N] arrays into shared memory blocks"""
+    rest, specs, blocks = {}, {}, []
+    for key, value in bars.items():
+        if not (isinstance(value, np.ndarray) and value.dtype.kind in "fiub"):
+            rest[key] = value
+            continue
+        shm = SharedMemory(create=True, size=max(value.nbytes, 1))
+        blocks.append(shm)
+        np.ndarray(value.shape, dtype=value.dtype, buffer=shm.buf)[...] = value
+        specs[key] = (shm.name, value.shape, value.dtype.str)
+    return rest, specs, blocks
+
+
+def _init_worker(rest: Dict[str, Any], specs: Dict[str, SharedArraySpec]) -> None:
+    """
+    Map the parent's price arrays once per worker instead of once per task
+    
+    Numeric arrays are views on shared memory (never written to), so
+    workers don't each hold a pickled copy; timestamps and symbols are
+    pickled as before.
+    """
+    global _worker_bars
+    _worker_bars = dict(rest)
+    for key, (name, shape, dtype) in specs.items():
+        shm = SharedMemory(name=name)
+        _worker_shm.append(shm)
+        # Left writeable: numba compiles readonly arrays as a separate type
+        _worker_bars[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _run_one(
+    combo: Tuple[Any, ...],
+    keys: List[str],
+    strategy_class,
+    symbols: List[str],
+    start_date: str,
+    end_date: str,
+    bars: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Backtest one parameter set (module-level so worker processes can pickle it)"""
+    from backtest.engine.backtest_engine import BacktestEngine
+    
+    params = dict(zip(keys, combo))
+    engine = BacktestEngine(
+        strategy=strategy_class(**params),
+        start_date=start_date,
+        end_date=end_date,
+    )
+    result = asyncio.run(engine.run(
+        symbols,
+        prefetched_data=bars if bars is not None else _worker_bars,
+    ))
+    
+    return {
+        "parameters": params,
+        "sharpe_ratio": result.get("sharpe_ratio", 0),
+        "total_return": result.get("total_return", 0),
+        "max_drawdown": result.get("max_drawdown", 0),
+    }
+
 
 class GridSearchOptimizer:
     """Grid search for strategy parameters"""
@@ -15,9 +93,11 @@ class GridSearchOptimizer:
         self,
         strategy_class,
         param_grid: Dict[str, List[Any]],
+        n_jobs: Optional[int] = None,
     ):
         self.strategy_class = strategy_class
         self.param_grid = param_grid
+        self.n_jobs = n_jobs or os.cpu_count() or 1
     
     async def optimize(
         self,
@@ -26,33 +106,62 @@ class GridSearchOptimizer:
         end_date: str,
     ) -> tuple:
         """Run grid search"""
-        # Generate all parameter combinations
+        from backtest.engine.backtest_engine import BacktestEngine
+        
+        # Parameter combinations stay a lazy product of value tuples;
+        # workers zip them with the keys
         keys = list(self.param_grid.keys())
         values = list(self.param_grid.values())
-        combinations = list(product(*values))
+        n_combinations = prod(len(v) for v in values)
+        
+        # Fetch prices once for the whole grid, not once per combination
+        loader = BacktestEngine(strategy=None, start_date=start_date, end_date=end_date)
+        bars = await loader.load_data(symbols)
         
-        results = []
+        run = partial(
+            _run_one,
+            keys=keys,
+            strategy_class=self.strategy_class,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+        )
         
-        for combo in combinations:
-            params = dict(zip(keys, combo))
-            
-            # Create and run backtest
-            strategy = self.strategy_class(**params)
-            
-            from backtest.engine.backtest_engine import BacktestEngine
-            engine = BacktestEngine(strategy=strategy)
-            
-            result = await engine.run(symbols)
-            
-            results.append({
-                "parameters": params,
-                "sharpe_ratio": result.get("sharpe_ratio", 0),
-                "total_return": result.get("total_return", 0),
-                "max_drawdown": result.get("max_drawdown", 0),
-            })
+        n_jobs = min(self.n_jobs, n_combinations)
+        if n_jobs <= 1:
+            results = [
+                await asyncio.to_thread(run, combo, bars=bars) for combo in product(*values)
+            ]
+        else:
+            # Backtests are CPU-bound: fan out across processes, not threads
+            results = await asyncio.to_thread(
+                self._map, run, product(*values), n_combinations, n_jobs, bars
+            )
         
         # Find best
         best = max(results, key=lambda x: x["sharpe_ratio"])
         
         return best["parameters"], results
-      
+    
+    @staticmethod
+    def _map(
+        run,
+        combinations: Iterable[Tuple[Any, ...]],
+        n_combinations: int,
+        n_jobs: int,
+        bars: Dict[str, Any],
+    ) -> List[Dict[str, Any]]:
+        """Evaluate combinations in a process pool, preserving order"""
+        chunksize = max(1, n_combinations // (4 * n_jobs))
+        rest, specs, blocks = _share_arrays(bars)
+        try:
+            with ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_init_worker,
+                initargs=(rest, specs),
+            ) as pool:
+                return list(pool.map(run, combinations, chunksize=chunksize))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
@@ -3,9 +3,11 @@ Base strategy class
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
-from backtest.engine.execution_handler import Signal
+import numpy as np
+
+from backtest.engine.execution_handler import SIGNAL_DTYPE, Signal
 
 
 class BaseStrategy(ABC):
@@ -14,11 +16,27 @@ class BaseStrategy(ABC):
     def __init__(self, **kwargs):
         self.parameters = kwargs
         self.data = None
+        self.symbols: Tuple[str, ...] = ()
+        self.symbol_idx: Dict[str, int] = {}
+        self.close: Optional[np.ndarray] = None
         self.initialized = False
     
-    def initialize(self, data: Any):
-        """Initialize with historical data"""
+    def initialize(self, data: Dict[str, Any]):
+        """Initialize with columnar bars ([T, N] arrays per field)"""
+        # Validate once here so on_bar needs no per-bar guards
+        close = data.get("close")
+        if not isinstance(close, np.ndarray) or close.ndim != 2:
+            raise ValueError("Bars need a [T, N] 'close' array")
+        if close.shape[1] != len(data["symbols"]):
+            raise ValueError(
+                f"'close' has {close.shape[1]} columns for {len(data['symbols'])} symbols"
+            )
+        
         self.data = data
+        # Symbol order and column lookup are fixed for the run: build once
+        self.symbols = tuple(data["symbols"])
+        self.symbol_idx = {symbol: j for j, symbol in enumerate(self.symbols)}
+        self.close = close
         self.initialized = True
         self.on_init()
     
@@ -27,15 +45,47 @@ class BaseStrategy(ABC):
         pass
     
     @abstractmethod
-    def on_bar(self, timestamp, bar_data: Dict) -> List[Signal]:
+    def on_bar(
+        self,
+        i: int,
+        timestamp,
+        close_row: np.ndarray,
+    ) -> Union[List[Signal], np.ndarray]:
         """
         Process new bar and generate signals
         
+        Args:
+            i: Bar index; history up to now is self.close[:i + 1]
+            timestamp: Bar timestamp
+            close_row: Closes for this bar, aligned with self.symbols
+        
         Returns:
-            List of Signal objects
+            List of Signal objects, or a SIGNAL_DTYPE array of market orders
         """
         pass
     
+    def generate_signals(self) -> Optional[np.ndarray]:
+        """
+        Signed order quantities for every bar at once, shape [T, N]
+        (+buy, -sell, 0 none)
+        
+        Strategies whose signals don't depend on fills override this so the
+        engine can run the compiled kernel. None means bar-by-bar on_bar.
+        """
+        return None
+    
+    def signals_at(self, i: int, signal_matrix: np.ndarray) -> np.ndarray:
+        """Orders for row i of a signal matrix, as a SIGNAL_DTYPE array"""
+        return self.signals_from_row(signal_matrix[i])
+    
+    def signals_from_row(self, row: np.ndarray) -> np.ndarray:
+        """SIGNAL_DTYPE orders for the non-zero entries of one bar's signed quantities"""
+        hits = np.flatnonzero(row)
+        signals = np.empty(hits.size, dtype=SIGNAL_DTYPE)
+        signals["symbol_idx"] = hits
+        signals["quantity"] = row[hits]
+        return signals
+    
     def get_parameters(self) -> Dict:
         """Get strategy parameters"""
         return self.parameters
@@ -2,9 +2,8 @@
 ML-based trading strategy
 """
 
-from typing import Dict, List
+import numpy as np
 
-from backtest.engine.execution_handler import Signal
 from backtest.strategies.base_strategy import BaseStrategy
 
 
@@ -30,30 +29,17 @@ class MachineLearningStrategy(BaseStrategy):
         
         self.model = MLPredictor(self.model_path)
     
-    def on_bar(self, timestamp, bar_data: Dict) -> List[Signal]:
+    def on_bar(self, i: int, timestamp, close_row: np.ndarray) -> np.ndarray:
         """Generate signals from ML predictions"""
-        signals = []
+        # Get predictions for every symbol at once (inputs were validated
+        # in initialize, so no per-bar exception handling)
+        # This would need to be adapted for backtest context
+        predictions = np.zeros(len(self.symbols))  # Placeholder
         
-        for symbol in bar_data.columns.levels[0]:
-            try:
-                # Get prediction
-                # This would need to be adapted for backtest context
-                prediction = 0  # Placeholder
-                
-                if prediction > self.threshold:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="buy",
-                        quantity=100,
-                    ))
-                elif prediction < -self.threshold:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="sell",
-                        quantity=100,
-                    ))
-            
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
+        # Cross-sectional masks instead of a Python loop over symbols
+        # (buys written last so they take precedence, as before)
+        quantities = np.zeros(len(self.symbols))
+        quantities[predictions < -self.threshold] = -100
+        quantities[predictions > self.threshold] = 100
         
-        return signals
+        return self.signals_from_row(quantities)
@@ -2,9 +2,9 @@
 Mean Reversion strategy
 """
 
-from typing import Dict, List
+import numpy as np
 
-from backtest.engine.execution_handler import Signal
+from backtest.indicators import rolling_mean_std
 from backtest.strategies.base_strategy import BaseStrategy
 
 
@@ -25,43 +25,31 @@ class MeanReversionStrategy(BaseStrategy):
         self.lookback_period = lookback_period
         self.std_dev = std_dev
     
-    def on_bar(self, timestamp, bar_data: Dict) -> List[Signal]:
-        """Generate mean reversion signals"""
-        signals = []
+    def on_init(self):
+        """Pre-calculate Bollinger Band signals"""
+        lag = self.lookback_period - 1
+        self.signal_matrix = np.zeros(self.close.shape)
+        if len(self.close) <= lag:
+            return
+        
+        # Bands for every bar and symbol from one pass of running sums
+        ma, std = rolling_mean_std(self.close, self.lookback_period)
+        ma, std = ma[lag:], std[lag:]
         
-        for symbol in bar_data.columns.levels[0]:
-            try:
-                prices = self.data[symbol]["close"].loc[:timestamp]
-                
-                if len(prices) < self.lookback_period:
-                    continue
-                
-                # Calculate Bollinger Bands
-                ma = prices.rolling(self.lookback_period).mean().iloc[-1]
-                std = prices.rolling(self.lookback_period).std().iloc[-1]
-                
-                upper_band = ma + (std * self.std_dev)
-                lower_band = ma - (std * self.std_dev)
-                
-                current_price = bar_data[symbol]["close"]
-                
-                # Buy at lower band
-                if current_price <= lower_band:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="buy",
-                        quantity=100,
-                    ))
-                
-                # Sell at upper band
-                elif current_price >= upper_band:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="sell",
-                        quantity=100,
-                    ))
-            
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
+        upper_band = ma + (std * self.std_dev)
+        lower_band = ma - (std * self.std_dev)
         
-        return signals
+        # Buy at lower band, sell at upper band
+        current_price = self.close[lag:]
+        self.signal_matrix[lag:] = np.where(
+            current_price <= lower_band, 100.0,
+            np.where(current_price >= upper_band, -100.0, 0.0),
+        )
+    
+    def generate_signals(self) -> np.ndarray:
+        """Mean reversion signals for every bar"""
+        return self.signal_matrix
+    
+    def on_bar(self, i: int, timestamp, close_row: np.ndarray) -> np.ndarray:
+        """Generate mean reversion signals"""
+        return self.signals_at(i, self.signal_matrix)
@@ -2,9 +2,8 @@
 Momentum strategy
 """
 
-from typing import Dict, List
+import numpy as np
 
-from backtest.engine.execution_handler import Signal
 from backtest.strategies.base_strategy import BaseStrategy
 
 
@@ -24,37 +23,28 @@ class MomentumStrategy(BaseStrategy):
         self.lookback_period = lookback_period
         self.threshold = threshold
     
-    def on_bar(self, timestamp, bar_data: Dict) -> List[Signal]:
-        """Generate momentum signals"""
-        signals = []
+    def on_init(self):
+        """Pre-calculate momentum signals"""
+        lag = self.lookback_period - 1
+        self.signal_matrix = np.zeros(self.close.shape)
+        if len(self.close) <= lag:
+            return
         
-        for symbol in bar_data.columns.levels[0]:
-            try:
-                prices = self.data[symbol]["close"].loc[:timestamp]
-                
-                if len(prices) < self.lookback_period:
-                    continue
-                
-                # Calculate momentum
-                current_price = prices.iloc[-1]
-                past_price = prices.iloc[-self.lookback_period]
-                momentum = (current_price - past_price) / past_price
-                
-                # Generate signal
-                if momentum > self.threshold:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="buy",
-                        quantity=100,
-                    ))
-                elif momentum < -self.threshold:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="sell",
-                        quantity=100,
-                    ))
-            
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
+        # Calculate momentum for all symbols and bars at once, in one buffer
+        past_price = self.close[:len(self.close) - lag]
+        momentum = np.subtract(self.close[lag:], past_price)
+        momentum /= past_price
         
-        return signals
+        # Write signals in place instead of nesting np.where; buys go last
+        # so they win if a negative threshold makes the masks overlap
+        signals = self.signal_matrix[lag:]
+        signals[momentum < -self.threshold] = -100.0
+        signals[momentum > self.threshold] = 100.0
+    
+    def generate_signals(self) -> np.ndarray:
+        """Momentum signals for every bar"""
+        return self.signal_matrix
+    
+    def on_bar(self, i: int, timestamp, close_row: np.ndarray) -> np.ndarray:
+        """Generate momentum signals"""
+        return self.signals_at(i, self.signal_matrix)
@@ -2,11 +2,9 @@
 Moving Average Crossover Strategy
 """
 
-from typing import Dict, List
+import numpy as np
 
-import pandas as pd
-
-from backtest.engine.execution_handler import Signal
+from backtest.indicators import rolling_mean_spread
 from backtest.strategies.base_strategy import BaseStrategy
 
 
@@ -28,49 +26,25 @@ class MovingAverageStrategy(BaseStrategy):
         self.long_window = long_window
     
     def on_init(self):
-        """Pre-calculate moving averages"""
-        # Calculate for all symbols
-        pass
+        """Pre-calculate moving averages and crossover signals"""
+        # Golden cross (buy) / death cross (sell) between bars i - 1 and i,
+        # read off the sign of the short - long spread (NaN compares false).
+        # Both averages come from one pass over the closes.
+        spread = rolling_mean_spread(self.close, self.short_window, self.long_window)
+        prev, curr = spread[:-1], spread[1:]
+        golden = (prev <= 0) & (curr > 0)
+        death = (prev >= 0) & (curr < 0)
+        
+        self.signal_matrix = np.zeros(self.close.shape)
+        self.signal_matrix[1:][golden] = 100  # Fixed size for simplicity
+        self.signal_matrix[1:][death] = -100
+        # Need the current and previous bar of both averages
+        self.signal_matrix[:self.long_window] = 0
+    
+    def generate_signals(self) -> np.ndarray:
+        """Crossover signals for every bar"""
+        return self.signal_matrix
     
-    def on_bar(self, timestamp, bar_data: Dict) -> List[Signal]:
+    def on_bar(self, i: int, timestamp, close_row: np.ndarray) -> np.ndarray:
         """Generate signals based on MA crossover"""
-        signals = []
-        
-        for symbol in bar_data.columns.levels[0]:
-            try:
-                # Get price history up to current bar
-                prices = self.data[symbol]["close"].loc[:timestamp]
-                
-                if len(prices) < self.long_window:
-                    continue
-                
-                # Calculate MAs
-                short_ma = prices.rolling(self.short_window).mean().iloc[-1]
-                long_ma = prices.rolling(self.long_window).mean().iloc[-1]
-                
-                prev_short = prices.rolling(self.short_window).mean().iloc[-2]
-                prev_long = prices.rolling(self.long_window).mean().iloc[-2]
-                
-                # Check for crossover
-                current_price = bar_data[symbol]["close"]
-                
-                # Golden cross (buy)
-                if prev_short <= prev_long and short_ma > long_ma:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="buy",
-                        quantity=100,  # Fixed size for simplicity
-                    ))
-                
-                # Death cross (sell)
-                elif prev_short >= prev_long and short_ma < long_ma:
-                    signals.append(Signal(
-                        symbol=symbol,
-                        direction="sell",
-                        quantity=100,
-                    ))
-            
-            except Exception as e:
-                print(f"Error processing {symbol}: {e}")
-        
-        return signals
+        return self.signals_at(i, self.signal_matrix)
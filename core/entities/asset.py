@@ -9,7 +9,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Asset entity (stock, ETF, crypto, etc.)"""
     symbol: str
@@ -36,9 +36,11 @@ class Asset:
         self,
         current_price: Decimal,
         volume: int,
+        now: Optional[datetime] = None,
     ) -> None:
         """Update real-time price data"""
-        self.updated_at = datetime.utcnow()
+        now = now or datetime.utcnow()
+        self.updated_at = now
         # Would update price history
     
     def update_fundamentals(
@@ -46,17 +48,20 @@ class Asset:
         pe_ratio: Optional[float] = None,
         pb_ratio: Optional[float] = None,
         dividend_yield: Optional[float] = None,
+        now: Optional[datetime] = None,
     ) -> None:
         """Update fundamental metrics"""
+        now = now or datetime.utcnow()
         if pe_ratio is not None:
             self.pe_ratio = pe_ratio
         if pb_ratio is not None:
             self.pb_ratio = pb_ratio
         if dividend_yield is not None:
             self.dividend_yield = dividend_yield
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def deactivate(self) -> None:
+    def deactivate(self, now: Optional[datetime] = None) -> None:
         """Deactivate asset (delisted, etc.)"""
+        now = now or datetime.utcnow()
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
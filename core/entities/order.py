@@ -31,7 +31,7 @@ class OrderStatus(Enum):
     REJECTED = "rejected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order entity"""
     portfolio_id: UUID
@@ -60,36 +60,48 @@ class Order:
         """Check if order is completely filled"""
         return self.filled_quantity >= self.quantity
     
-    def fill(self, quantity: Decimal, price: Decimal) -> None:
+    def fill(
+        self,
+        quantity: Decimal,
+        price: Decimal,
+        now: Optional[datetime] = None,
+    ) -> None:
         """Record a fill (partial or complete)"""
+        now = now or datetime.utcnow()
         if quantity > self.remaining_quantity:
             raise ValueError("Fill quantity exceeds remaining quantity")
         
-        # Update average fill price
-        total_value = (self.filled_quantity * (self.avg_fill_price or Decimal("0"))) + (quantity * price)
-        self.filled_quantity += quantity
-        self.avg_fill_price = total_value / self.filled_quantity
+        # Update average fill price (the first fill needs no Decimal math)
+        if self.avg_fill_price is None:
+            self.avg_fill_price = price
+            self.filled_quantity += quantity
+        else:
+            total_value = (self.filled_quantity * self.avg_fill_price) + (quantity * price)
+            self.filled_quantity += quantity
+            self.avg_fill_price = total_value / self.filled_quantity
         
         # Update status
         if self.is_filled:
             self.status = OrderStatus.FILLED
-            self.executed_at = datetime.utcnow()
+            self.executed_at = now
         else:
             self.status = OrderStatus.PARTIALLY_FILLED
         
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def cancel(self) -> None:
+    def cancel(self, now: Optional[datetime] = None) -> None:
         """Cancel the order"""
+        now = now or datetime.utcnow()
         if self.status not in [OrderStatus.PENDING, OrderStatus.OPEN, OrderStatus.PARTIALLY_FILLED]:
             raise ValueError(f"Cannot cancel order with status {self.status}")
         
         self.status = OrderStatus.CANCELLED
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def reject(self, reason: str) -> None:
+    def reject(self, reason: str, now: Optional[datetime] = None) -> None:
         """Reject the order"""
+        now = now or datetime.utcnow()
         self.status = OrderStatus.REJECTED
         self.notes = reason
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
       
@@ -11,7 +11,7 @@ from uuid import UUID, uuid4
 from core.entities.asset import Asset
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     """Position within a portfolio"""
     asset: Asset
@@ -26,26 +26,37 @@ class Position:
         """Total cost of position"""
         return self.quantity * self.avg_price
     
-    def add_shares(self, quantity: Decimal, price: Decimal) -> None:
+    def add_shares(
+        self,
+        quantity: Decimal,
+        price: Decimal,
+        now: Optional[datetime] = None,
+    ) -> None:
         """Add shares to position (average down/up)"""
+        now = now or datetime.utcnow()
         total_cost = self.cost_basis + (quantity * price)
         total_shares = self.quantity + quantity
         self.avg_price = total_cost / total_shares
         self.quantity = total_shares
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def remove_shares(self, quantity: Decimal) -> Decimal:
+    def remove_shares(
+        self,
+        quantity: Decimal,
+        now: Optional[datetime] = None,
+    ) -> Decimal:
         """Remove shares from position, return realized P&L"""
+        now = now or datetime.utcnow()
         if quantity > self.quantity:
             raise ValueError("Cannot sell more shares than owned")
         
         realized_value = quantity * self.avg_price  # Simplified
         self.quantity -= quantity
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         return realized_value
 
 
-@dataclass
+@dataclass(slots=True)
 class Portfolio:
     """Portfolio entity"""
     user_id: UUID
@@ -63,31 +74,46 @@ class Portfolio:
     total_return: Optional[Decimal] = None
     total_return_percent: Optional[float] = None
     
-    def add_position(self, asset: Asset, quantity: Decimal, price: Decimal) -> Position:
-        """Add or update position"""
+    def add_position(
+        self,
+        asset: Asset,
+        quantity: Decimal,
+        price: Decimal,
+        now: Optional[datetime] = None,
+    ) -> Position:
+        """Add or update position (now: event time, e.g. a replayed bar's timestamp)"""
+        now = now or datetime.utcnow()
         if asset.id in self.positions:
-            self.positions[asset.id].add_shares(quantity, price)
+            self.positions[asset.id].add_shares(quantity, price, now)
         else:
             self.positions[asset.id] = Position(
                 asset=asset,
                 quantity=quantity,
                 avg_price=price,
+                opened_at=now,
+                updated_at=now,
             )
         
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         return self.positions[asset.id]
     
-    def remove_position(self, asset_id: UUID, quantity: Decimal) -> Decimal:
+    def remove_position(
+        self,
+        asset_id: UUID,
+        quantity: Decimal,
+        now: Optional[datetime] = None,
+    ) -> Decimal:
         """Reduce or close position"""
+        now = now or datetime.utcnow()
         if asset_id not in self.positions:
             raise ValueError("Position not found")
         
-        realized = self.positions[asset_id].remove_shares(quantity)
+        realized = self.positions[asset_id].remove_shares(quantity, now)
         
         if self.positions[asset_id].quantity == 0:
             del self.positions[asset_id]
         
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
         return realized
     
     def calculate_allocation(self) -> Dict[UUID, float]:
@@ -104,11 +130,10 @@ class Portfolio:
         """Get allocation by sector"""
         sector_values: Dict[str, Decimal] = {}
         
+        # One pass, one dict lookup per position
         for pos in self.positions.values():
             sector = pos.asset.sector or "Unknown"
-            if sector not in sector_values:
-                sector_values[sector] = Decimal("0")
-            sector_values[sector] += pos.cost_basis
+            sector_values[sector] = sector_values.get(sector, 0) + pos.cost_basis
         
         total = sum(sector_values.values())
         if total == 0:
@@ -2,13 +2,14 @@
 Trading strategy domain entity
 """
 
+from calendar import timegm
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class Strategy:
     """Trading strategy entity"""
     name: str
@@ -23,30 +24,35 @@ class Strategy:
     updated_at: datetime = field(default_factory=datetime.utcnow)
     performance_metrics: Dict[str, float] = field(default_factory=dict)
     
-    def update_parameters(self, new_params: Dict[str, Any]) -> None:
+    def update_parameters(self, new_params: Dict[str, Any], now: Optional[datetime] = None) -> None:
         """Update strategy parameters"""
+        now = now or datetime.utcnow()
         self.parameters.update(new_params)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
     def record_performance(
         self,
         sharpe_ratio: float,
         total_return: float,
         max_drawdown: float,
+        now: Optional[datetime] = None,
     ) -> None:
         """Record backtest/live performance"""
-        self.performance_metrics = {
-            "sharpe_ratio": sharpe_ratio,
-            "total_return": total_return,
-            "max_drawdown": max_drawdown,
-            "recorded_at": datetime.utcnow().isoformat(),
-        }
-        self.updated_at = datetime.utcnow()
+        now = now or datetime.utcnow()
+        # Written in place: the dict is reused across recordings
+        metrics = self.performance_metrics
+        metrics["sharpe_ratio"] = sharpe_ratio
+        metrics["total_return"] = total_return
+        metrics["max_drawdown"] = max_drawdown
+        # UTC epoch seconds rather than an ISO string; format on output
+        metrics["recorded_at"] = timegm(now.utctimetuple()) + now.microsecond / 1e6
+        self.updated_at = now
     
-    def deactivate(self) -> None:
+    def deactivate(self, now: Optional[datetime] = None) -> None:
         """Deactivate strategy"""
+        now = now or datetime.utcnow()
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
     def validate_parameters(self) -> List[str]:
         """Validate strategy parameters, return list of errors"""
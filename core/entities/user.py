@@ -8,7 +8,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User entity"""
     email: str
@@ -22,28 +22,33 @@ class User:
     updated_at: datetime = field(default_factory=datetime.utcnow)
     last_login: Optional[datetime] = None
     
-    def deactivate(self) -> None:
+    def deactivate(self, now: Optional[datetime] = None) -> None:
         """Deactivate user account"""
+        now = now or datetime.utcnow()
         self.is_active = False
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def activate(self) -> None:
+    def activate(self, now: Optional[datetime] = None) -> None:
         """Activate user account"""
+        now = now or datetime.utcnow()
         self.is_active = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def update_last_login(self) -> None:
+    def update_last_login(self, now: Optional[datetime] = None) -> None:
         """Update last login timestamp"""
-        self.last_login = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        now = now or datetime.utcnow()
+        self.last_login = now
+        self.updated_at = now
     
-    def change_role(self, new_role: str) -> None:
+    def change_role(self, new_role: str, now: Optional[datetime] = None) -> None:
         """Change user role"""
+        now = now or datetime.utcnow()
         self.role = new_role
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
     
-    def verify(self) -> None:
+    def verify(self, now: Optional[datetime] = None) -> None:
         """Mark email as verified"""
+        now = now or datetime.utcnow()
         self.is_verified = True
-        self.updated_at = datetime.utcnow()
+        self.updated_at = now
       
@@ -3,7 +3,7 @@ Asset repository interface
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from core.entities.asset import Asset
@@ -17,6 +17,16 @@ class IAssetRepository(ABC):
         """Get asset by ID"""
         pass
     
+    @abstractmethod
+    async def get_by_ids(self, asset_ids: List[UUID]) -> List[Asset]:
+        """Get assets by IDs in a single query"""
+        pass
+    
+    @abstractmethod
+    async def get_symbols_by_ids(self, asset_ids: List[UUID]) -> Dict[UUID, str]:
+        """Map asset IDs to symbols, from cache where possible"""
+        pass
+    
     @abstractmethod
     async def get_by_symbol(self, symbol: str) -> Optional[Asset]:
         """Get asset by symbol"""
@@ -15,7 +15,12 @@ class IPortfolioRepository(ABC):
     
     @abstractmethod
     async def get_by_id(self, portfolio_id: UUID) -> Optional[Portfolio]:
-        """Get portfolio by ID"""
+        """Get portfolio by ID (without positions)"""
+        pass
+    
+    @abstractmethod
+    async def get_by_id_with_positions(self, portfolio_id: UUID) -> Optional[Portfolio]:
+        """Get portfolio by ID with positions and their assets loaded"""
         pass
     
     @abstractmethod
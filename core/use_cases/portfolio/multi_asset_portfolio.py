@@ -4,6 +4,7 @@ Multi-asset portfolio construction use case
 
 from dataclasses import dataclass
 from decimal import Decimal
+from operator import mul
 from typing import Dict, List
 from uuid import UUID
 
@@ -33,6 +34,42 @@ class MultiAssetPortfolioUseCase:
         "cash": {"return": 0.04, "risk": 0.01, "correlation": 0.0},
     }
     
+    # Per-class figures as tuples in ASSET_CLASSES order, built once
+    _CLASS_ORDER = tuple(ASSET_CLASSES)
+    _RETURNS = tuple(c["return"] for c in ASSET_CLASSES.values())
+    _RISKS = tuple(c["risk"] for c in ASSET_CLASSES.values())
+    
+    # Default allocations by risk profile
+    PROFILES = {
+        "conservative": {
+            "stocks_br": 0.15,
+            "stocks_us": 0.10,
+            "bonds": 0.50,
+            "reits": 0.10,
+            "crypto": 0.00,
+            "gold": 0.10,
+            "cash": 0.05,
+        },
+        "moderate": {
+            "stocks_br": 0.25,
+            "stocks_us": 0.20,
+            "bonds": 0.30,
+            "reits": 0.10,
+            "crypto": 0.05,
+            "gold": 0.05,
+            "cash": 0.05,
+        },
+        "aggressive": {
+            "stocks_br": 0.35,
+            "stocks_us": 0.30,
+            "bonds": 0.10,
+            "reits": 0.10,
+            "crypto": 0.10,
+            "gold": 0.00,
+            "cash": 0.05,
+        },
+    }
+    
     def execute(
         self,
         total_value: Decimal,
@@ -47,42 +84,10 @@ class MultiAssetPortfolioUseCase:
             risk_profile: Investor risk profile
             constraints: Min/max constraints per asset class {class: (min, max)}
         """
-        # Default allocations by risk profile
-        profiles = {
-            "conservative": {
-                "stocks_br": 0.15,
-                "stocks_us": 0.10,
-                "bonds": 0.50,
-                "reits": 0.10,
-                "crypto": 0.00,
-                "gold": 0.10,
-                "cash": 0.05,
-            },
-            "moderate": {
-                "stocks_br": 0.25,
-                "stocks_us": 0.20,
-                "bonds": 0.30,
-                "reits": 0.10,
-                "crypto": 0.05,
-                "gold": 0.05,
-                "cash": 0.05,
-            },
-            "aggressive": {
-                "stocks_br": 0.35,
-                "stocks_us": 0.30,
-                "bonds": 0.10,
-                "reits": 0.10,
-                "crypto": 0.10,
-                "gold": 0.00,
-                "cash": 0.05,
-            },
-        }
-        
-        if risk_profile not in profiles:
+        allocation = self.PROFILES.get(risk_profile)
+        if allocation is None:
             raise ValueError(f"Unknown risk profile: {risk_profile}")
         
-        allocation = profiles[risk_profile]
-        
         # Apply constraints if provided
         if constraints:
             allocation = self._apply_constraints(allocation, constraints)
@@ -91,17 +96,12 @@ class MultiAssetPortfolioUseCase:
         total_weight = sum(allocation.values())
         allocation = {k: v / total_weight for k, v in allocation.items()}
         
-        # Calculate portfolio metrics
-        portfolio_return = sum(
-            allocation[cls] * self.ASSET_CLASSES[cls]["return"]
-            for cls in allocation
-        )
+        # Calculate portfolio metrics as dot products of the weight vector
+        weights = [allocation[cls] for cls in self._CLASS_ORDER]
+        portfolio_return = sum(map(mul, weights, self._RETURNS))
         
         # Simplified risk calculation (would use covariance matrix)
-        portfolio_risk = sum(
-            allocation[cls] * self.ASSET_CLASSES[cls]["risk"]
-            for cls in allocation
-        ) / len(allocation)  # Simplified
+        portfolio_risk = sum(map(mul, weights, self._RISKS)) / len(allocation)  # Simplified
         
         allocations = []
         for asset_class, weight in allocation.items():
@@ -3,7 +3,7 @@ Redis cache client with connection pooling
 """
 
 import json
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 import redis.asyncio as redis
 
@@ -67,6 +67,65 @@ class RedisCache:
         except Exception:
             return False
     
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values with one MGET (None for misses)"""
+        return [
+            json.loads(value) if value else None
+            for value in await self.get_many_raw(keys)
+        ]
+    
+    async def set_many(self, values: Dict[str, Any], ttl: int = 300) -> bool:
+        """Set several values in one pipelined round-trip"""
+        return await self.set_many_raw(
+            {key: json.dumps(value, default=str) for key, value in values.items()},
+            ttl=ttl,
+        )
+    
+    async def get_raw(self, key: str) -> Optional[str]:
+        """Get an already-serialized value, skipping JSON decoding"""
+        if not self._pool:
+            await self.connect()
+        
+        try:
+            return await self._client.get(key)
+        except Exception:
+            return None
+    
+    async def set_raw(self, key: str, value: bytes, ttl: int = 300) -> bool:
+        """Set an already-serialized value"""
+        if not self._pool:
+            await self.connect()
+        
+        try:
+            await self._client.setex(key, ttl, value)
+            return True
+        except Exception:
+            return False
+    
+    async def get_many_raw(self, keys: List[str]) -> List[Optional[str]]:
+        """Get several serialized values with one MGET"""
+        if not self._pool:
+            await self.connect()
+        
+        try:
+            return await self._client.mget(keys)
+        except Exception:
+            return [None] * len(keys)
+    
+    async def set_many_raw(self, values: Dict[str, Any], ttl: int = 300) -> bool:
+        """Set several serialized values in one pipelined round-trip"""
+        if not self._pool:
+            await self.connect()
+        
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for key, value in values.items():
+                    pipe.setex(key, ttl, value)
+                await pipe.execute()
+            return True
+        except Exception:
+            return False
+    
     async def delete(self, key: str) -> bool:
         """Delete key from cache"""
         if not self._pool:
@@ -78,6 +137,19 @@ class RedisCache:
         except Exception:
             return False
     
+    async def delete_many(self, keys: List[str]) -> bool:
+        """Delete several keys with one DEL"""
+        if not keys:
+            return True
+        if not self._pool:
+            await self.connect()
+        
+        try:
+            await self._client.delete(*keys)
+            return True
+        except Exception:
+            return False
+    
     async def exists(self, key: str) -> bool:
         """Check if key exists"""
         if not self._pool:
@@ -102,6 +174,27 @@ class RedisCache:
         
         return await self._client.expire(key, ttl)
     
+    async def publish(self, channel: str, message: Any) -> int:
+        """Publish message to a pub/sub channel"""
+        if not self._pool:
+            await self.connect()
+        
+        return await self._client.publish(channel, message)
+    
+    async def pubsub(self) -> redis.client.PubSub:
+        """Create a pub/sub handle on the shared pool"""
+        if not self._pool:
+            await self.connect()
+        
+        return self._client.pubsub()
+    
+    async def register_script(self, script: str):
+        """Register a Lua script; calls use EVALSHA and load it on first miss"""
+        if not self._pool:
+            await self.connect()
+        
+        return self._client.register_script(script)
+    
     async def health_check(self) -> bool:
         """Check Redis connectivity"""
         try:
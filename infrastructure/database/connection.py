@@ -5,6 +5,7 @@ Database connection manager with async support and connection pooling
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -15,6 +16,14 @@ from sqlalchemy.pool import NullPool
 from app.config import settings
 
 
+def _async_postgres_url(dsn: str) -> URL:
+    """Route plain postgresql:// DSNs to the asyncpg driver"""
+    url = make_url(dsn)
+    if url.drivername in ("postgres", "postgresql"):
+        url = url.set(drivername="postgresql+asyncpg")
+    return url
+
+
 class AsyncDatabaseManager:
     """Manages async database connections with pooling"""
     
@@ -39,12 +48,29 @@ class AsyncDatabaseManager:
                     poolclass=NullPool,  # SQLite doesn't support pooling well
                 )
             else:
+                database_url = _async_postgres_url(str(settings.DATABASE_URL))
+                
+                # Split the Postgres connection budget across API workers
+                per_worker = max(5, settings.DATABASE_TARGET_CONNECTIONS // settings.API_WORKERS)
+                
+                connect_args = {}
+                if database_url.drivername == "postgresql+asyncpg":
+                    database_url = database_url.update_query_dict(
+                        {"prepared_statement_cache_size": "512"}
+                    )
+                    connect_args = {
+                        "statement_cache_size": 1024,
+                        "server_settings": {"jit": "off"},  # short OLTP queries
+                    }
+                
                 self._engine = create_async_engine(
-                    str(settings.DATABASE_URL),
+                    database_url,
                     echo=settings.DEBUG,
-                    pool_size=settings.DATABASE_POOL_SIZE,
-                    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-                    pool_pre_ping=True,
+                    pool_size=min(settings.DATABASE_POOL_SIZE, per_worker),
+                    max_overflow=min(settings.DATABASE_MAX_OVERFLOW, per_worker),
+                    pool_recycle=1800,
+                    pool_pre_ping=False,
+                    connect_args=connect_args,
                 )
             
             self._session_factory = async_sessionmaker(
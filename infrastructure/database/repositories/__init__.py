@@ -1,4 +1,20 @@
 """
 Repository implementations
 """
-  
+
+from typing import Tuple
+
+from sqlalchemy.orm import raiseload
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from app.config import get_settings
+
+
+def list_query_options() -> Tuple[LoaderOption, ...]:
+    """
+    Loader options for list queries, read from settings on each query
+    
+    In development, list queries fail loudly on any unplanned lazy load;
+    endpoints that need a relationship must eager-load it explicitly.
+    """
+    return (raiseload("*"),) if get_settings().is_development else ()
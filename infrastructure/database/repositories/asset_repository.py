@@ -2,15 +2,52 @@
 Asset repository implementation
 """
 
-from typing import List, Optional
+import asyncio
+from typing import Dict, List, Optional, Set
 from uuid import UUID
 
-from sqlalchemy import or_, select
+from sqlalchemy import event, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from core.entities.asset import Asset
 from core.repositories.asset_repository import IAssetRepository
+from infrastructure.cache.redis_client import RedisCache
 from infrastructure.database.models.asset import AssetModel
+from infrastructure.database.repositories import list_query_options
+
+SYMBOL_CACHE_TTL = 86400
+
+# session.info entry: symbol keys to drop from Redis once the session commits
+_PENDING_INVALIDATIONS = "asset_symbol_invalidations"
+
+# Keeps post-commit invalidation tasks referenced until they finish
+_invalidation_tasks: Set[asyncio.Task] = set()
+
+
+def _symbol_key(asset_id: UUID) -> str:
+    """Redis key for an asset's symbol"""
+    return f"asset:{asset_id}:symbol"
+
+
+def _invalidate_pending(session: Session) -> None:
+    """
+    after_commit hook: drop the cached symbols changed in the transaction
+    
+    Invalidating before the commit would let a concurrent reader cache
+    the old row again for the full TTL. The hook runs on the event loop
+    thread but cannot await, so the delete is scheduled as a task.
+    """
+    keys = session.info.pop(_PENDING_INVALIDATIONS, None)
+    if keys:
+        task = asyncio.get_running_loop().create_task(RedisCache().delete_many(list(keys)))
+        _invalidation_tasks.add(task)
+        task.add_done_callback(_invalidation_tasks.discard)
+
+
+def _discard_pending(session: Session) -> None:
+    """after_rollback hook: nothing changed, keep the cached symbols"""
+    session.info.pop(_PENDING_INVALIDATIONS, None)
 
 
 class AssetRepository(IAssetRepository):
@@ -27,6 +64,40 @@ class AssetRepository(IAssetRepository):
         asset = result.scalar_one_or_none()
         return asset.to_entity() if asset else None
     
+    async def get_by_ids(self, asset_ids: List[UUID]) -> List[Asset]:
+        """Get assets by IDs in a single query (order not guaranteed)"""
+        if not asset_ids:
+            return []
+        result = await self.session.execute(
+            select(AssetModel).where(AssetModel.id.in_(asset_ids))
+        )
+        assets = result.scalars().all()
+        return [a.to_entity() for a in assets]
+    
+    async def get_symbols_by_ids(self, asset_ids: List[UUID]) -> Dict[UUID, str]:
+        """Map asset IDs to symbols: one MGET, then one query for the misses"""
+        if not asset_ids:
+            return {}
+        
+        cache = RedisCache()
+        cached = await cache.get_many_raw([_symbol_key(i) for i in asset_ids])
+        symbols = {i: s for i, s in zip(asset_ids, cached) if s is not None}
+        
+        missing = [i for i in asset_ids if i not in symbols]
+        if missing:
+            result = await self.session.execute(
+                select(AssetModel.id, AssetModel.symbol).where(AssetModel.id.in_(missing))
+            )
+            loaded = dict(result.all())
+            if loaded:
+                await cache.set_many_raw(
+                    {_symbol_key(i): s for i, s in loaded.items()},
+                    ttl=SYMBOL_CACHE_TTL,
+                )
+            symbols.update(loaded)
+        
+        return symbols
+    
     async def get_by_symbol(self, symbol: str) -> Optional[Asset]:
         """Get asset by symbol"""
         result = await self.session.execute(
@@ -54,6 +125,7 @@ class AssetRepository(IAssetRepository):
                 setattr(asset, key, value)
         
         await self.session.flush()
+        self._invalidate_symbol_on_commit(asset_id)
         return asset.to_entity()
     
     async def delete(self, asset_id: UUID) -> None:
@@ -63,6 +135,15 @@ class AssetRepository(IAssetRepository):
         )
         asset = result.scalar_one()
         await self.session.delete(asset)
+        self._invalidate_symbol_on_commit(asset_id)
+    
+    def _invalidate_symbol_on_commit(self, asset_id: UUID) -> None:
+        """Drop the asset's cached symbol once this session's transaction commits"""
+        sync_session = self.session.sync_session
+        if not event.contains(sync_session, "after_commit", _invalidate_pending):
+            event.listen(sync_session, "after_commit", _invalidate_pending)
+            event.listen(sync_session, "after_rollback", _discard_pending)
+        self.session.info.setdefault(_PENDING_INVALIDATIONS, set()).add(_symbol_key(asset_id))
     
     async def get_all(
         self,
@@ -72,7 +153,7 @@ class AssetRepository(IAssetRepository):
         asset_type: Optional[str] = None,
     ) -> List[Asset]:
         """Get all assets with filtering"""
-        query = select(AssetModel)
+        query = select(AssetModel).options(*list_query_options())
         
         if asset_type:
             query = query.where(AssetModel.asset_type == asset_type)
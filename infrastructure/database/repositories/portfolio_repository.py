@@ -8,10 +8,12 @@ from uuid import UUID
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload
 
 from core.entities.portfolio import Portfolio
 from core.repositories.portfolio_repository import IPortfolioRepository
 from infrastructure.database.models.portfolio import PortfolioModel, PositionModel
+from infrastructure.database.repositories import list_query_options
 
 
 class PortfolioRepository(IPortfolioRepository):
@@ -21,28 +23,36 @@ class PortfolioRepository(IPortfolioRepository):
         self.session = session
     
     async def get_by_id(self, portfolio_id: UUID) -> Optional[Portfolio]:
-        """Get portfolio by ID with positions"""
+        """Get portfolio by ID (without positions)"""
         result = await self.session.execute(
             select(PortfolioModel)
             .where(PortfolioModel.id == portfolio_id)
         )
         portfolio = result.scalar_one_or_none()
+        return portfolio.to_entity() if portfolio else None
+    
+    async def get_by_id_with_positions(self, portfolio_id: UUID) -> Optional[Portfolio]:
+        """Get portfolio by ID with positions and assets eagerly loaded"""
+        # A single portfolio has few positions, so one joined round-trip
+        # beats the two extra selectin queries
+        result = await self.session.execute(
+            select(PortfolioModel)
+            .where(PortfolioModel.id == portfolio_id)
+            .options(
+                joinedload(PortfolioModel.positions).joinedload(PositionModel.asset),
+                raiseload("*"),
+            )
+        )
+        portfolio = result.unique().scalar_one_or_none()
         
         if not portfolio:
             return None
         
         entity = portfolio.to_entity()
-        
-        # Load positions
-        positions_result = await self.session.execute(
-            select(PositionModel)
-            .where(PositionModel.portfolio_id == portfolio_id)
-        )
-        positions = positions_result.scalars().all()
-        
-        # Convert positions to entities (would need asset entities too)
-        # entity.positions = {p.asset_id: p.to_entity() for p in positions}
-        
+        entity.positions = {
+            p.asset_id: p.to_entity(p.asset.to_entity())
+            for p in portfolio.positions
+        }
         return entity
     
     async def get_by_user_id(self, user_id: UUID) -> List[Portfolio]:
@@ -51,6 +61,7 @@ class PortfolioRepository(IPortfolioRepository):
             select(PortfolioModel)
             .where(PortfolioModel.user_id == user_id)
             .order_by(PortfolioModel.created_at.desc())
+            .options(*list_query_options())
         )
         portfolios = result.scalars().all()
         return [p.to_entity() for p in portfolios]
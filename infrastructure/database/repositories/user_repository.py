@@ -12,6 +12,7 @@ from app.core.security import get_password_hash
 from core.entities.user import User
 from core.repositories.user_repository import IUserRepository
 from infrastructure.database.models.user import UserModel
+from infrastructure.database.repositories import list_query_options
 
 
 class UserRepository(IUserRepository):
@@ -72,7 +73,7 @@ class UserRepository(IUserRepository):
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get all users"""
         result = await self.session.execute(
-            select(UserModel).offset(skip).limit(limit)
+            select(UserModel).options(*list_query_options()).offset(skip).limit(limit)
         )
         users = result.scalars().all()
         return [u.to_entity() for u in users]
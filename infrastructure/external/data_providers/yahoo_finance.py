@@ -1,10 +1,89 @@
 """
 Yahoo Finance data provider
+
+yfinance is synchronous, so every call runs in a worker thread: callers can
+gather many symbols concurrently without blocking the event loop. A shared
+semaphore caps in-flight requests and rate-limit responses are retried with
+exponential backoff.
 """
 
+import asyncio
+import threading
 from typing import Any, Dict, List, Optional
 
 import yfinance as yf
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+# Process-wide cap on concurrent Yahoo requests (thread-safe, so it holds
+# across event loops and the executor threads that do the fetching)
+MAX_CONCURRENT_REQUESTS = 16
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """True for Yahoo's HTTP 429 / YFRateLimitError responses"""
+    return (
+        type(exc).__name__ == "YFRateLimitError"
+        or "429" in str(exc)
+        or "Too Many Requests" in str(exc)
+    )
+
+
+_backoff = retry(
+    retry=retry_if_exception(_is_rate_limited),
+    wait=wait_exponential(multiplier=0.5, max=8),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+
+
+@_backoff
+def _fetch_quote(symbol: str) -> Dict[str, Any]:
+    """Blocking quote fetch: info plus the latest daily bar"""
+    with _request_slots:
+        ticker = yf.Ticker(symbol)
+        info = ticker.info
+        hist = ticker.history(period="1d")
+    
+    if not hist.empty:
+        current_price = hist["Close"].iloc[-1]
+        prev_close = info.get("previousClose", current_price)
+        change = current_price - prev_close
+        change_percent = (change / prev_close) * 100 if prev_close else 0
+    else:
+        current_price = info.get("currentPrice", 0)
+        change = 0
+        change_percent = 0
+    
+    return {
+        "symbol": symbol,
+        "price": round(current_price, 2),
+        "change": round(change, 2),
+        "change_percent": round(change_percent, 2),
+        "volume": info.get("volume", 0),
+        "timestamp": info.get("regularMarketTime"),
+        "currency": info.get("currency", "BRL"),
+    }
+
+
+@_backoff
+def _fetch_history(symbol: str, period: str, interval: str) -> List[Dict[str, Any]]:
+    """Blocking history fetch, shaped into bar dicts"""
+    with _request_slots:
+        hist = yf.Ticker(symbol).history(period=period, interval=interval)
+    
+    data = []
+    for date, row in hist.iterrows():
+        data.append({
+            "date": date.isoformat(),
+            "open": round(row["Open"], 2),
+            "high": round(row["High"], 2),
+            "low": round(row["Low"], 2),
+            "close": round(row["Close"], 2),
+            "volume": int(row["Volume"]),
+        })
+    
+    return data
 
 
 class YahooFinanceProvider:
@@ -13,43 +92,20 @@ class YahooFinanceProvider:
     async def get_current_price(self, symbol: str) -> Dict[str, Any]:
         """Get current price for symbol"""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            
-            # Get latest price
-            hist = ticker.history(period="1d")
-            if not hist.empty:
-                latest = hist.iloc[-1]
-                current_price = latest["Close"]
-                prev_close = info.get("previousClose", current_price)
-                change = current_price - prev_close
-                change_percent = (change / prev_close) * 100 if prev_close else 0
-            else:
-                current_price = info.get("currentPrice", 0)
-                change = 0
-                change_percent = 0
-            
-            return {
-                "symbol": symbol,
-                "price": round(current_price, 2),
-                "change": round(change, 2),
-                "change_percent": round(change_percent, 2),
-                "volume": info.get("volume", 0),
-                "timestamp": info.get("regularMarketTime"),
-                "currency": info.get("currency", "BRL"),
-            }
+            return await asyncio.to_thread(_fetch_quote, symbol)
         except Exception as e:
             raise Exception(f"Yahoo Finance error: {str(e)}")
     
     async def get_current_prices(self, symbols: List[str]) -> Dict[str, Dict[str, Any]]:
-        """Get prices for multiple symbols"""
-        results = {}
-        for symbol in symbols:
-            try:
-                results[symbol] = await self.get_current_price(symbol)
-            except Exception:
-                results[symbol] = {"error": "Failed to fetch"}
-        return results
+        """Get prices for multiple symbols concurrently"""
+        quotes = await asyncio.gather(
+            *(self.get_current_price(symbol) for symbol in symbols),
+            return_exceptions=True,
+        )
+        return {
+            symbol: {"error": "Failed to fetch"} if isinstance(quote, Exception) else quote
+            for symbol, quote in zip(symbols, quotes)
+        }
     
     async def get_history(
         self,
@@ -59,21 +115,7 @@ class YahooFinanceProvider:
     ) -> List[Dict[str, Any]]:
         """Get historical price data"""
         try:
-            ticker = yf.Ticker(symbol)
-            hist = ticker.history(period=period, interval=interval)
-            
-            data = []
-            for date, row in hist.iterrows():
-                data.append({
-                    "date": date.isoformat(),
-                    "open": round(row["Open"], 2),
-                    "high": round(row["High"], 2),
-                    "low": round(row["Low"], 2),
-                    "close": round(row["Close"], 2),
-                    "volume": int(row["Volume"]),
-                })
-            
-            return data
+            return await asyncio.to_thread(_fetch_history, symbol, period, interval)
         except Exception as e:
             raise Exception(f"Yahoo Finance error: {str(e)}")
     
@@ -17,8 +17,8 @@ celery_app = Celery(
 )
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
+    task_serializer="msgpack",
+    accept_content=["msgpack", "json"],
     result_serializer="json",
     timezone="America/Sao_Paulo",
     enable_utc=True,
@@ -2,12 +2,15 @@
 Model inference for production
 """
 
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import numpy as np
 
 from ml.features.feature_engineering import FeatureEngineer
 
+if TYPE_CHECKING:
+    from app.services.market_data_service import MarketDataService
+
 
 class MLPredictor:
     """Production ML predictor"""
@@ -29,11 +32,11 @@ class MLPredictor:
         self,
         symbol: str,
         horizon_days: int = 5,
+        market_data: Optional["MarketDataService"] = None,
     ) -> Dict[str, Any]:
-        """Generate prediction"""
+        """Generate prediction (market_data: the app-wide service, if available)"""
         # Fetch recent data
-        # This would call market data service
-        recent_data = await self._fetch_recent_data(symbol)
+        recent_data = await self._fetch_recent_data(symbol, market_data)
         
         # Engineer features
         features = self.feature_engineer.prepare_features(recent_data)
@@ -68,12 +71,17 @@ class MLPredictor:
             "generated_at": str(np.datetime64("now")),
         }
     
-    async def _fetch_recent_data(self, symbol: str):
+    async def _fetch_recent_data(
+        self,
+        symbol: str,
+        market_data: Optional["MarketDataService"] = None,
+    ):
         """Fetch recent market data"""
-        from app.services.market_data_service import MarketDataService
-        
-        service = MarketDataService()
-        data = await service.get_historical(symbol, period="3mo", interval="1d")
+        if market_data is None:
+            from app.services.market_data_service import MarketDataService
+            
+            market_data = MarketDataService()
+        data = await market_data.get_historical(symbol, period="3mo", interval="1d")
         return data
     
     def _generate_price_path(
@@ -0,0 +1,55 @@
+"""
+Numeric aggregation of sentiment labels
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+from numba import njit
+
+SENTIMENT_LABELS = ("positive", "neutral", "negative")
+SENTIMENT_CODES = {label: code for code, label in enumerate(SENTIMENT_LABELS)}
+
+
+@njit(cache=True)
+def _aggregate(codes: np.ndarray) -> Tuple[int, int, int, float, int]:
+    """Count labels and score them in a single pass"""
+    positive = 0
+    neutral = 0
+    negative = 0
+    for code in codes:
+        if code == 0:
+            positive += 1
+        elif code == 1:
+            neutral += 1
+        else:
+            negative += 1
+    
+    total = positive + neutral + negative
+    if total == 0:
+        return 0, 0, 0, 0.5, 1
+    
+    score = (positive + 0.5 * neutral) / total
+    if score > 0.6:
+        overall = 0
+    elif score < 0.4:
+        overall = 2
+    else:
+        overall = 1
+    return positive, neutral, negative, score, overall
+
+
+def aggregate_sentiment(labels: List[str]) -> Tuple[int, int, int, float, str]:
+    """
+    Aggregate sentiment labels into counts, score and overall label
+    
+    Returns:
+        (positive, neutral, negative, score, overall)
+    """
+    codes = np.fromiter(
+        (SENTIMENT_CODES[label] for label in labels),
+        dtype=np.int8,
+        count=len(labels),
+    )
+    positive, neutral, negative, score, overall = _aggregate(codes)
+    return positive, neutral, negative, score, SENTIMENT_LABELS[overall]
@@ -7,6 +7,8 @@ from typing import Dict, List
 
 import spacy
 
+from nlp.executor import run_inference
+
 
 class EntityExtractor:
     """Extract financial entities from text"""
@@ -16,7 +18,11 @@ class EntityExtractor:
         self.nlp = spacy.load("en_core_web_sm")
     
     async def extract(self, text: str) -> List[Dict]:
-        """Extract entities"""
+        """Extract entities on the inference pool"""
+        return await run_inference(self.extract_sync, text)
+    
+    def extract_sync(self, text: str) -> List[Dict]:
+        """Extract entities (blocking)"""
         doc = self.nlp(text)
         
         entities = []
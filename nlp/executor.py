@@ -0,0 +1,42 @@
+"""
+Dedicated thread pool for blocking model inference
+
+Inference runs here rather than on the event loop's default executor, so
+long model calls don't starve I/O-bound asyncio.to_thread work (provider
+fetches, retries) and vice versa.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def inference_executor() -> ThreadPoolExecutor:
+    """Process-wide inference pool, one worker per core, created on first use"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="inference",
+        )
+    return _executor
+
+
+async def run_inference(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking model call on the inference pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(inference_executor(), partial(func, *args))
+
+
+def shutdown_inference_executor() -> None:
+    """Stop the inference pool, dropping calls that have not started"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -2,17 +2,24 @@
 Financial sentiment analysis
 """
 
+import asyncio
+from functools import lru_cache
 from typing import Any, Dict, List
 
 import torch
 from transformers import AutoModelForSequenceClassification, AutoTokenizer
 
 from app.config import settings
+from nlp.executor import run_inference
 
 
 class SentimentAnalyzer:
     """Analyze sentiment of financial text"""
     
+    # Names get_warm will load; anything else would be fetched from the Hub
+    SUPPORTED_MODELS = frozenset({"finbert", "bertimbau"})
+    _load_locks: Dict[str, asyncio.Lock] = {}
+    
     def __init__(self, model_name: str = "finbert"):
         self.model_name = model_name
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
@@ -32,8 +39,27 @@ class SentimentAnalyzer:
         self.model.to(self.device)
         self.model.eval()
     
+    @classmethod
+    async def get_warm(cls, model_name: str = "finbert") -> "SentimentAnalyzer":
+        """
+        Get shared analyzer, loading the model off the event loop on first use
+        
+        Raises ValueError for names outside SUPPORTED_MODELS. The per-name
+        lock makes concurrent cold requests wait for a single load.
+        """
+        if model_name not in cls.SUPPORTED_MODELS:
+            raise ValueError(f"Unsupported sentiment model: {model_name}")
+        
+        lock = cls._load_locks.setdefault(model_name, asyncio.Lock())
+        async with lock:
+            return await run_inference(_shared_analyzer, model_name)
+    
     async def analyze(self, text: str, language: str = "auto") -> Dict[str, Any]:
-        """Analyze sentiment of text"""
+        """Analyze sentiment of text on the inference pool"""
+        return await run_inference(self.analyze_sync, text, language)
+    
+    def analyze_sync(self, text: str, language: str = "auto") -> Dict[str, Any]:
+        """Analyze sentiment of text (blocking)"""
         # Detect language if auto
         if language == "auto":
             language = self._detect_language(text)
@@ -89,3 +115,9 @@ class SentimentAnalyzer:
             result = await self.analyze(text)
             results.append(result)
         return results
+
+
+@lru_cache(maxsize=len(SentimentAnalyzer.SUPPORTED_MODELS))
+def _shared_analyzer(model_name: str) -> SentimentAnalyzer:
+    """Process-wide analyzer per supported model"""
+    return SentimentAnalyzer(model_name)
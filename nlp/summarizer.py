@@ -7,6 +7,8 @@ from typing import List
 import torch
 from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
+from nlp.executor import run_inference
+
 
 class TextSummarizer:
     """Summarize financial text"""
@@ -24,7 +26,11 @@ class TextSummarizer:
         self.model.eval()
     
     async def summarize(self, text: str, max_length: int = 150) -> str:
-        """Summarize text"""
+        """Summarize text on the inference pool"""
+        return await run_inference(self.summarize_sync, text, max_length)
+    
+    def summarize_sync(self, text: str, max_length: int = 150) -> str:
+        """Summarize text (blocking)"""
         # Preprocess
         text = text.replace("\n", " ").strip()
         
@@ -2,15 +2,25 @@
 Markowitz Modern Portfolio Theory
 """
 
-from typing import Dict, List
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+from scipy.linalg import cho_factor, cho_solve
 from scipy.optimize import minimize
 
 
 class MarkowitzOptimizer:
     """Mean-variance optimization"""
     
+    # Cholesky factors keyed by covariance digest, shared across instances
+    _cho_cache: "OrderedDict[bytes, Tuple[np.ndarray, bool]]" = OrderedDict()
+    _cho_cache_size = 32
+    # Optimizations run concurrently in asyncio worker threads
+    _cho_cache_lock = threading.Lock()
+    
     def optimize(
         self,
         symbols: List[str],
@@ -53,38 +63,43 @@ class MarkowitzOptimizer:
         # Initial guess: equal weights
         x0 = np.array([1 / n_assets] * n_assets)
         
-        # Objective function
         if target_return is not None:
             # Minimize risk for target return
-            constraints.append({
-                "type": "eq",
-                "fun": lambda x: np.dot(x, expected_returns) - target_return,
-            })
-            objective = lambda x: np.sqrt(np.dot(x.T, np.dot(cov_matrix, x)))
-        
-        elif target_risk is not None:
-            # Maximize return for target risk
-            def objective(x):
-                portfolio_risk = np.sqrt(np.dot(x.T, np.dot(cov_matrix, x)))
-                return -np.dot(x, expected_returns) + 1000 * abs(portfolio_risk - target_risk)
-        
+            optimal_weights = self._min_variance_weights(
+                expected_returns,
+                cov_matrix,
+                target_return,
+                x0,
+            )
+        elif target_risk is None and (
+            tangency := self._tangency_weights(expected_returns, cov_matrix, risk_free_rate)
+        ) is not None:
+            # Closed-form max-Sharpe portfolio, already long-only
+            optimal_weights = tangency
         else:
-            # Maximize Sharpe ratio
-            def objective(x):
-                port_return = np.dot(x, expected_returns)
-                port_risk = np.sqrt(np.dot(x.T, np.dot(cov_matrix, x)))
-                return -(port_return - risk_free_rate) / port_risk if port_risk > 0 else 0
-        
-        # Optimize
-        result = minimize(
-            objective,
-            x0,
-            method="SLSQP",
-            bounds=bounds,
-            constraints=constraints,
-        )
-        
-        optimal_weights = result.x
+            # Objective function
+            if target_risk is not None:
+                # Maximize return for target risk
+                def objective(x):
+                    portfolio_risk = np.sqrt(np.dot(x.T, np.dot(cov_matrix, x)))
+                    return -np.dot(x, expected_returns) + 1000 * abs(portfolio_risk - target_risk)
+            
+            else:
+                # Maximize Sharpe ratio
+                def objective(x):
+                    port_return = np.dot(x, expected_returns)
+                    port_risk = np.sqrt(np.dot(x.T, np.dot(cov_matrix, x)))
+                    return -(port_return - risk_free_rate) / port_risk if port_risk > 0 else 0
+            
+            # Optimize
+            result = minimize(
+                objective,
+                x0,
+                method="SLSQP",
+                bounds=bounds,
+                constraints=constraints,
+            )
+            optimal_weights = result.x
         
         # Calculate portfolio metrics
         port_return = np.dot(optimal_weights, expected_returns)
@@ -117,21 +132,115 @@ class MarkowitzOptimizer:
         max_return = np.max(expected_returns)
         target_returns = np.linspace(min_return, max_return, n_points)
         
+        # Each point warm-starts from the previous one, which is already
+        # close to the next optimum along the frontier
+        weights = np.full(len(expected_returns), 1 / len(expected_returns))
+        
         for target in target_returns:
             try:
-                result = self.optimize(
-                    symbols=[f"asset_{i}" for i in range(len(expected_returns))],
-                    expected_returns=expected_returns,
-                    cov_matrix=cov_matrix,
-                    target_return=target,
-                    risk_free_rate=risk_free_rate,
+                weights = self._min_variance_weights(
+                    expected_returns,
+                    cov_matrix,
+                    target,
+                    weights,
                 )
                 frontier.append({
-                    "return": result["expected_return"],
-                    "risk": result["expected_risk"],
+                    "return": float(np.dot(weights, expected_returns)),
+                    "risk": float(np.sqrt(weights @ cov_matrix @ weights)),
                 })
             except Exception:
                 pass
         
         return frontier
+    
+    @classmethod
+    def _cholesky(cls, cov_matrix: np.ndarray) -> Tuple[np.ndarray, bool]:
+        """Cholesky factor of the covariance matrix, LRU-cached by content"""
+        key = hashlib.blake2b(
+            np.ascontiguousarray(cov_matrix, dtype=np.float64).tobytes(),
+            digest_size=16,
+        ).digest()
+        
+        with cls._cho_cache_lock:
+            factor = cls._cho_cache.get(key)
+            if factor is not None:
+                cls._cho_cache.move_to_end(key)
+                return factor
+        
+        # Factor outside the lock; a concurrent miss on the same matrix just
+        # computes the same factor twice
+        factor = cho_factor(cov_matrix)
+        with cls._cho_cache_lock:
+            cls._cho_cache[key] = factor
+            if len(cls._cho_cache) > cls._cho_cache_size:
+                cls._cho_cache.popitem(last=False)
+        return factor
+    
+    @classmethod
+    def _tangency_weights(
+        cls,
+        expected_returns: np.ndarray,
+        cov_matrix: np.ndarray,
+        risk_free_rate: float,
+    ) -> Optional[np.ndarray]:
+        """
+        Analytic max-Sharpe weights w ∝ Σ⁻¹(μ - rf)
+        
+        This is the unconstrained optimum; when it is already long-only it
+        is also the optimum of the bounded problem. Returns None when the
+        closed form does not apply and the numerical solver is needed.
+        """
+        try:
+            x = cho_solve(cls._cholesky(cov_matrix), expected_returns - risk_free_rate)
+        except np.linalg.LinAlgError:
+            return None
+        
+        total = x.sum()
+        if total <= 0:
+            return None
+        
+        weights = x / total
+        if np.any(weights < 0):
+            return None
+        return weights
+    
+    @staticmethod
+    def _min_variance_weights(
+        expected_returns: np.ndarray,
+        cov_matrix: np.ndarray,
+        target_return: float,
+        x0: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Long-only minimum-variance weights for a target return
+        
+        Minimizes variance rather than volatility (same argmin, smooth
+        objective) and supplies analytic gradients, so SLSQP needs no
+        finite-difference evaluations.
+        """
+        n_assets = len(expected_returns)
+        ones = np.ones(n_assets)
+        
+        constraints = [
+            {
+                "type": "eq",
+                "fun": lambda x: x.sum() - 1,
+                "jac": lambda x: ones,
+            },
+            {
+                "type": "eq",
+                "fun": lambda x: x @ expected_returns - target_return,
+                "jac": lambda x: expected_returns,
+            },
+        ]
+        
+        result = minimize(
+            lambda x: x @ cov_matrix @ x,
+            x0,
+            jac=lambda x: 2 * (cov_matrix @ x),
+            method="SLSQP",
+            bounds=[(0, 1)] * n_assets,
+            constraints=constraints,
+        )
+        return result.x
       
@@ -2,10 +2,14 @@
 Snowball effect (compound growth) simulation
 """
 
-from dataclasses import dataclass
-from typing import Dict, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 import numpy as np
+from numba import njit
+
+MILESTONES = (100_000.0, 500_000.0, 1_000_000.0, 5_000_000.0, 10_000_000.0)
 
 
 @dataclass
@@ -16,7 +20,57 @@ class SnowballResult:
     total_contributions: float
     total_dividends: float
     total_return: float
+    total_return_percent: float
     monthly_data: List[Dict]
+    milestones: List[Dict] = field(default_factory=list)
+
+
+# No fastmath: it may reorder the accumulation, and results must match
+# the plain Python recurrence to the cent
+@njit(cache=True)
+def _simulate(
+    initial_investment: float,
+    monthly_contribution: float,
+    monthly_growth: float,
+    years: int,
+    reinvest_dividends: bool,
+    dividend_yield: float,
+    dividend_growth: float,
+    contribution_growth: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Month-by-month recurrence; returns balance, contributions and dividends"""
+    months = years * 12
+    balance = np.empty(months)
+    contributions = np.empty(months)
+    dividends = np.empty(months)
+    
+    current_balance = initial_investment
+    total_contributions = initial_investment
+    total_dividends = 0.0
+    current_dividend_yield = dividend_yield
+    current_contribution = monthly_contribution
+    
+    for i in range(months):
+        current_balance += current_contribution
+        total_contributions += current_contribution
+        
+        if reinvest_dividends:
+            monthly_dividend = current_balance * (current_dividend_yield / 12)
+            total_dividends += monthly_dividend
+            current_balance += monthly_dividend
+        
+        current_balance *= monthly_growth
+        
+        balance[i] = current_balance
+        contributions[i] = total_contributions
+        dividends[i] = total_dividends
+        
+        # Annual growth adjustments
+        if i % 12 == 11:
+            current_dividend_yield *= 1 + dividend_growth
+            current_contribution *= 1 + contribution_growth
+    
+    return balance, contributions, dividends
 
 
 class SnowballSimulator:
@@ -34,6 +88,7 @@ class SnowballSimulator:
         dividend_yield: float = 0.04,
         dividend_growth: float = 0.05,
         contribution_growth: float = 0.0,
+        include_monthly: bool = True,
     ) -> SnowballResult:
         """
         Calculate snowball effect
@@ -47,55 +102,70 @@ class SnowballSimulator:
             dividend_yield: Starting annual dividend yield
             dividend_growth: Annual dividend growth rate
             contribution_growth: Annual contribution growth rate
+            include_monthly: Whether to build the per-month breakdown
         """
-        balance = initial_investment
-        total_contributions = initial_investment
-        total_dividends = 0
-        monthly_data = []
-        
-        current_dividend_yield = dividend_yield
-        current_contribution = monthly_contribution
+        balance, contributions, dividends = _simulate(
+            float(initial_investment),
+            float(monthly_contribution),
+            (1 + annual_return_rate) ** (1 / 12),
+            years,
+            reinvest_dividends,
+            float(dividend_yield),
+            float(dividend_growth),
+            float(contribution_growth),
+        )
         
-        for year in range(1, years + 1):
-            for month in range(1, 13):
-                # Add contribution
-                balance += current_contribution
-                total_contributions += current_contribution
-                
-                # Calculate and reinvest dividends
-                if reinvest_dividends:
-                    monthly_dividend = balance * (current_dividend_yield / 12)
-                    total_dividends += monthly_dividend
-                    balance += monthly_dividend
-                
-                # Apply monthly return
-                monthly_return = (1 + annual_return_rate) ** (1/12) - 1
-                balance *= (1 + monthly_return)
-                
-                # Record data
-                monthly_data.append({
-                    "year": year,
-                    "month": month,
-                    "balance": round(balance, 2),
-                    "contributions": round(total_contributions, 2),
-                    "dividends": round(total_dividends, 2),
-                })
-            
-            # Annual growth adjustments
-            current_dividend_yield *= (1 + dividend_growth)
-            current_contribution *= (1 + contribution_growth)
+        if balance.size:
+            final_value = float(balance[-1])
+            total_contributions = float(contributions[-1])
+            total_dividends = float(dividends[-1])
+        else:
+            final_value = total_contributions = float(initial_investment)
+            total_dividends = 0.0
+        total_return = final_value - total_contributions
         
-        total_return = balance - total_contributions
+        monthly_data = []
+        if include_monthly:
+            monthly_data = [
+                {
+                    "year": i // 12 + 1,
+                    "month": i % 12 + 1,
+                    "balance": b,
+                    "contributions": c,
+                    "dividends": d,
+                }
+                for i, (b, c, d) in enumerate(zip(
+                    np.round(balance, 2).tolist(),
+                    np.round(contributions, 2).tolist(),
+                    np.round(dividends, 2).tolist(),
+                ))
+            ]
         
         return SnowballResult(
             years=years,
-            final_value=round(balance, 2),
+            final_value=round(final_value, 2),
             total_contributions=round(total_contributions, 2),
             total_dividends=round(total_dividends, 2),
             total_return=round(total_return, 2),
+            total_return_percent=round(total_return / total_contributions * 100, 2)
+            if total_contributions else 0.0,
             monthly_data=monthly_data,
+            milestones=self._milestones(balance),
         )
     
+    @staticmethod
+    def _milestones(balance: np.ndarray) -> List[Dict]:
+        """First month the balance reaches each milestone"""
+        # Running max makes the series sortable even with negative returns
+        reached = np.maximum.accumulate(balance) if balance.size else balance
+        idx = np.searchsorted(reached, MILESTONES)
+        
+        return [
+            {"value": value, "year": int(i) // 12 + 1, "month": int(i) % 12 + 1}
+            for value, i in zip(MILESTONES, idx)
+            if i < balance.size
+        ]
+    
     def compare_scenarios(
         self,
         scenarios: List[Dict],
@@ -112,6 +182,7 @@ class SnowballSimulator:
                 years=years,
                 reinvest_dividends=scenario.get("reinvest", True),
                 dividend_yield=scenario.get("dividend_yield", 0.04),
+                include_monthly=False,
             )
             results.append({
                 "name": scenario.get("name", "Scenario"),
@@ -124,3 +195,30 @@ class SnowballSimulator:
             "years": years,
             "scenarios": results,
         }
+
+
+@lru_cache(maxsize=4096)
+def cached_simulation(
+    initial_investment: float,
+    monthly_contribution: float,
+    annual_return_rate: float,
+    years: int,
+    reinvest_dividends: bool,
+    dividend_yield: float,
+    include_monthly: bool,
+) -> SnowballResult:
+    """
+    Memoized SnowballSimulator.calculate for the default growth assumptions
+    
+    Callers should quantize float inputs so equivalent requests share an
+    entry, and must treat the returned result as read-only.
+    """
+    return SnowballSimulator().calculate(
+        initial_investment=initial_investment,
+        monthly_contribution=monthly_contribution,
+        annual_return_rate=annual_return_rate,
+        years=years,
+        reinvest_dividends=reinvest_dividends,
+        dividend_yield=dividend_yield,
+        include_monthly=include_monthly,
+    )
@@ -4,6 +4,8 @@ Conditional Value at Risk (Expected Shortfall)
 
 import numpy as np
 
+from quant.risk.tail import lower_quantile, tail_mean
+
 
 class CVaRCalculator:
     """
@@ -25,15 +27,10 @@ class CVaRCalculator:
         returns = self._get_returns(portfolio)
         
         # Calculate VaR threshold
-        var_threshold = np.percentile(returns, (1 - confidence_level) * 100)
+        var_threshold = lower_quantile(returns, 1 - confidence_level)
         
         # CVaR is mean of returns beyond VaR
-        tail_returns = returns[returns <= var_threshold]
-        
-        if len(tail_returns) == 0:
-            cvar = var_threshold
-        else:
-            cvar = np.mean(tail_returns)
+        cvar, tail_observations = tail_mean(returns, var_threshold)
         
         portfolio_value = portfolio.total_value or 0
         
@@ -42,7 +39,7 @@ class CVaRCalculator:
             "cvar_percent": abs(cvar) * 100,
             "var_threshold": var_threshold,
             "confidence_level": confidence_level,
-            "tail_observations": len(tail_returns),
+            "tail_observations": tail_observations,
         }
     
     def _get_returns(self, portfolio):
@@ -0,0 +1,48 @@
+"""
+Compiled kernels for tail-risk statistics
+"""
+
+import numpy as np
+from numba import njit
+
+
+def lower_quantile(returns: np.ndarray, alpha: float) -> float:
+    """
+    Lower-tail quantile with np.percentile's linear interpolation
+
+    Uses a partial sort (np.partition), which is O(N) instead of the
+    O(N log N) full sort behind np.percentile.
+    """
+    n = returns.size
+    position = alpha * (n - 1)
+    k = int(position)
+    if k >= n - 1:
+        return float(returns.max())
+    
+    lower, upper = np.partition(returns, (k, k + 1))[k:k + 2]
+    return float(lower + (upper - lower) * (position - k))
+
+
+@njit(cache=True, fastmath=True)
+def tail_mean(returns: np.ndarray, threshold: float):
+    """Mean and count of returns at or below the threshold, in one pass"""
+    total = 0.0
+    count = 0
+    for r in returns:
+        if r <= threshold:
+            total += r
+            count += 1
+    if count == 0:
+        return threshold, 0
+    return total / count, count
+
+
+# Serial and nogil rather than parallel=True: this runs in asyncio worker
+# threads, and numba's workqueue layer aborts on concurrent parallel calls
+@njit(cache=True, nogil=True)
+def simulate_paths(mean: float, std: float, n_paths: int) -> np.ndarray:
+    """Draw simulated one-period returns"""
+    out = np.empty(n_paths)
+    for i in range(n_paths):
+        out[i] = np.random.normal(mean, std)
+    return out
@@ -7,6 +7,8 @@ from typing import Dict
 import numpy as np
 from scipy import stats
 
+from quant.risk.tail import lower_quantile, simulate_paths
+
 
 class VaRCalculator:
     """
@@ -63,7 +65,7 @@ class VaRCalculator:
     
     def _historical_var(self, returns: np.ndarray, confidence: float) -> float:
         """Historical simulation VaR"""
-        return np.percentile(returns, (1 - confidence) * 100)
+        return lower_quantile(returns, 1 - confidence)
     
     def _parametric_var(self, returns: np.ndarray, confidence: float) -> float:
         """Parametric (variance-covariance) VaR"""
@@ -82,5 +84,5 @@ class VaRCalculator:
         mean = np.mean(returns)
         std = np.std(returns)
         
-        simulated = np.random.normal(mean, std, simulations)
-        return np.percentile(simulated, (1 - confidence) * 100)
+        simulated = simulate_paths(mean, std, simulations)
+        return lower_quantile(simulated, 1 - confidence)
@@ -2,10 +2,22 @@
 Connection management for WebSocket
 """
 
-from typing import Dict, Set
+import asyncio
+from typing import Dict, Iterable, Optional, Set
 
+import structlog
 from fastapi import WebSocket
 
+from infrastructure.cache.redis_client import RedisCache
+from websocket.serializers import send_message, serialize_message
+
+logger = structlog.get_logger()
+
+CHANNEL_PREFIX = "ws:"
+# Backoff bounds (seconds) for re-subscribing after a Redis failure
+PUBSUB_RETRY_MIN = 0.5
+PUBSUB_RETRY_MAX = 30.0
+
 
 class ConnectionManager:
     """
@@ -21,10 +33,16 @@ class ConnectionManager:
         
         # websocket -> user_id
         self.websocket_users: Dict[WebSocket, str] = {}
+        
+        # every socket accepted by this worker
+        self.active_connections: Set[WebSocket] = set()
+        
+        self._pubsub_task: Optional[asyncio.Task] = None
     
     async def connect(self, websocket: WebSocket, user_id: str = None):
         """Register new connection"""
         await websocket.accept()
+        self.active_connections.add(websocket)
         
         if user_id:
             self.user_connections[user_id] = websocket
@@ -32,6 +50,7 @@ class ConnectionManager:
     
     def disconnect(self, websocket: WebSocket):
         """Remove connection"""
+        self.active_connections.discard(websocket)
         user_id = self.websocket_users.pop(websocket, None)
         if user_id:
             self.user_connections.pop(user_id, None)
@@ -57,10 +76,11 @@ class ConnectionManager:
             return
         
         disconnected = []
+        payload = serialize_message(message)
         
         for websocket in self.rooms[room]:
             try:
-                await websocket.send_json(message)
+                await websocket.send_text(payload)
             except Exception:
                 disconnected.append(websocket)
         
@@ -68,10 +88,95 @@ class ConnectionManager:
         for ws in disconnected:
             self.disconnect(ws)
     
+    async def broadcast(self, message: dict, channel: str = "all", symbol: Optional[str] = None):
+        """
+        Publish message to every worker via Redis
+        
+        Each worker's pub/sub loop delivers it to its own sockets: "all"
+        reaches every connection, any other channel (or symbol) a room.
+        """
+        await RedisCache().publish(f"{CHANNEL_PREFIX}{symbol or channel}", serialize_message(message))
+    
+    def start_pubsub(self) -> None:
+        """Start relaying published broadcasts to local sockets"""
+        if self._pubsub_task is None or self._pubsub_task.done():
+            self._pubsub_task = asyncio.create_task(self._pubsub_loop())
+    
+    async def stop_pubsub(self) -> None:
+        """Stop the broadcast relay"""
+        if self._pubsub_task is not None:
+            self._pubsub_task.cancel()
+            try:
+                await self._pubsub_task
+            except asyncio.CancelledError:
+                pass
+            self._pubsub_task = None
+    
+    async def _pubsub_loop(self) -> None:
+        """
+        Dispatch broadcasts from Redis to this worker's connections
+        
+        Lost subscriptions (Redis restart, connection reset) are logged and
+        re-established with capped exponential backoff.
+        """
+        delay = PUBSUB_RETRY_MIN
+        while True:
+            pubsub = None
+            try:
+                pubsub = await RedisCache().pubsub()
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                delay = PUBSUB_RETRY_MIN
+                
+                async for message in pubsub.listen():
+                    if message["type"] != "pmessage":
+                        continue
+                    
+                    channel = message["channel"][len(CHANNEL_PREFIX):]
+                    if channel == "all":
+                        targets = self.active_connections
+                    else:
+                        targets = self.rooms.get(channel, ())
+                    
+                    try:
+                        await self._send_local(targets, message["data"])
+                    except Exception as e:
+                        logger.error("Broadcast dispatch failed", channel=channel, error=str(e))
+                
+                logger.warning("Broadcast subscription ended", retry_in=delay)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error("Broadcast subscription failed", error=str(e), retry_in=delay)
+            finally:
+                if pubsub is not None:
+                    try:
+                        await pubsub.close()
+                    except Exception:
+                        pass
+            
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUBSUB_RETRY_MAX)
+    
+    async def _send_local(self, websockets: Iterable[WebSocket], payload: str) -> None:
+        """Send an already-serialized payload to sockets concurrently"""
+        targets = list(websockets)
+        if not targets:
+            return
+        
+        results = await asyncio.gather(
+            *(ws.send_text(payload) for ws in targets),
+            return_exceptions=True,
+        )
+        
+        # Cleanup
+        for ws, result in zip(targets, results):
+            if isinstance(result, Exception):
+                self.disconnect(ws)
+    
     async def send_to_user(self, user_id: str, message: dict):
         """Send message to specific user"""
         if user_id in self.user_connections:
             try:
-                await self.user_connections[user_id].send_json(message)
+                await send_message(self.user_connections[user_id], message)
             except Exception:
                 self.disconnect(self.user_connections[user_id])
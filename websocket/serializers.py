@@ -2,35 +2,65 @@
 Message serializers
 """
 
-import json
-from datetime import datetime
 from decimal import Decimal
-from typing import Any
-from uuid import UUID
-
-
-class WebSocketJSONEncoder(json.JSONEncoder):
-    """
-    Custom JSON encoder for WebSocket messages
-    """
-    
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, Decimal):
-            return float(obj)
-        elif isinstance(obj, UUID):
-            return str(obj)
-        elif isinstance(obj, bytes):
-            return obj.decode("utf-8")
-        return super().default(obj)
+from typing import Any, List, Optional, Union
+
+import msgspec
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+
+# datetimes and UUIDs are native to orjson; numpy covers quant payloads
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class Subscribe(msgspec.Struct, tag_field="action", tag="subscribe"):
+    """Client request to receive updates for symbols"""
+    symbols: List[str] = []
+
+
+class Unsubscribe(msgspec.Struct, tag_field="action", tag="unsubscribe"):
+    """Client request to stop updates for symbols"""
+    symbols: List[str] = []
+
+
+class Ping(msgspec.Struct, tag_field="action", tag="ping"):
+    """Client keepalive"""
+    timestamp: Optional[Any] = None
+
+
+ClientMessage = Union[Subscribe, Unsubscribe, Ping]
+
+# Decodes straight into the structs above, no intermediate dict
+client_message_decoder = msgspec.json.Decoder(ClientMessage)
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for types orjson does not serialize natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    elif isinstance(obj, bytes):
+        return obj.decode("utf-8")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def serialize_message(message: dict) -> str:
     """Serialize message to JSON string"""
-    return json.dumps(message, cls=WebSocketJSONEncoder)
+    return orjson.dumps(message, default=_default, option=ORJSON_OPTIONS).decode()
 
 
 def deserialize_message(data: str) -> dict:
     """Deserialize JSON string to dict"""
-    return json.loads(data)
+    return orjson.loads(data)
+
+
+async def receive_raw(websocket: WebSocket) -> Union[str, bytes]:
+    """Receive the next text or binary frame without decoding it"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000))
+    return message.get("text") or message.get("bytes") or b""
+
+
+async def send_message(websocket: WebSocket, message: dict) -> None:
+    """Send message as a JSON text frame"""
+    await websocket.send_text(serialize_message(message))